@@ -0,0 +1,84 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+
+import store
+
+# ==========================================
+# 💾 [분석 캐시] AI 1분 요약 / 심층 리포트 공유 캐시
+# ==========================================
+# 💡 같은 기사를 같은 페르소나·프롬프트로 분석한 결과는 세션/사용자와 무관하게 재사용합니다.
+#    키 = 기사 id + 종류(basic/deep) + 페르소나 해시 + 프롬프트 해시 + 리포트 옵션
+#    오래된 항목은 TTL로, 개수 초과분은 마지막 사용 시각(LRU) 순으로 정리합니다.
+CACHE_TTL_DAYS = 7
+CACHE_MAX_ENTRIES = 500
+KIND_BASIC = "basic"
+KIND_DEEP = "deep"
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    key TEXT PRIMARY KEY,
+    article_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    last_used TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_analysis_cache_last_used ON analysis_cache (last_used);
+"""
+
+_initialized = False
+
+def _connect():
+    global _initialized
+    conn = store.connect()
+    if not _initialized:
+        conn.executescript(CACHE_SCHEMA)
+        _initialized = True
+    return conn
+
+def _hash(text):
+    return hashlib.md5(str(text or "").encode("utf-8")).hexdigest()[:12]
+
+def cache_key(article_id, kind, persona, prompt, option=""):
+    return f"{article_id}:{kind}:{_hash(persona)}:{_hash(prompt)}:{option}"
+
+def get(key):
+    """유효한 캐시가 있으면 값을 돌려주고 마지막 사용 시각을 갱신합니다. 없거나 만료되면 None."""
+    now = datetime.now()
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT value, created_at FROM analysis_cache WHERE key = ?", (key,)).fetchone()
+        if not row: return None
+        if datetime.fromisoformat(row[1]) < now - timedelta(days=CACHE_TTL_DAYS):
+            with conn: conn.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+            return None
+        with conn: conn.execute("UPDATE analysis_cache SET last_used = ?, hits = hits + 1 WHERE key = ?", (now.isoformat(), key))
+        return json.loads(row[0])
+    finally:
+        conn.close()
+
+def put(key, article_id, kind, value):
+    now = datetime.now()
+    conn = _connect()
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, article_id, kind, value, created_at, last_used, hits) VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, article_id, kind, json.dumps(value, ensure_ascii=False), now.isoformat(), now.isoformat()),
+            )
+            conn.execute("DELETE FROM analysis_cache WHERE created_at < ?", ((now - timedelta(days=CACHE_TTL_DAYS)).isoformat(),))
+            conn.execute(
+                "DELETE FROM analysis_cache WHERE key IN (SELECT key FROM analysis_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (CACHE_MAX_ENTRIES,),
+            )
+    finally:
+        conn.close()
+
+def invalidate(key):
+    conn = _connect()
+    try:
+        with conn: conn.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+    finally:
+        conn.close()
@@ -1,22 +1,32 @@
+import startup   # 💡 콜드 스타트 측정 기준 시각 — 다른 import보다 먼저
 import streamlit as st
 import streamlit.components.v1 as components
-import feedparser
-from google import genai
-from google.genai import types
-from bs4 import BeautifulSoup
 import json
 import os
 import re
 from datetime import datetime, timedelta
 import time
-from deep_translator import GoogleTranslator
 import hashlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
-from collections import Counter
 
 # 프롬프트 외부 연동
-from prompts import GEMS_PERSONA, DEFAULT_FILTER_PROMPT
+from prompts import GEMS_PERSONA, DEFAULT_FILTER_PROMPT, DEFAULT_AI_PROMPT
+import buzz
+import analysis_cache
+import board
+import channels
+import dedup
+import llm
+import records
+import rerank
+import stats
+import store
+import thumbs
+import trends
+# 💡 읽기 전용 보드 화면에 필요 없는 무거운 스택은 처음 쓰는 곳에서 import 합니다.
+#    google.genai → get_ai_client / llm, deep_translator → safe_translate, feedparser·bs4·requests → feeds (수동 센싱)
+startup.mark("imports")
 
 # ==========================================
 # 📋 [유틸] 클립보드 복사 함수 (JS Injection)
@@ -54,6 +64,7 @@ SPINNER_SVG = """
 CHANNELS_FILE = "channels.json"
 MANUAL_CACHE_FILE = "manual_cache.json"
 PREF_FILE = "learned_preferences.json"
+RELATED_DAYS = 90   # 심층 리포트 참고 기사 검색 기간
 
 def load_channels_from_file():
     if os.path.exists(CHANNELS_FILE):
@@ -81,10 +92,10 @@ def save_prefs(prefs):
 def load_user_settings(user_id):
     fn = f"nod_samsung_user_{user_id}.json"
     default_settings = {
-        "api_key": "", "sensing_period": 14, "max_articles": 50, "filter_weight": 50,
-        "top_picks_count": 6, "top_picks_global_ratio": 70,
+        "api_key": "", "sensing_period": 14, "max_articles": board.DEFAULT_MAX_ARTICLES, "filter_weight": board.DEFAULT_MIN_SCORE,
+        "top_picks_count": board.DEFAULT_TOP_PICKS, "top_picks_global_ratio": board.DEFAULT_GLOBAL_RATIO,
         "filter_prompt": DEFAULT_FILTER_PROMPT,
-        "ai_prompt": "위 기사를 우리 팀의 'NOD 프로젝트' 관점에서 심층 분석해줘.",
+        "ai_prompt": DEFAULT_AI_PROMPT,
         "gems_persona": GEMS_PERSONA, 
         "category_active": {"Global Innovation": True, "China & East Asia": True, "Japan & Robotics": True}
     }
@@ -105,22 +116,44 @@ def save_user_settings(user_id, settings):
 # ==========================================
 def get_ai_client(api_key):
     if not api_key or len(api_key.strip()) < 10: return None
+    from google import genai
     try: return genai.Client(api_key=api_key.strip())
     except: return None
 
 @st.cache_data(ttl=3600)
 def safe_translate(text):
     if not text: return ""
+    from deep_translator import GoogleTranslator
     try: return GoogleTranslator(source='auto', target='ko').translate(text)
     except: return text
 
+def render_slide(s, i, item):
+    sc1, sc2 = st.columns([1.2, 2])
+    with sc1:
+        # 💡 첫 장은 기사 썸네일, 나머지는 참고 기사 중 로컬 썸네일이 있는 것을 쓰고 AI 생성 이미지는 마지막 수단으로만 부릅니다.
+        img_url = thumbs.thumb_url(item, 800) if i == 0 and (item.get('thumbnail') or item.get('thumb_file') or thumbs.local_file(item['id'])) else None
+        if not img_url: img_url = next(filter(None, (thumbs.url_for_link(r.get('url')) for r in s.get('refs', []))), None)
+        if not img_url:
+            kw = s.get('image_keyword', 'technology').replace(" ", "%20")
+            img_url = f"https://image.pollinations.ai/prompt/{kw}?width=800&height=500&nologo=true"
+        st.markdown(f'<div style="border-radius:12px; overflow:hidden; border:1px solid #eee;"><img src="{img_url}" style="width:100%; display:block;"></div>', unsafe_allow_html=True)
+    with sc2:
+        st.markdown(f"<h3 style='margin-top:0; color:#0F172A;'>{s.get('title', '')}</h3>", unsafe_allow_html=True)
+        for bullet in s.get('content', []):
+            st.markdown(f"- <span style='font-size:1.05rem; line-height:1.6;'>{bullet}</span>", unsafe_allow_html=True)
+        refs = s.get('refs', [])
+        if refs:
+            st.markdown("<hr style='margin: 15px 0;'>", unsafe_allow_html=True)
+            st.markdown("**[Reference]**")
+            for r in refs: st.markdown(f"- [{r.get('title', 'Link')}]({r.get('url', '#')})")
+
 @st.dialog("🤖 NGEPT 전략 분석 모달", width="large")
-def show_analysis_modal(item, api_key, persona, base_prompt, raw_news_pool):
+def show_analysis_modal(item, api_key, persona, base_prompt, pool_name):
     tab1, tab2 = st.tabs(["📝 기사 1분 요약", "📊 심층 발표 리포트"])
     with tab1:
         c1, c2 = st.columns([1, 2])
         with c1:
-            img_src = item.get('thumbnail') if item.get('thumbnail') else f"https://s.wordpress.com/mshots/v1/{item['link']}?w=600"
+            img_src = thumbs.thumb_url(item, 600)
             html_content = (
                 '<div style="border-radius: 12px; overflow: hidden; border: 1px solid #eaeaea; background: #fdfdfd;">'
                 f'<img src="{img_src}" style="width:100%; aspect-ratio:16/9; object-fit:cover; display:block; border-bottom: 1px solid #eaeaea;">'
@@ -133,108 +166,125 @@ def show_analysis_modal(item, api_key, persona, base_prompt, raw_news_pool):
             )
             st.markdown(html_content, unsafe_allow_html=True)
         with c2:
-            if not api_key:
+            # 💡 같은 기사 + 같은 페르소나/프롬프트 결과는 공유 캐시에서 바로 꺼냅니다. (팀 전체가 같은 MUST KNOW를 열어도 1회만 호출)
+            basic_key = analysis_cache.cache_key(item['id'], analysis_cache.KIND_BASIC, persona, base_prompt)
+            if f"basic_{basic_key}" not in st.session_state:
+                # 모닝 배치가 기본 페르소나/질문으로 미리 만들어 둔 분석이 있고 키가 같으면 그대로 사용
+                preset = item.get('preset_analysis') or {}
+                use_preset = preset.get('key') == basic_key and not st.session_state.get(f"skip_preset_{basic_key}")
+                cached = preset.get('text') if use_preset else analysis_cache.get(basic_key)
+                if cached: st.session_state[f"basic_{basic_key}"] = cached
+            if f"basic_{basic_key}" not in st.session_state and not api_key:
                 st.error("⚠️ 사이드바에 API Key가 없습니다.")
             else:
-                if f"basic_{item['id']}" not in st.session_state:
-                    with st.spinner("💎 핵심 시그널과 기획 아이디어를 도출 중입니다..."):
-                        client = get_ai_client(api_key)
-                        if client:
-                            try:
-                                config = types.GenerateContentConfig(system_instruction=persona)
-                                analysis_prompt = f"{base_prompt}\n\n[기사 정보]\n제목: {item['title_en']}\n요약: {item['summary_en']}\n**[출력 지침]**\n1. 리포트가 길어지면 안 됩니다. 각 항목은 '2~3줄 이내의 짧은 Bullet Point'로 요약하세요.\n2. 'Implication (기획자 참고 아이디어)' 항목을 마지막에 추가하여 구체적이고 참신한 아이디어를 제안해 주세요."
-                                response = client.models.generate_content(model="gemini-2.5-flash", contents=analysis_prompt, config=config)
-                                st.session_state[f"basic_{item['id']}"] = response.text
-                            except Exception as e:
-                                st.session_state[f"basic_{item['id']}"] = f"🚨 분석 중 오류가 발생했습니다: {e}"
-                if f"basic_{item['id']}" in st.session_state:
-                    st.markdown(st.session_state[f"basic_{item['id']}"])
+                streamed = False
+                if f"basic_{basic_key}" not in st.session_state:
+                    # 💡 응답을 다 기다리지 않고 토큰이 도착하는 대로 바로 화면에 흘려 씁니다.
+                    client = get_ai_client(api_key)
+                    if client:
+                        try:
+                            config = llm.text_config(persona)
+                            analysis_prompt = llm.analysis_prompt(base_prompt, item)
+                            text = st.write_stream(llm.stream_text(client, analysis_prompt, config))
+                            streamed = True
+                            st.session_state[f"basic_{basic_key}"] = text
+                            if text: analysis_cache.put(basic_key, item['id'], analysis_cache.KIND_BASIC, text)
+                        except Exception as e:
+                            st.session_state[f"basic_{basic_key}"] = f"🚨 분석 중 오류가 발생했습니다: {e}"
+                if f"basic_{basic_key}" in st.session_state:
+                    if not streamed: st.markdown(st.session_state[f"basic_{basic_key}"])
+                    if st.button("🔄 다시 분석", key=f"regen_basic_{item['id']}", type="tertiary"):
+                        analysis_cache.invalidate(basic_key)
+                        del st.session_state[f"basic_{basic_key}"]
+                        st.session_state[f"skip_preset_{basic_key}"] = True
+                        st.rerun(scope="fragment")   # 다이얼로그만 다시 그림 (앱 전체 rerun은 다이얼로그를 닫음)
 
     with tab2:
-        if f"deep_report_{item['id']}" not in st.session_state:
+        # 💡 세션 키도 공유 캐시처럼 페르소나/프롬프트별로 나눠, 페르소나를 바꾸면 이전 리포트가 보이지 않게 합니다.
+        report_scope = analysis_cache.cache_key(item['id'], analysis_cache.KIND_DEEP, persona, base_prompt)
+        report_slot, report_key_slot = f"deep_report_{report_scope}", f"deep_report_key_{report_scope}"
+        if report_slot not in st.session_state:
             st.markdown("#### 📑 연관 동향 기반 발표 슬라이드 생성")
             st.markdown("<p style='font-size:0.9rem; color:#64748B; margin-bottom:20px;'>해당 기사를 중심으로 유사한 뉴스 트렌드를 엮어 4장짜리 발표용 초안을 자동 생성합니다.</p>", unsafe_allow_html=True)
             opt = st.radio("수집 및 분석 방식 선택", ["🗂️ 옵션 A. 내부 수집 풀 매칭 (신속/정확)", "🌐 옵션 B. 구글 검색 및 웹 트렌드 확장 (방대한 시야)"], key=f"opt_{item['id']}")
-            if st.button("🚀 심층 리포트 생성 (약 15초 소요)", use_container_width=True, type="primary"):
-                with st.spinner("AI가 연관 트렌드를 분석하여 슬라이드 장표를 기획하고 있습니다..."):
-                    client = get_ai_client(api_key)
-                    if client:
-                        try:
-                            report_prompt = f"당신은 IT/테크 차세대 경험기획팀의 수석 전략가입니다.\n아래 [메인 기사]를 중심으로, 연관된 트렌드를 엮어 '발표용 슬라이드 4장' 분량의 인사이트 리포트를 작성해주세요.\n\n[메인 기사]\n제목: {item['title_en']}\n요약: {item['summary_en']}\n"
-                            if "내부" in opt:
-                                pool_context = "\n".join([f"- {n['title_en']} (URL: {n['link']})" for n in raw_news_pool[:15]])
-                                report_prompt += f"\n\n[연관 기사 풀 (참고용)]\n{pool_context}\n위 기사들을 적극 참고하여 시장 동향을 보강하세요."
-                            else:
-                                report_prompt += "\n\n당신의 방대한 웹 트렌드 지식을 총동원하여 연관 최신 동향과 경쟁사 상황을 엮어주세요."
-
-                            report_prompt += """
-                            \n[출력 형식 - 반드시 아래 JSON 구조로만 출력하세요]
-                            { "slides": [ { "slide_num": 1, "title": "Executive Summary (이슈 요약)", "image_keyword": "tech innovation conceptual", "content": ["핵심 메시지 1", "핵심 메시지 2"], "refs": [{"title": "출처명", "url": "URL 주소"}] }, { "slide_num": 2, "title": "Market & Competitor Trend (시장 동향)", "image_keyword": "market graph analysis", "content": ["...", "..."], "refs": [] }, { "slide_num": 3, "title": "User Experience Impact (사용자 경험 파급력)", "image_keyword": "user experience UI UX futuristic", "content": ["...", "..."], "refs": [] }, { "slide_num": 4, "title": "Strategic Implication (우리의 넥스트 스텝)", "image_keyword": "strategy roadmap", "content": ["...", "..."], "refs": [] } ] }
-                            """
-                            config = types.GenerateContentConfig(system_instruction=persona, response_mime_type="application/json")
-                            response = client.models.generate_content(model="gemini-2.5-flash", contents=report_prompt, config=config)
-                            
-                            json_match = re.search(r'\{.*\}', response.text.strip(), re.DOTALL)
-                            if json_match:
-                                parsed_data = json.loads(json_match.group())
-                                st.session_state[f"deep_report_{item['id']}"] = parsed_data.get("slides", [])
-                                st.rerun()
-                            else:
-                                st.error("JSON 파싱에 실패했습니다. 다시 시도해주세요.")
-                        except Exception as e:
-                            st.error(f"리포트 생성 중 오류: {e}")
-        else:
-            slides = st.session_state[f"deep_report_{item['id']}"]
+            # 💡 내부 풀 옵션은 참고 기사 풀에 따라 결과가 달라지므로 풀 이름까지 키에 넣습니다.
+            deep_key = analysis_cache.cache_key(item['id'], analysis_cache.KIND_DEEP, persona, base_prompt, f"internal:{pool_name}" if "내부" in opt else "web")
+            cached = analysis_cache.get(deep_key)
+            if cached:
+                # 💡 rerun하면 다이얼로그가 닫히므로, 캐시된 리포트는 세션에 넣고 아래 렌더링 분기로 바로 넘어갑니다.
+                st.session_state[report_slot] = cached
+                st.session_state[report_key_slot] = deep_key
+            elif st.button("🚀 심층 리포트 생성 (완성된 장표부터 바로 표시)", use_container_width=True, type="primary"):
+                client = get_ai_client(api_key)
+                if client:
+                    try:
+                        report_prompt = f"당신은 IT/테크 차세대 경험기획팀의 수석 전략가입니다.\n아래 [메인 기사]를 중심으로, 연관된 트렌드를 엮어 '발표용 슬라이드 4장' 분량의 인사이트 리포트를 작성해주세요.\n\n[메인 기사]\n제목: {item['title_en']}\n요약: {item['summary_en']}\n"
+                        if "내부" in opt:
+                            # 💡 점수 상위 15건 대신, 현재 풀 + 아카이브 색인에서 이 기사와 관련 깊은 기사만 골라 넣습니다.
+                            store.sync_search_from_archive()
+                            related = store.related(item, k=8, since=(datetime.now() - timedelta(days=RELATED_DAYS)).strftime("%Y-%m-%d"))
+                            pool_context = "\n".join([f"- [{n['day']} · {n.get('source', '')}] {n['title_en']} / {n.get('insight_title', '')} (URL: {n['link']})" for n in related]) or "- (관련 기사 없음)"
+                            report_prompt += f"\n\n[연관 기사 풀 (참고용)]\n{pool_context}\n위 기사들을 적극 참고하여 시장 동향을 보강하세요."
+                        else:
+                            report_prompt += "\n\n당신의 방대한 웹 트렌드 지식을 총동원하여 연관 최신 동향과 경쟁사 상황을 엮어주세요."
+
+                        report_prompt += """
+                        \n[출력 형식 - 반드시 아래 JSON 구조로만 출력하세요]
+                        { "slides": [ { "slide_num": 1, "title": "Executive Summary (이슈 요약)", "image_keyword": "tech innovation conceptual", "content": ["핵심 메시지 1", "핵심 메시지 2"], "refs": [{"title": "출처명", "url": "URL 주소"}] }, { "slide_num": 2, "title": "Market & Competitor Trend (시장 동향)", "image_keyword": "market graph analysis", "content": ["...", "..."], "refs": [] }, { "slide_num": 3, "title": "User Experience Impact (사용자 경험 파급력)", "image_keyword": "user experience UI UX futuristic", "content": ["...", "..."], "refs": [] }, { "slide_num": 4, "title": "Strategic Implication (우리의 넥스트 스텝)", "image_keyword": "strategy roadmap", "content": ["...", "..."], "refs": [] } ] }
+                        """
+                        # 💡 스트리밍 응답에서 슬라이드 JSON 객체가 하나 닫힐 때마다 스키마 검증 후 바로 그려 줍니다.
+                        progress = st.empty()
+                        progress.info("🧠 AI가 연관 트렌드를 분석하여 첫 장표를 기획하고 있습니다...")
+                        slides = []
+                        for slide in llm.stream_json_items(client, report_prompt, llm.SLIDES_SCHEMA, llm.validate_slide, "slides", persona):
+                            slides.append(slide)
+                            progress.info(f"📝 슬라이드 {len(slides)} / 4 작성 완료 · 다음 장표 생성 중...")
+                            with st.container(border=True):
+                                render_slide(slide, len(slides) - 1, item)
+
+                        if slides:
+                            st.session_state[report_slot] = slides
+                            st.session_state[report_key_slot] = deep_key
+                            analysis_cache.put(deep_key, item['id'], analysis_cache.KIND_DEEP, slides)
+                            st.rerun(scope="fragment")   # 다이얼로그만 다시 그림 (앱 전체 rerun은 다이얼로그를 닫음)
+                        else:
+                            progress.empty()
+                            st.error("JSON 파싱에 실패했습니다. 다시 시도해주세요.")
+                    except Exception as e:
+                        st.error(f"리포트 생성 중 오류: {e}")
+        if report_slot in st.session_state:
+            slides = st.session_state[report_slot]
             slide_titles = [f"Slide {s['slide_num']}. {s['title'].split('(')[0].strip()}" for s in slides]
             slide_tabs = st.tabs(slide_titles)
             for i, s in enumerate(slides):
                 with slide_tabs[i]:
-                    sc1, sc2 = st.columns([1.2, 2])
-                    with sc1:
-                        if i == 0 and item.get('thumbnail'): img_url = item.get('thumbnail')
-                        else:
-                            kw = s.get('image_keyword', 'technology').replace(" ", "%20")
-                            img_url = f"https://image.pollinations.ai/prompt/{kw}?width=800&height=500&nologo=true"
-                        st.markdown(f'<div style="border-radius:12px; overflow:hidden; border:1px solid #eee;"><img src="{img_url}" style="width:100%; display:block;"></div>', unsafe_allow_html=True)
-                    with sc2:
-                        st.markdown(f"<h3 style='margin-top:0; color:#0F172A;'>{s['title']}</h3>", unsafe_allow_html=True)
-                        for bullet in s.get('content', []):
-                            st.markdown(f"- <span style='font-size:1.05rem; line-height:1.6;'>{bullet}</span>", unsafe_allow_html=True)
-                        refs = s.get('refs', [])
-                        if refs:
-                            st.markdown("<hr style='margin: 15px 0;'>", unsafe_allow_html=True)
-                            st.markdown("**[Reference]**")
-                            for r in refs: st.markdown(f"- [{r.get('title', 'Link')}]({r.get('url', '#')})")
+                    render_slide(s, i, item)
             st.markdown("<br>", unsafe_allow_html=True)
             if st.button("🔄 리포트 새로 생성하기", key=f"regen_{item['id']}", use_container_width=True):
-                del st.session_state[f"deep_report_{item['id']}"]
-                st.rerun()
+                del st.session_state[report_slot]
+                analysis_cache.invalidate(st.session_state.pop(report_key_slot, ""))
+                st.rerun(scope="fragment")   # 다이얼로그만 다시 그림 (앱 전체 rerun은 다이얼로그를 닫음)
 
 @st.dialog("📊 데이터 수집 & AI 큐레이션 통계", width="large")
-def show_statistics_modal(raw_pool, f_weight):
-    if not raw_pool:
+def show_statistics_modal(pool_stats, f_weight):
+    # 💡 파이프라인이 저장 시점에 갱신해 둔 통계만 읽습니다. (기사 풀을 다시 훑지 않음)
+    if not pool_stats or not pool_stats.get("total"):
         st.info("현재 수집된 데이터가 없습니다.")
         return
         
-    total_articles = len(raw_pool)
-    sources = len(set(n.get("source", "Unknown") for n in raw_pool))
+    total_articles = pool_stats["total"]
+    sources = len(pool_stats["sources"])
     
-    global_cnt = sum(1 for n in raw_pool if n.get("category") == "Global Innovation")
-    china_cnt = sum(1 for n in raw_pool if n.get("category") == "China & East Asia")
-    japan_cnt = sum(1 for n in raw_pool if n.get("category") == "Japan & Robotics")
+    global_cnt = pool_stats["categories"].get("Global Innovation", 0)
+    china_cnt = pool_stats["categories"].get("China & East Asia", 0)
+    japan_cnt = pool_stats["categories"].get("Japan & Robotics", 0)
     
-    filtered_cnt = sum(1 for n in raw_pool if n.get("score", 0) >= f_weight)
+    filtered_cnt = stats.count_at_least(pool_stats, f_weight)
     
-    all_buzz = []
-    for n in raw_pool:
-        if n.get("community_buzz"):
-            all_buzz.extend(n.get("buzz_words", []))
-    unique_buzz = set(all_buzz)
+    unique_buzz = stats.top(pool_stats["buzz_words"], n=None)
     
-    s90 = sum(1 for n in raw_pool if n.get("score", 0) >= 90)
-    s70 = sum(1 for n in raw_pool if 70 <= n.get("score", 0) < 90)
-    s50 = sum(1 for n in raw_pool if 50 <= n.get("score", 0) < 70)
-    s_under = sum(1 for n in raw_pool if n.get("score", 0) < 50)
+    score_ranges = stats.buckets(pool_stats)
+    s90, s70, s50, s_under = score_ranges["90-100"], score_ranges["70-89"], score_ranges["50-69"], score_ranges["0-49"]
     
     st.markdown("#### 📡 파이프라인 수집 요약")
     c1, c2, c3 = st.columns(3)
@@ -256,7 +306,9 @@ def show_statistics_modal(raw_pool, f_weight):
     
     st.markdown("#### 💬 커뮤니티 소셜 리스닝 (버즈 분석)")
     if unique_buzz:
-        st.info(f"긱(Geek) 커뮤니티 게시글들을 딥 스캐닝하여 **{len(unique_buzz)}개의 핫 키워드**를 추출했습니다.\n이 키워드가 포함된 기사는 AI 가중치(화제성 점수)를 추가로 받았습니다.\n\n**🔥 주요 추출 키워드:** {', '.join(list(unique_buzz)[:15])} 등")
+        st.info(f"긱(Geek) 커뮤니티 게시글들을 딥 스캐닝하여 **{len(unique_buzz)}개의 핫 키워드**를 추출했습니다.\n이 키워드가 포함된 기사는 AI 가중치(화제성 점수)를 추가로 받았습니다.\n\n**🔥 주요 추출 키워드:** {', '.join(unique_buzz[:15])} 등\n\n버즈 가산점을 받은 기사: **{pool_stats['buzz_articles']}개** ({pool_stats['buzz_articles'] * 100 // total_articles}%)")
+        top_kws = stats.top(pool_stats["keywords"], 15)
+        if top_kws: st.caption("🏷️ 기사 키워드 Top 15: " + ", ".join(f"{k} ({pool_stats['keywords'][k]})" for k in top_kws))
     else:
         st.info("현재 반영된 커뮤니티 핫 키워드가 없습니다.")
 
@@ -279,9 +331,17 @@ def manage_channels_modal(cat):
         new_url = col_u.text_input("RSS URL", key=f"new_url_{cat}")
         if col_b.button("추가", key=f"add_btn_{cat}", use_container_width=True):
             if new_name and new_url:
-                st.session_state.channels[cat].append({"name": new_name, "url": new_url, "active": True})
-                save_channels_to_file(st.session_state.channels)
-                st.rerun()
+                # 💡 추가 전에 레지스트리 검증(URL 형식/중복)을 통과하는지 먼저 확인합니다.
+                candidate = {c: list(feed_list) for c, feed_list in st.session_state.channels.items()}
+                candidate[cat].append({"name": new_name, "url": new_url.strip(), "active": True})
+                existing = set(channels.validate(st.session_state.channels))
+                errors = [e for e in channels.validate(candidate) if e not in existing]
+                if errors:
+                    st.error(f"🚨 {errors[0]}")
+                else:
+                    st.session_state.channels = candidate
+                    save_channels_to_file(st.session_state.channels)
+                    st.rerun()
     st.divider()
     for idx, f in enumerate(st.session_state.channels[cat]):
         c1, c2 = st.columns([5, 1])
@@ -337,6 +397,35 @@ def persona_prompt_dialog():
         time.sleep(0.5)
         st.rerun()
 
+def apply_rule_change(old_rules, new_rules):
+    """규칙 추가/삭제를 저장된 풀(모닝/수동)에 즉시 반영: 로컬 재정렬 + 매칭이 바뀐 기사만 재채점 대기열에 추가."""
+    t0 = time.time()
+    adjusted, queued = 0, 0
+    for pool in (store.POOL_DAILY, store.POOL_MANUAL):
+        items = store.query_articles(pool)
+        if not items: continue
+        before = {i['id']: i.get('score', 0) for i in items}
+        changed = rerank.rerank(items, old_rules, new_rules)
+        store.upsert_articles(items, pool)
+        queue = set(store.load_rescore_queue(pool)) | set(changed)
+        store.save_rescore_queue(pool, queue)
+        adjusted += sum(1 for i in items if i.get('score', 0) != before[i['id']])
+        queued += len(queue)
+    st.session_state.rerank_result = (adjusted, queued, time.time() - t0)
+
+def rescore_queued(api_key, filter_prompt):
+    client = get_ai_client(api_key)
+    if not client: return 0
+    prompt = rerank.rules_prompt(filter_prompt, st.session_state.learned_prefs)
+    done = 0
+    for pool in (store.POOL_DAILY, store.POOL_MANUAL):
+        items = store.get_articles(pool, store.load_rescore_queue(pool))
+        if not items: continue
+        done += rerank.rescore(client, items, prompt)
+        store.upsert_articles(items, pool)
+        store.save_rescore_queue(pool, [])
+    return done
+
 @st.dialog("✨ 선호 기사 학습 (AI 튜닝)", width="large")
 def learning_dialog(api_key):
     st.markdown("### 🎯 내 취향을 AI에게 학습시키기")
@@ -345,14 +434,18 @@ def learning_dialog(api_key):
     
     def delete_rule_cb(idx):
         if 0 <= idx < len(st.session_state.learned_prefs):
+            old_rules = list(st.session_state.learned_prefs)
             st.session_state.learned_prefs.pop(idx)
             save_prefs(st.session_state.learned_prefs)
+            apply_rule_change(old_rules, st.session_state.learned_prefs)
 
     def add_rule_cb():
         val = st.session_state.custom_rule_input.strip()
         if val and val not in st.session_state.learned_prefs:
+            old_rules = list(st.session_state.learned_prefs)
             st.session_state.learned_prefs.append(val)
             save_prefs(st.session_state.learned_prefs)
+            apply_rule_change(old_rules, st.session_state.learned_prefs)
             st.session_state.custom_rule_input = "" 
             st.session_state.show_rule_success = True
     
@@ -360,6 +453,16 @@ def learning_dialog(api_key):
     
     with c1:
         st.markdown("#### 📚 적용된 학습 규칙")
+        # 💡 규칙 변경은 저장된 기사 풀에 즉시 로컬 반영되고, 매칭이 바뀐 기사만 AI 재채점 대기열에 쌓입니다.
+        if st.session_state.get("rerank_result"):
+            adjusted, queued, elapsed = st.session_state.rerank_result
+            st.caption(f"⚡ 규칙 반영 완료: 점수 조정 {adjusted}건 ({elapsed * 1000:.0f}ms)")
+            if queued:
+                if st.button(f"🔁 매칭이 바뀐 {queued}건만 AI 재채점", use_container_width=True):
+                    with st.spinner("변경된 기사만 다시 채점 중입니다..."):
+                        rescore_queued(api_key, st.session_state.settings.get("filter_prompt", DEFAULT_FILTER_PROMPT))
+                    st.session_state.rerank_result = None
+                    st.rerun()
         if not st.session_state.learned_prefs:
             st.info("현재 적용된 맞춤형 학습 규칙이 없습니다.")
         else:
@@ -402,91 +505,56 @@ def learning_dialog(api_key):
 # ==========================================
 # 📡 [수집 및 AI 필터링 엔진]
 # ==========================================
-def fetch_raw_news(args):
-    cat, f, limit, max_per_feed = args 
-    articles = []
-    try:
-        d = feedparser.parse(f["url"])
-        if not d.entries: return []
-        for entry in d.entries[:max_per_feed]: 
-            dt = entry.get('published_parsed') or entry.get('updated_parsed')
-            if not dt: continue
-            p_date = datetime.fromtimestamp(time.mktime(dt))
-            if p_date < limit: continue
-            
-            thumbnail = ""
-            if 'media_content' in entry and len(entry.media_content) > 0: thumbnail = entry.media_content[0].get('url', '')
-            elif 'media_thumbnail' in entry and len(entry.media_thumbnail) > 0: thumbnail = entry.media_thumbnail[0].get('url', '')
-            if not thumbnail:
-                html_content = ""
-                if hasattr(entry, 'content') and isinstance(entry.content, list): html_content += entry.content[0].get('value', '')
-                if hasattr(entry, 'summary'): html_content += entry.summary
-                if html_content:
-                    soup = BeautifulSoup(html_content, "html.parser")
-                    img_tag = soup.find('img')
-                    if img_tag and img_tag.get('src'): thumbnail = img_tag.get('src')
-
-            articles.append({
-                "id": hashlib.md5(entry.link.encode()).hexdigest()[:12], 
-                "title_en": entry.title, 
-                "link": entry.link, 
-                "source": f["name"],
-                "category": cat, 
-                "date_obj": p_date.isoformat(), 
-                "date": p_date.strftime("%Y.%m.%d"),
-                "summary_en": BeautifulSoup(entry.get("summary", ""), "html.parser").get_text()[:300], 
-                "thumbnail": thumbnail
-            })
-    except Exception as e:
-        pass
-    return articles
-
 def get_filtered_news(settings, channels_data, _prompt, pb_ui=None, st_text_ui=None, is_batch_mode=False):
     active_key = settings.get("api_key", "").strip()
     if not active_key: return []
     limit = datetime.now() - timedelta(days=settings["sensing_period"])
     
     max_per_feed = 40 if is_batch_mode else 15
-    active_tasks = [(cat, f, limit, max_per_feed) for cat, feeds in channels_data.items() if settings["category_active"].get(cat, True) for f in feeds if f.get("active", True)]
+    registry = channels.registry(channels_data)
+    active_tasks = [(ch, limit, max_per_feed) for ch in registry["channels"] if ch["active"] and settings["category_active"].get(ch["category"], True)]
     if not active_tasks: return []
 
-    all_raw_items = []
     total_feeds = len(active_tasks)
     
     if st_text_ui and pb_ui:
         st_text_ui.markdown(f"<div style='text-align:center; padding:10px;'><h3 style='color:#1E293B;'>{SPINNER_SVG} 전 세계 매체에서 최신 뉴스를 수집 중입니다...</h3><p style='font-size:1.1rem; color:#64748B;'>(0 / {total_feeds} 채널 확인 완료)</p></div>", unsafe_allow_html=True)
         pb_ui.progress(0)
 
-    with ThreadPoolExecutor(max_workers=40) as executor:
-        futures = [executor.submit(fetch_raw_news, t) for t in active_tasks]
-        for i, f in enumerate(as_completed(futures)):
-            all_raw_items.extend(f.result())
-            if st_text_ui and pb_ui:
-                st_text_ui.markdown(f"<div style='text-align:center; padding:10px;'><h3 style='color:#1E293B;'>{SPINNER_SVG} 전 세계 매체에서 최신 뉴스를 수집 중입니다...</h3><p style='font-size:1.1rem; color:#64748B;'>({i+1} / {total_feeds} 채널 확인 완료)</p></div>", unsafe_allow_html=True)
-                pb_ui.progress((i + 1) / total_feeds)
+    def on_fetched(done, total):
+        if st_text_ui and pb_ui:
+            st_text_ui.markdown(f"<div style='text-align:center; padding:10px;'><h3 style='color:#1E293B;'>{SPINNER_SVG} 전 세계 매체에서 최신 뉴스를 수집 중입니다...</h3><p style='font-size:1.1rem; color:#64748B;'>({done} / {total} 채널 확인 완료)</p></div>", unsafe_allow_html=True)
+            pb_ui.progress(done / total)
+
+    # 💡 다운로드는 스레드 40개, XML/HTML 파싱은 코어 수만큼의 프로세스 풀에서 (feeds.collect)
+    import feeds
+    all_raw_items = feeds.collect(active_tasks, fetch_workers=40, on_progress=on_fetched)
             
-    community_domains = ['reddit', 'v2ex', 'hacker news', 'ycombinator', 'clien', 'dcinside', 'blind']
+    # 💡 뉴스/커뮤니티 구분은 채널 레지스트리에 미리 계산된 유형을 channel_id로 조회합니다.
     raw_news = []
     raw_community = []
     
     for item in all_raw_items:
-        url_lower = item['link'].lower()
-        source_lower = item['source'].lower()
-        if any(domain in url_lower or domain in source_lower for domain in community_domains):
+        if registry["by_id"][item['channel_id']]["type"] == 'community':
             raw_community.append(item)
         else:
             raw_news.append(item)
             
     if is_batch_mode:
         fetch_limit = int(settings.get("max_articles", 50) * 3.0) 
-        comm_limit = 80 
     else:
         fetch_limit = int(settings.get("max_articles", 50) * 1.3) 
-        comm_limit = 40
         
+    # 💡 정규화 URL 기준 중복 제거 후, 근접 중복(신디케이션) 기사는 대표 1건만 AI 채점에 보냅니다.
+    raw_news = dedup.dedup_by_url(sorted(raw_news, key=lambda x: x['date_obj'], reverse=True))
+    raw_news, members_by_rep = dedup.split_representatives(raw_news)
     raw_news = sorted(raw_news, key=lambda x: x['date_obj'], reverse=True)[:fetch_limit]
-    raw_community = sorted(raw_community, key=lambda x: x['date_obj'], reverse=True)[:comm_limit]
-    combined_raw = raw_news + raw_community
+    # 💡 채점 대상으로 남은 기사만 경량 레코드(records.Article)에서 일반 dict로 풀어 줍니다.
+    raw_news = records.to_dicts(raw_news)
+    members_by_rep = {n['id']: records.to_dicts(members_by_rep[n['id']]) for n in raw_news if n['id'] in members_by_rep}
+    # 💡 커뮤니티 글은 LLM 채점 없이 전부 로컬 버즈 엔진으로만 집계합니다. (수 ms, 누락 없음)
+    raw_community = dedup.dedup_by_url(raw_community)
+    combined_raw = raw_news
     
     client = get_ai_client(active_key)
     if not client or not _prompt: return []
@@ -500,95 +568,72 @@ def get_filtered_news(settings, channels_data, _prompt, pb_ui=None, st_text_ui=N
         pb_ui.progress(0)
 
     learned_rules = load_prefs()
-    if learned_rules:
-        rules_text = "\n".join([f"- {r}" for r in learned_rules])
-        _prompt += f"\n\n[🚨 최우선 가중치 (팀장님 선호 학습 규칙)]\n아래 규칙에 부합하는 기사는 반드시 높은 가산점(80점 이상)을 부여하여 핵심 이슈로 선정하세요:\n{rules_text}"
+    _prompt = rerank.rules_prompt(_prompt, learned_rules)
 
     current_ctx = get_script_run_ctx()
-    processed_items = []
-    
-    def ai_scoring_worker(item):
+    progress = {"done": 0}
+
+    def on_scored(item, parsed):
+        progress["done"] += 1
+        if st_text_ui and pb_ui:
+            html_msg = f"<div style='text-align:center; padding:10px;'><h3 style='color:#1E293B;'>{SPINNER_SVG} AI가 기사 내용과 커뮤니티 버즈를 분석 중입니다...</h3><p style='font-size:1.1rem; color:#64748B;'>({progress['done']} / {total_items} 분석 완료)</p></div>"
+            st_text_ui.markdown(html_msg, unsafe_allow_html=True)
+            pb_ui.progress(progress["done"] / total_items)
+
+    # 💡 스키마 고정 출력 + 검증. 검증 실패 기사만 모아 재시도하고, 끝내 실패하면 50점 대신 0점 + score_failed로 둡니다.
+    results, failed = llm.score_with_retry_queue(client, _prompt, combined_raw, on_result=on_scored)
+
+    def finish(item):
         add_script_run_ctx(ctx=current_ctx)
-        try:
-            import random
-            time.sleep(random.uniform(0.1, 0.8))
-            score_query = f"{_prompt}\n\n[평가 대상]\n매체(출처): {item['source']}\n링크: {item['link']}\n제목: {item['title_en']}\n요약: {item['summary_en'][:200]}"
-            response = client.models.generate_content(model="gemini-2.5-flash", contents=score_query)
-            
-            json_match = re.search(r'\{.*\}', response.text.strip(), re.DOTALL)
-            if json_match:
-                parsed_data = json.loads(json_match.group())
-                url_lower = item['link'].lower()
-                source_lower = item['source'].lower()
-                community_domains = ['reddit', 'v2ex', 'hacker news', 'ycombinator', 'clien', 'dcinside', 'blind']
-                
-                if any(domain in url_lower or domain in source_lower for domain in community_domains):
-                    item['content_type'] = 'community'
-                else:
-                    item['content_type'] = parsed_data.get('content_type', 'news')
-                
-                item['score'] = int(parsed_data.get('score', 0)) if item['content_type'] == 'news' else 0
-                item['insight_title'] = parsed_data.get('insight_title') or safe_translate(item['title_en'])
-                item['core_summary'] = parsed_data.get('core_summary') or safe_translate(item['summary_en'])
-                item['keywords'] = parsed_data.get('keywords', [])
-            else: raise ValueError("JSON Not Found")
-        except:
-            item['content_type'] = 'news'
-            item['score'] = 50 
+        parsed = results.get(item['id'])
+        # 💡 커뮤니티 채널 글은 위에서 이미 분리되어 여기엔 뉴스 채널 기사만 옵니다.
+        item['content_type'] = parsed['content_type'] if parsed else 'news'
+        if parsed:
+            item['score'] = llm.final_score(parsed['score'], item) if item['content_type'] == 'news' else 0
+            item['insight_title'] = parsed['insight_title']
+            item['core_summary'] = parsed['core_summary']
+            item['keywords'] = parsed['keywords']
+        else:
+            item['score'] = 0
+            item['score_failed'] = True
             item['insight_title'] = safe_translate(item['title_en'])
             item['core_summary'] = safe_translate(item['summary_en'])
             item['keywords'] = []
         return item
 
     with ThreadPoolExecutor(max_workers=5) as executor:
-        for i, future in enumerate(as_completed({executor.submit(ai_scoring_worker, item): item for item in combined_raw})):
-            if st_text_ui and pb_ui:
-                html_msg = f"<div style='text-align:center; padding:10px;'><h3 style='color:#1E293B;'>{SPINNER_SVG} AI가 기사 내용과 커뮤니티 버즈를 분석 중입니다...</h3><p style='font-size:1.1rem; color:#64748B;'>({i+1} / {total_items} 분석 완료)</p></div>"
-                st_text_ui.markdown(html_msg, unsafe_allow_html=True)
-                pb_ui.progress((i + 1) / total_items)
-            processed_items.append(future.result())
-
-    news_pool = []
-    community_pool = []
-    for item in processed_items:
-        if item.get('content_type') == 'community': community_pool.append(item)
-        else: news_pool.append(item)
-
-    community_keywords = []
-    for cp in community_pool:
-        kws = cp.get('keywords', [])
-        if isinstance(kws, list): community_keywords.extend([str(k).upper() for k in kws])
-            
-    # 💡 [하이브리드 융합] 모닝 센싱이 뽑아둔 커뮤니티 핫 키워드 파일(morning_buzz.json)을 읽어와서 병합합니다!
-    comm_kw_counts = Counter(community_keywords)
-    hot_comm_keywords = set([k for k, v in comm_kw_counts.items() if v >= 1])
-    
-    try:
-        if os.path.exists("morning_buzz.json"):
-            with open("morning_buzz.json", "r", encoding="utf-8") as bf:
-                buzz_data = json.load(bf)
-                saved_kws = buzz_data.get("keywords", [])
-                hot_comm_keywords.update(saved_kws) # 아침에 뽑아둔 버즈 키워드 합치기!
-    except: pass
-    for news in news_pool:
-        news_kws = set([str(k).upper() for k in news.get('keywords', [])])
-        overlap = news_kws.intersection(hot_comm_keywords)
-        if overlap:
-            news['score'] = min(100, news['score'] + (len(overlap) * 5))
-            news['community_buzz'] = True
-            news['buzz_words'] = list(overlap)
-        else:
-            news['community_buzz'] = False
+        processed_items = list(executor.map(finish, combined_raw))
+    if failed: print(f"⚠️ 재시도 후에도 채점 실패 {len(failed)}건 (0점 처리)")
+    processed_items = dedup.propagate_scores(processed_items, members_by_rep)
+
+    news_pool = [item for item in processed_items if item.get('content_type') != 'community']
+
+    # 💡 [하이브리드 융합] 모닝 센싱이 뽑아둔 버즈 가중치(morning_buzz.json)와 지금 수집한 커뮤니티 글의 로컬 버즈를 병합합니다!
+    morning_buzz = buzz.load_buzz()
+    live_weights, _ = buzz.compute_buzz(raw_community, previous=morning_buzz)
+    buzz_weights = buzz.buzz_weights(morning_buzz)
+    for k, w in live_weights.items(): buzz_weights[k] = max(w, buzz_weights.get(k, 0.0))
+    buzz.fuse(news_pool, buzz_weights)
+    rerank.tag_rule_hits(news_pool, learned_rules)
 
     news_pool = sorted(news_pool, key=lambda x: x.get('score', 0), reverse=True)
+    dedup.assign_clusters(news_pool)
     return news_pool
 
+# 💡 [뷰모델 캐시] (풀 데이터 버전, 화면 설정)이 같으면 섹션 분할과 카드 HTML을 다시 만들지 않습니다.
+#    hour_key는 카드의 '발행 N시간 이내' 문구가 낡지 않도록 1시간마다 캐시를 갈아주는 용도입니다.
+@st.cache_data(show_spinner=False, max_entries=32)
+def load_board_view(pool_name, board_version, f_weight, max_articles, total_picks, global_ratio, has_prefs, hour_key):
+    news_list = store.query_articles(pool_name, min_score=f_weight, limit=max_articles)
+    return board.build_view(news_list, total_picks, global_ratio, has_prefs)
+
 # ==========================================
 # 🖥️ [UI] 메인 화면 및 CSS
 # ==========================================
 st.set_page_config(page_title="NGEPT Sensing Dashboard", layout="wide")
 
-st.markdown("""<style>
+# 💡 스타일 블록은 프로세스당 한 번만 조립해 두고 rerun 때는 같은 문자열을 그대로 내보냅니다.
+APP_CSS = """
     body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; }
     [data-testid="stSidebar"] { background-color: #F8FAFC !important; border-right: 1px solid #E2E8F0; }
     .sidebar-label { color: #64748B; font-size: 0.75rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.08em; margin-top: 1.5rem; margin-bottom: 0.75rem; padding-left: 5px; }
@@ -608,37 +653,13 @@ st.markdown("""<style>
     [data-testid="stRadio"] > div[role="radiogroup"] label p { color: #64748B !important; font-weight: 600 !important; font-size: 0.9rem !important; margin: 0 !important; padding: 0 !important; }
     [data-testid="stRadio"] > div[role="radiogroup"] label[data-checked="true"] p, [data-testid="stRadio"] > div[role="radiogroup"] label[aria-checked="true"] p, [data-testid="stRadio"] > div[role="radiogroup"] label:has(input:checked) p { color: #FFFFFF !important; font-weight: 800 !important; }
     .stTextInput>div>div>input { border-radius: 10px; }
-    
-    .hero-banner { background: linear-gradient(135deg, #fdfbfb 0%, #ebedee 100%); padding: 1.2rem 2rem; border-radius: 12px; text-align: center; margin-bottom: 0.5rem; box-shadow: 0 4px 15px rgba(0,0,0,0.03); border: 1px solid #eaeaea; position: relative; }
-    .hero-badge { display: inline-block; background: #2c3e50; color: white; padding: 3px 10px; border-radius: 20px; font-size: 0.75rem; font-weight: bold; margin-bottom: 6px; letter-spacing: 1px; }
-    .hero-h1 { margin: 0; font-size: 2.1rem; font-weight: 900; background: linear-gradient(45deg, #1A2980 0%, #26D0CE 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; }
-    .hero-subtitle { margin-top: 5px; font-size: 1rem; color: #64748B; font-weight: 600; letter-spacing: -0.5px; margin-bottom: 0; }
-    
-    .hero-img-box { position: relative; border-radius: 8px; overflow: hidden; aspect-ratio: 4/3; margin-bottom: 5px; }
-    .hero-bg { position: absolute; top: 0; left: 0; width: 100%; height: 100%; object-fit: cover; z-index: 1; }
-    .hero-overlay { position: absolute; top: 0; left: 0; width: 100%; height: 100%; background: linear-gradient(to bottom, rgba(0,0,0,0.1) 0%, rgba(0,0,0,0.85) 100%); z-index: 2; }
-    .hero-content { position: absolute; bottom: 0; left: 0; width: 100%; padding: 15px; z-index: 3; color: white; }
-    
-    /* 💡 Feature 2: 5차원 추천 이유 오버레이 CSS */
-    .reason-icon { position: absolute; top: 12px; right: 12px; z-index: 15; background: rgba(255, 255, 255, 0.2); color: white; border-radius: 50%; width: 28px; height: 28px; display: flex; justify-content: center; align-items: center; font-size: 13px; cursor: help; backdrop-filter: blur(4px); border: 1px solid rgba(255,255,255,0.4); }
-    .reason-icon:hover { background: rgba(0, 114, 255, 0.8); }
-    .reason-overlay { position: absolute; top: 0; left: 0; width: 100%; height: 100%; background: rgba(15, 23, 42, 0.9); backdrop-filter: blur(5px); z-index: 14; opacity: 0; visibility: hidden; transition: all 0.3s ease; display: flex; flex-direction: column; justify-content: center; padding: 25px; box-sizing: border-box; text-align: left; }
-    .reason-icon:hover + .reason-overlay, .reason-overlay:hover { opacity: 1; visibility: visible; }
-    .reason-title { font-size: 0.95rem; font-weight: 800; color: #38BDF8; margin-bottom: 15px; }
-    .reason-text { font-size: 0.85rem; color: #E2E8F0; line-height: 1.5; margin-bottom: 6px; }
-    .reason-highlight { color: #BAE6FD; font-weight: 700; background: rgba(56, 189, 248, 0.15); padding: 1px 5px; border-radius: 4px; }
-    
-    .badge { display: inline-block; padding: 4px 10px; border-radius: 12px; font-size: 0.75rem; font-weight: 700; margin-bottom: 8px; margin-right: 6px; }
-    .badge-fire { background: #e74c3c; color: white; }
-    .badge-score { background: #34495e; color: white; }
-    .badge-global { background: #9b59b6; color: white; }
-    .badge-china { background: #e67e22; color: white; }
-    .badge-buzz { background: #f39c12; color: white; }
-    .badge-tag { background: #ecf0f1; color: #333; font-weight: 600; padding: 4px 12px; border-radius: 20px; font-size: 0.8rem; margin-right: 8px; display: inline-block; margin-bottom: 8px;}
-    .hero-title { font-size: 1.15rem; font-weight: 800; line-height: 1.3; margin-bottom: 8px; text-shadow: 0 1px 3px rgba(0,0,0,0.5); }
-    .section-header { font-size: 1.4rem; font-weight: 700; margin: 15px 0 10px 0; display: flex; align-items: center; gap: 10px; border-bottom: 2px solid #f0f0f0; padding-bottom: 8px; }
-    .section-desc { font-size: 1rem; color: #888; font-weight: normal; margin-left: 5px; }
-</style>""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def page_style():
+    return "<style>" + APP_CSS + board.CARD_CSS + "</style>"
+
+st.markdown(page_style(), unsafe_allow_html=True)
 
 if "channels" not in st.session_state: st.session_state.channels = load_channels_from_file()
 if "learned_prefs" not in st.session_state: st.session_state.learned_prefs = load_prefs()
@@ -731,7 +752,11 @@ with st.sidebar:
         if st.button("✨ 선호 기사 학습 (AI 튜닝)", type="primary", use_container_width=True):
             learning_dialog(st.session_state.settings.get("api_key", "").strip())
 
-    save_user_settings(st.session_state.current_user, st.session_state.settings)
+    # 💡 설정 파일은 위젯 값이 실제로 바뀐 rerun에서만 다시 씁니다.
+    settings_snapshot = (st.session_state.current_user, json.dumps(st.session_state.settings, sort_keys=True, ensure_ascii=False))
+    if st.session_state.get("saved_settings") != settings_snapshot:
+        save_user_settings(st.session_state.current_user, st.session_state.settings)
+        st.session_state.saved_settings = settings_snapshot
 
     st.markdown("<div class='sidebar-label'>Actions</div>", unsafe_allow_html=True)
     if st.button("🚀 실시간 수동 센싱 시작", use_container_width=True, type="primary"):
@@ -743,13 +768,7 @@ with st.sidebar:
 # ==========================================
 # 4. 메인 컨텐츠 영역
 # ==========================================
-st.markdown("""
-<div class="hero-banner">
-    <div class="hero-badge">AI-POWERED CURATION</div>
-    <h1 class="hero-h1">NGEPT Sensing Dashboard</h1>
-    <p class="hero-subtitle">차세대 경험기획팀 데일리 트렌드 분석</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(board.HERO_BANNER_HTML, unsafe_allow_html=True)
 
 if st.session_state.get("run_sensing", False):
     st.session_state.run_sensing = False 
@@ -759,8 +778,8 @@ if st.session_state.get("run_sensing", False):
         st.stop()
         
     has_active_channel = False
-    for cat, feeds in st.session_state.channels.items():
-        if st.session_state.settings["category_active"].get(cat, True) and any(f.get("active", True) for f in feeds):
+    for cat, feed_list in st.session_state.channels.items():
+        if st.session_state.settings["category_active"].get(cat, True) and any(f.get("active", True) for f in feed_list):
             has_active_channel = True; break
             
     if not has_active_channel:
@@ -780,6 +799,10 @@ if st.session_state.get("run_sensing", False):
 
     try:
         with open(MANUAL_CACHE_FILE, "w", encoding="utf-8") as f: json.dump(all_scored_news, f, ensure_ascii=False, indent=4)
+        store.replace_pool(all_scored_news, store.POOL_MANUAL, source_mtime=os.path.getmtime(MANUAL_CACHE_FILE))
+        # 💡 채점 검증에 끝내 실패한 기사는 재채점 대기열에 올려, 학습 창의 '재채점' 버튼으로 다시 돌릴 수 있게 합니다.
+        store.save_rescore_queue(store.POOL_MANUAL, [i['id'] for i in all_scored_news if i.get('score_failed')])
+        store.index_articles(all_scored_news, datetime.now().strftime("%Y-%m-%d"), "manual")
         st.session_state.view_mode = "실시간 수동 센싱"
     except Exception as e:
         st.error(f"🚨 저장 실패: {e}")
@@ -789,14 +812,15 @@ if st.session_state.get("run_sensing", False):
     pb_ui.empty()
     st.rerun()
 
-target_file = MANUAL_CACHE_FILE if st.session_state.get("view_mode", "데일리 모닝 센싱") == "실시간 수동 센싱" else "today_news.json"
-raw_news_pool = []
+is_manual_view = st.session_state.get("view_mode", "데일리 모닝 센싱") == "실시간 수동 센싱"
+target_file = MANUAL_CACHE_FILE if is_manual_view else "today_news.json"
+pool_name = store.POOL_MANUAL if is_manual_view else store.POOL_DAILY
 file_mtime = None
 if os.path.exists(target_file):
     file_mtime = os.path.getmtime(target_file)
-    try:
-        with open(target_file, "r", encoding="utf-8") as f: raw_news_pool = json.load(f)
-    except: pass
+    # 💡 JSON 파일이 바뀐 경우(배치 커밋 등)에만 DB로 1회 반영, 평소에는 인덱스 쿼리만 실행합니다.
+    store.sync_from_json(target_file, pool_name)
+pool_total = store.count_articles(pool_name) if file_mtime else 0
 
 f_weight = st.session_state.settings.get("filter_weight", 50)
 st.markdown("<br>", unsafe_allow_html=True)
@@ -815,26 +839,76 @@ with c_center:
 with c_right:
     st.markdown("<div style='margin-top: 5px;'></div>", unsafe_allow_html=True)
     if st.button("📊 요약 통계", use_container_width=False):
-        show_statistics_modal(raw_news_pool, f_weight)
+        show_statistics_modal(store.load_stats(pool_name) if pool_total else None, f_weight)
+
+# ==========================
+# 📈 키워드 트렌드 (일별 롤업)
+# ==========================
+with st.expander("📈 키워드 트렌드 (일별 롤업 기반 급상승 탐지)", expanded=False):
+    # 💡 아카이브는 하루 한 번 바뀌므로 세션 시작 시 한 번만 롤업을 맞춥니다 (펼치지 않아도 본문이 매 rerun 실행됨).
+    if not st.session_state.get("trends_synced"):
+        trends.sync_rollups_from_archive()
+        st.session_state.trends_synced = True
+    t_col1, t_col2 = st.columns([1, 2])
+    rising = trends.rising_keywords()
+    with t_col1:
+        st.markdown(f"**🚀 급상승 키워드** <span style='font-size:0.75rem; color:#64748B;'>({trends.latest_day() or '-'} 기준, 최근 {trends.TREND_WINDOW}일 대비)</span>", unsafe_allow_html=True)
+        if rising:
+            for r in rising:
+                st.markdown(f"- **{r['keyword']}** · {r['mentions']}건 (평소 {r['baseline']}건, z={r['z']})")
+        else:
+            st.caption("아직 비교할 과거 데이터가 충분하지 않거나 급상승 키워드가 없습니다.")
+    with t_col2:
+        trend_days = st.selectbox("차트 기간", [14, 30, 90, 180], index=1, format_func=lambda d: f"최근 {d}일", key="trend_days")
+        kw_options = trends.top_keywords(limit=40)
+        default_kws = [r["keyword"] for r in rising[:5]] or kw_options[:5]
+        picked = st.multiselect("키워드", kw_options + [k for k in default_kws if k not in kw_options], default=default_kws, key="trend_keywords")
+        series = trends.keyword_series(picked, since=(datetime.now() - timedelta(days=trend_days)).strftime("%Y-%m-%d"))
+        if any(series.values()):
+            import pandas as pd
+            chart_df = pd.DataFrame({k: {day: m for day, m, _ in pts} for k, pts in series.items()}).fillna(0).sort_index()
+            st.line_chart(chart_df)
+
+# ==========================
+# 🔎 아카이브 전문 검색
+# ==========================
+with st.expander("🔎 지난 센싱 기사 검색 (아카이브 + 수동 센싱 전체)", expanded=False):
+    s_col1, s_col2 = st.columns([4, 1])
+    search_query = s_col1.text_input("검색어", placeholder="예: smart ring, 스마트 글래스, Vision Pro", label_visibility="collapsed", key="archive_search_query")
+    search_days = s_col2.selectbox("기간", [7, 30, 60, 180, 365], index=2, format_func=lambda d: f"최근 {d}일", label_visibility="collapsed", key="archive_search_days")
+    if search_query.strip():
+        store.sync_search_from_archive()
+        t_start = time.perf_counter()
+        results = store.search(search_query, since=(datetime.now() - timedelta(days=search_days)).strftime("%Y-%m-%d"), limit=30)
+        elapsed_ms = (time.perf_counter() - t_start) * 1000
+        st.caption(f"'{search_query}' 검색 결과 {len(results)}건 · {elapsed_ms:.1f}ms")
+        for r in results:
+            st.markdown(
+                f"<div style='padding:8px 0; border-bottom:1px solid #F1F5F9;'>"
+                f"<span style='background-color:#E3F2FD; color:#1565C0; padding:2px 8px; border-radius:10px; font-size:0.7rem; font-weight:700;'>MATCH {r.get('score', 0)}%</span> "
+                f"<span style='font-size:0.75rem; color:#64748B;'>{r['day']} · {r.get('source', '')}</span><br>"
+                f"<a href='{r.get('link', '#')}' target='_blank' style='font-weight:700; color:#1E293B; text-decoration:none;'>{r.get('insight_title', r.get('title_en', ''))}</a>"
+                f"<div style='font-size:0.8rem; color:#64748B;'>{r.get('title_en', '')}</div></div>",
+                unsafe_allow_html=True,
+            )
 
-news_list = [n for n in raw_news_pool if n.get("score", 0) >= f_weight]
+max_articles = st.session_state.settings.get("max_articles", 50)
+total_picks = st.session_state.settings.get("top_picks_count", 6)
+global_ratio = st.session_state.settings.get("top_picks_global_ratio", 70) / 100.0
+has_prefs = len(st.session_state.get("learned_prefs", [])) > 0
+board_version = (file_mtime, store.pool_version(pool_name))
+news_count = load_board_view(pool_name, board_version, f_weight, max_articles, total_picks, global_ratio, has_prefs, datetime.now().strftime("%Y%m%d%H"))["count"] if pool_total else 0
 
-if not raw_news_pool:
+if not pool_total:
     if st.session_state.view_mode == "데일리 모닝 센싱":
         st.info("📭 수집된 뉴스가 없습니다.\n\n**데일리 모닝 센싱**은 매일 아침 지정된 시간에 자동으로 실행되어 글로벌 트렌드 뉴스를 수집합니다.")
     else:
         st.info("📭 수집된 뉴스가 없습니다.\n\n좌측 사이드바의 **[🚀 실시간 수동 센싱 시작]** 버튼을 눌러 관심 있는 뉴스를 실시간으로 수집해 보세요.")
-elif not news_list:
+elif not news_count:
     st.warning(f"📭 수집은 완료되었으나, 최소 점수({f_weight}점)를 넘는 기사가 없습니다.")
-    st.info(f"💡 전체 수집된 **총 {len(raw_news_pool)}개 기사**의 점수 분포를 확인하고 좌측 슬라이더를 조절해 보세요.")
+    st.info(f"💡 전체 수집된 **총 {pool_total}개 기사**의 점수 분포를 확인하고 좌측 슬라이더를 조절해 보세요.")
     
-    score_ranges = {"90-100": 0, "70-89": 0, "50-69": 0, "0-49": 0}
-    for n in raw_news_pool:
-        s = n.get("score", 0)
-        if s >= 90: score_ranges["90-100"] += 1
-        elif s >= 70: score_ranges["70-89"] += 1
-        elif s >= 50: score_ranges["50-69"] += 1
-        else: score_ranges["0-49"] += 1
+    score_ranges = stats.buckets(store.load_stats(pool_name))
     
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("🔥 90~100점", f"{score_ranges['90-100']}개")
@@ -843,109 +917,9 @@ elif not news_list:
     col4.metric("🗑️ 0~49점", f"{score_ranges['0-49']}개")
 
 else:
-    news_list = news_list[:st.session_state.settings.get("max_articles", 50)]
-    def get_word_set(text): return set(re.findall(r'\w+', str(text).lower()))
-    global_news_for_clustering = [item for item in news_list if item.get('category') == 'Global Innovation']
-    
-    clusters = []
-    for item in global_news_for_clustering:
-        item_words = get_word_set(item.get('title_en', ''))
-        if not item_words: continue
-        added = False
-        for cluster in clusters:
-            cluster_words = get_word_set(cluster[0].get('title_en', ''))
-            if not cluster_words: continue
-            overlap = len(item_words.intersection(cluster_words))
-            min_len = min(len(item_words), len(cluster_words))
-            if min_len > 0 and overlap / min_len >= 0.4:
-                cluster.append(item); added = True; break
-        if not added: clusters.append([item])
-
-    clusters.sort(key=lambda x: (len(x), max([a.get('score', 0) for a in x])), reverse=True)
-
-    must_know_items = []
-    used_ids = set()
-    for cluster in clusters[:3]:
-        best_item = max(cluster, key=lambda x: x.get('score', 0))
-        best_item['dup_count'] = len(cluster)
-        must_know_items.append(best_item)
-        for a in cluster: used_ids.add(a['id'])
-
-    remaining_news = [a for a in news_list if a['id'] not in used_ids]
-    total_picks = st.session_state.settings.get("top_picks_count", 6)
-    global_ratio = st.session_state.settings.get("top_picks_global_ratio", 70) / 100.0
-    global_target = int(total_picks * global_ratio)
-    china_target = total_picks - global_target
-
-    global_picks = [a for a in remaining_news if a['category'] == 'Global Innovation'][:global_target]
-    china_picks = [a for a in remaining_news if a['category'] == 'China & East Asia'][:china_target]
-    top_picks = global_picks + china_picks
-    for a in top_picks: used_ids.add(a['id'])
-
-    if len(top_picks) < total_picks:
-        pool = [a for a in remaining_news if a['id'] not in used_ids]
-        pool.sort(key=lambda x: x.get('score', 0), reverse=True)
-        fillers = pool[:total_picks - len(top_picks)]
-        top_picks += fillers
-        for a in fillers: used_ids.add(a['id'])
-
-    stream_news = [a for a in remaining_news if a['id'] not in used_ids]
-
-    # 💡 [핵심 연동] 5차원 다면적 데이터 기반 Hero 카드 추천 이유 생성기
-    def get_reason_text(item):
-        reasons = []
-        
-        # 1. 🧠 학습된 취향(RLHF) 및 AI 스코어링
-        score = item.get("score", 0)
-        has_prefs = len(st.session_state.get("learned_prefs", [])) > 0
-        if score >= 85 and has_prefs:
-            reasons.append(f"<div class='reason-text'>✔️ <b>맞춤형 타겟팅:</b> 팀장님이 지시하신 <span class='reason-highlight'>선호 기사 학습 규칙</span>에 정확히 부합하여 최고점({score}점)이 부여되었습니다.</div>")
-        elif score >= 90:
-            reasons.append(f"<div class='reason-text'>✔️ <b>핵심 트렌드:</b> AI 매칭 점수 <span class='reason-highlight'>{score}점</span>으로 NGEPT 전략에 매우 강하게 연결됩니다.</div>")
-        else:
-            reasons.append(f"<div class='reason-text'>✔️ <b>주요 동향:</b> AI 매칭 점수 <span class='reason-highlight'>{score}점</span>을 획득하여 유효한 큐레이션으로 선정되었습니다.</div>")
-            
-        # 2. ⚡ 정보의 최신성 (Velocity)
-        try:
-            date_str = item.get("date_obj", "")
-            if date_str:
-                pub_date = datetime.fromisoformat(date_str.replace("Z", "+00:00")).replace(tzinfo=None)
-                hours_diff = (datetime.now() - pub_date).total_seconds() / 3600
-                if 0 <= hours_diff <= 24:
-                    reasons.append(f"<div class='reason-text'>✔️ <b>최신 속보:</b> 발행된 지 <span class='reason-highlight'>{max(1, int(hours_diff))}시간 이내</span>의 따끈따끈한 최신 업계 동향입니다.</div>")
-        except: pass
-        
-        # 3. 🏢 매체의 권위 (Source Authority)
-        tier1_sources = ['techcrunch', 'verge', 'wired', 'bloomberg', 'cnbc', 'wsj', 'reuters', 'engadget', 'nikkei', 'gizmodo']
-        source_lower = item.get("source", "unknown").lower()
-        if any(t in source_lower for t in tier1_sources):
-            reasons.append(f"<div class='reason-text'>✔️ <b>매체 권위:</b> 글로벌 IT 트렌드를 선도하는 <span class='reason-highlight'>Tier 1 매체({item.get('source')})</span>에서 다룬 심도 있는 기사입니다.</div>")
-        elif item.get("content_type") == "community":
-            reasons.append(f"<div class='reason-text'>✔️ <b>현장 반응:</b> 얼리어답터들이 모인 <span class='reason-highlight'>해외 긱(Geek) 커뮤니티</span>의 날것 그대로의 생생한 토론입니다.</div>")
-
-        # 4. 🏷️ AI 핵심 추출 키워드 (Topic Tags)
-        kws = item.get("keywords", [])
-        if kws:
-            formatted_kws = ", ".join([f"#{k}" for k in kws[:3]])
-            reasons.append(f"<div class='reason-text'>✔️ <b>핵심 키워드:</b> <span class='reason-highlight'>{formatted_kws}</span> 테마를 강하게 내포하고 있어 차세대 기획에 유효합니다.</div>")
-            
-        # 5. 📰 기사의 성격/유형 (Article Intent)
-        text_for_intent = (item.get("title_en", "") + " " + item.get("summary_en", "")).lower()
-        if any(w in text_for_intent for w in ['launch', 'unveil', 'release', 'announce', 'introduce', '출시', '공개']):
-            reasons.append("<div class='reason-text'>✔️ <b>기사 성격:</b> 단순 루머가 아닌, 기업의 <span class='reason-highlight'>[신규 폼팩터/서비스 공식 발표]</span> 데이터입니다.</div>")
-        elif any(w in text_for_intent for w in ['review', 'hands-on', 'test', '리뷰']):
-            reasons.append("<div class='reason-text'>✔️ <b>기사 성격:</b> 특정 제품 및 기술에 대한 전문가의 <span class='reason-highlight'>[심층 리뷰 및 벤치마크 분석]</span>이 포함되어 있습니다.</div>")
-        elif any(w in text_for_intent for w in ['earnings', 'revenue', 'q1', 'q2', 'q3', 'q4', 'profit', 'acquire', 'merger', '실적']):
-            reasons.append("<div class='reason-text'>✔️ <b>기사 성격:</b> 비즈니스 규모와 시장 장악력을 보여주는 <span class='reason-highlight'>[기업 실적 및 M&A 동향]</span>입니다.</div>")
-
-        # + 알파: 커뮤니티 버즈 및 중복 보도
-        if item.get("community_buzz"):
-            buzz_kws = ", ".join(item.get("buzz_words", []))
-            reasons.append(f"<div class='reason-text'>✔️ <b>소셜 화제성:</b> 소셜 미디어 상에서 <span class='reason-highlight'>{buzz_kws}</span> 관련 화제성이 급증해 가산점을 받았습니다.</div>")
-        if item.get("dup_count", 1) > 1:
-            reasons.append(f"<div class='reason-text'>✔️ <b>교차 검증:</b> <span class='reason-highlight'>{item['dup_count']}개 이상의 매체</span>에서 동시다발적으로 보도 중인 확실한 메가 트렌드입니다.</div>")
-            
-        return "".join(reasons)
+    view = load_board_view(pool_name, board_version, f_weight, max_articles, total_picks, global_ratio, has_prefs, datetime.now().strftime("%Y%m%d%H"))
+    startup.mark("board_view")
+    must_know_items, top_picks, stream_news = view["must_know"], view["top_picks"], view["stream"]
 
     # ==========================
     # 🔥 Section 1: MUST KNOW
@@ -956,47 +930,18 @@ else:
         for i, item in enumerate(must_know_items):
             with cols[i % 3]:
                 with st.container(border=True):
-                    img_src = item.get('thumbnail') if item.get('thumbnail') else f"https://s.wordpress.com/mshots/v1/{item['link']}?w=800"
-                    dup_badge = f"🔥 {item['dup_count']}개 매체 중복 보도" if item.get('dup_count', 1) > 1 else "🔥 글로벌 핫트렌드"
-                    buzz_badge = f"<span class='badge badge-buzz' title='커뮤니티 언급: {', '.join(item.get('buzz_words', []))}'>💬 긱(Geek) 화제</span>" if item.get('community_buzz') else ""
-                    
-                    reason_text = get_reason_text(item)
-                    
-                    html_content = (
-                        '<div class="hero-img-box">'
-                        f'<a href="{item.get("link", "#")}" target="_blank" style="display:block; width:100%; height:100%;">'
-                        f'<img src="{img_src}" class="hero-bg" onerror="this.src=\'https://via.placeholder.com/800x600/1a1a1a/ffffff?text=MUST+KNOW\';">'
-                        '<div class="hero-overlay"></div>'
-                        '</a>'
-                        '<div class="reason-icon" title="추천 이유 확인">💡</div>'
-                        '<div class="reason-overlay">'
-                        '<div class="reason-title">🎯 Why Recommended?</div>'
-                        f'{reason_text}'
-                        '</div>'
-                        '<div class="hero-content">'
-                        f'<span class="badge badge-fire">{dup_badge}</span> '
-                        f'<span class="badge badge-score">MATCH {item.get("score", 0)}%</span> '
-                        f'{buzz_badge}'
-                        f'<div class="hero-title">{item.get("insight_title", item.get("title_en", ""))}</div>'
-                        '</div></div>'
-                    )
-                    st.markdown(html_content, unsafe_allow_html=True)
+                    st.markdown(item['card_html'], unsafe_allow_html=True)
                     
                     st.markdown("<div style='height: 15px;'></div>", unsafe_allow_html=True)
                     act_c1, act_space, act_c2, act_c3 = st.columns([7.8, 2.0, 3.2, 3.5])
                     with act_c1:
-                        st.markdown(f"""
-                        <div style='display: flex; flex-direction: column; justify-content: center;'>
-                            <a href='{item.get("link", "#")}' target='_blank' style='color:#1E293B; font-weight:800; font-size: 0.85rem; text-decoration:none; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; line-height: 1.2;'>📰 {item.get("source", "Source")}</a>
-                            <span style='font-size: 0.7rem; color: #64748B; margin-top: 3px;'>{item.get("date", "")}</span>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        st.markdown(item['meta_html'], unsafe_allow_html=True)
                     with act_c2:
                         if st.button("공유", key=f"share_mk_{item['id']}_{i}", type="tertiary", use_container_width=True):
                             show_share_modal(item)
                     with act_c3:
                         if st.button("AI 분석", key=f"btn_mk_{item['id']}_{i}", type="secondary", use_container_width=True):
-                            show_analysis_modal(item, st.session_state.settings.get("api_key", "").strip(), st.session_state.settings.get("gems_persona", GEMS_PERSONA), st.session_state.settings['ai_prompt'], raw_news_pool)
+                            show_analysis_modal(item, st.session_state.settings.get("api_key", "").strip(), st.session_state.settings.get("gems_persona", GEMS_PERSONA), st.session_state.settings['ai_prompt'], pool_name)
 
     # ==========================
     # 🏆 Section 2: Today's Top Picks
@@ -1007,47 +952,18 @@ else:
         for i, item in enumerate(top_picks):
             with cols[i % 3]:
                 with st.container(border=True):
-                    img_src = item.get('thumbnail') if item.get('thumbnail') else f"https://s.wordpress.com/mshots/v1/{item['link']}?w=800"
-                    cat_badge = "<span class='badge badge-global'>🌐 Global</span>" if item['category'] == 'Global Innovation' else ("<span class='badge badge-china'>🇨🇳 China</span>" if item['category'] == 'China & East Asia' else f"<span class='badge' style='background:#7f8c8d;'>{item['category'][:6]}</span>")
-                    buzz_badge = f"<span class='badge badge-buzz' title='커뮤니티 언급: {', '.join(item.get('buzz_words', []))}'>💬 커뮤니티 화제</span>" if item.get('community_buzz') else ""
-                    
-                    reason_text = get_reason_text(item)
-                    
-                    html_content = (
-                        '<div class="hero-img-box">'
-                        f'<a href="{item.get("link", "#")}" target="_blank" style="display:block; width:100%; height:100%;">'
-                        f'<img src="{img_src}" class="hero-bg" onerror="this.src=\'https://via.placeholder.com/800x600/1a1a1a/ffffff?text=TOP+PICK\';">'
-                        '<div class="hero-overlay"></div>'
-                        '</a>'
-                        '<div class="reason-icon" title="추천 이유 확인">💡</div>'
-                        '<div class="reason-overlay">'
-                        '<div class="reason-title">🎯 Why Recommended?</div>'
-                        f'{reason_text}'
-                        '</div>'
-                        '<div class="hero-content">'
-                        f'{cat_badge} '
-                        f'<span class="badge badge-score">MATCH {item.get("score", 0)}%</span> '
-                        f'{buzz_badge}'
-                        f'<div class="hero-title">{item.get("insight_title", item.get("title_en", ""))}</div>'
-                        '</div></div>'
-                    )
-                    st.markdown(html_content, unsafe_allow_html=True)
+                    st.markdown(item['card_html'], unsafe_allow_html=True)
                     
                     st.markdown("<div style='height: 15px;'></div>", unsafe_allow_html=True)
                     act_c1, act_space, act_c2, act_c3 = st.columns([7.8, 2.0, 3.2, 3.5])
                     with act_c1:
-                        st.markdown(f"""
-                        <div style='display: flex; flex-direction: column; justify-content: center;'>
-                            <a href='{item.get("link", "#")}' target='_blank' style='color:#1E293B; font-weight:800; font-size: 0.85rem; text-decoration:none; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; line-height: 1.2;'>📰 {item.get("source", "Source")}</a>
-                            <span style='font-size: 0.7rem; color: #64748B; margin-top: 3px;'>{item.get("date", "")}</span>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        st.markdown(item['meta_html'], unsafe_allow_html=True)
                     with act_c2:
                         if st.button("공유", key=f"share_tp_{item['id']}_{i}", type="tertiary", use_container_width=True):
                             show_share_modal(item)
                     with act_c3:
                         if st.button("AI 분석", key=f"btn_tp_{item['id']}_{i}", type="secondary", use_container_width=True):
-                            show_analysis_modal(item, st.session_state.settings.get("api_key", "").strip(), st.session_state.settings.get("gems_persona", GEMS_PERSONA), st.session_state.settings['ai_prompt'], raw_news_pool)
+                            show_analysis_modal(item, st.session_state.settings.get("api_key", "").strip(), st.session_state.settings.get("gems_persona", GEMS_PERSONA), st.session_state.settings['ai_prompt'], pool_name)
 
     # ==========================
     # 🌊 Section 3: Sensing Stream 
@@ -1055,61 +971,48 @@ else:
     if stream_news:
         st.markdown("<br><div class='section-header'>🌊 Sensing Stream <span class='section-desc'>기타 관심 동향 타임라인</span></div>", unsafe_allow_html=True)
         
-        filter_options = ["전체보기", "글로벌 혁신", "중국 동향", "일본/로보틱스", "커뮤니티 화제"]
+        filter_options = list(board.STREAM_FILTERS.keys())
         selected_filter = st.radio("필터", filter_options, horizontal=True, label_visibility="collapsed", key="stream_filter")
         st.markdown('<br>', unsafe_allow_html=True)
         
-        filtered_stream = []
-        for item in stream_news:
-            if selected_filter == "전체보기":
-                filtered_stream.append(item)
-            elif selected_filter == "글로벌 혁신" and item.get('category') == 'Global Innovation':
-                filtered_stream.append(item)
-            elif selected_filter == "중국 동향" and item.get('category') == 'China & East Asia':
-                filtered_stream.append(item)
-            elif selected_filter == "일본/로보틱스" and item.get('category') == 'Japan & Robotics':
-                filtered_stream.append(item)
-            elif selected_filter == "커뮤니티 화제" and item.get('community_buzz'):
-                filtered_stream.append(item)
+        # 💡 필터별 인덱스는 뷰모델에서 미리 계산되어 있어 필터 전환 시에는 목록만 골라냅니다.
+        filtered_stream = [stream_news[i] for i in view["stream_filters"][selected_filter]]
+
+        # 💡 첫 화면은 STREAM_PAGE_SIZE개만 그리고 '더 보기'로 창을 늘립니다. 필터나 데이터가 바뀌면 창을 처음으로 되돌립니다.
+        window_key = (pool_name, board_version, f_weight, selected_filter)
+        if st.session_state.get("stream_window_key") != window_key:
+            st.session_state.stream_window_key = window_key
+            st.session_state.stream_visible = board.STREAM_PAGE_SIZE
+        visible_stream = filtered_stream[:st.session_state.stream_visible]
 
         if not filtered_stream:
             st.info("해당 조건에 맞는 기사가 없습니다.")
         else:
             stream_cols = st.columns(3)
-            for i, item in enumerate(filtered_stream):
+            for i, item in enumerate(visible_stream):
                 with stream_cols[i % 3]:
                     with st.container(border=True):
-                        img_src = item.get('thumbnail') if item.get('thumbnail') else f"https://s.wordpress.com/mshots/v1/{item['link']}?w=600"
-                        buzz_tag = "<span style='background:#f39c12; color:white; padding:2px 6px; border-radius:8px; font-size:0.65rem; font-weight:bold; margin-left:5px;'>💬 화제</span>" if item.get('community_buzz') else ""
-                        
-                        html_content = (
-                            '<div style="display:flex; justify-content:space-between; align-items:center; margin-bottom:12px;">'
-                            '<div style="display:flex; align-items:center; gap:8px;">'
-                            '<div style="width:24px; height:24px; background:#f0f2f5; border-radius:50%; display:flex; justify-content:center; align-items:center; font-size:12px;">📰</div>'
-                            f'<a href="{item.get("link", "#")}" target="_blank" style="font-weight:800; font-size:0.95rem; color:#1E293B; text-decoration:none;">{item.get("source", "Source")}</a>'
-                            '</div><div>'
-                            f'<span style="background-color:#E3F2FD; color:#1565C0; padding:4px 8px; border-radius:12px; font-size:0.7rem; font-weight:700;">MATCH {item.get("score", 0)}%</span> '
-                            f'{buzz_tag}'
-                            '</div></div>'
-                            f'<a href="{item.get("link", "#")}" target="_blank">'
-                            f'<img src="{img_src}" style="width:100%; aspect-ratio:16/9; object-fit:cover; border-radius:8px; display:block; margin-bottom:12px;" onerror="this.src=\'https://via.placeholder.com/600x338?text=No+Image\';">'
-                            f'</a>'
-                            f'<div style="font-weight:700; font-size:1.05rem; line-height:1.4; color:#262626; margin-bottom:8px;">💡 {item.get("insight_title", item.get("title_en", ""))}</div>'
-                            f'<div style="font-size:0.85rem; color:#444; line-height:1.5; margin-bottom:12px;">{item.get("core_summary", item.get("summary_ko", ""))}</div>'
-                        )
-                        st.markdown(html_content, unsafe_allow_html=True)
+                        st.markdown(item['card_html'], unsafe_allow_html=True)
                         
                         st.markdown("<div style='height: 15px;'></div>", unsafe_allow_html=True)
                         act_c1, act_space, act_c2, act_c3 = st.columns([7.8, 2.0, 3.2, 3.5])
                         with act_c1:
-                            st.markdown(f"""
-                            <div style='display: flex; flex-direction: column; justify-content: center;'>
-                                <span style='font-size: 0.7rem; color: #64748B; margin-top: 3px;'>{item.get("date", "")}</span>
-                            </div>
-                            """, unsafe_allow_html=True)
+                            st.markdown(item['meta_html'], unsafe_allow_html=True)
                         with act_c2:
                             if st.button("공유", key=f"share_st_{item['id']}_{i}", type="tertiary", use_container_width=True):
                                 show_share_modal(item)
                         with act_c3:
                             if st.button("AI 분석", key=f"btn_st_{item['id']}_{i}", type="secondary", use_container_width=True):
-                                show_analysis_modal(item, st.session_state.settings.get("api_key", "").strip(), st.session_state.settings.get("gems_persona", GEMS_PERSONA), st.session_state.settings['ai_prompt'], raw_news_pool)
+                                show_analysis_modal(item, st.session_state.settings.get("api_key", "").strip(), st.session_state.settings.get("gems_persona", GEMS_PERSONA), st.session_state.settings['ai_prompt'], pool_name)
+
+            remaining = len(filtered_stream) - len(visible_stream)
+            if remaining > 0:
+                _, more_col, _ = st.columns([1, 1, 1])
+                if more_col.button(f"⬇️ 더 보기 ({len(visible_stream)} / {len(filtered_stream)})", use_container_width=True, key="stream_more"):
+                    st.session_state.stream_visible += board.STREAM_PAGE_SIZE
+                    st.rerun()
+
+# ==========================================
+# ⏱️ 콜드 스타트 기록 (프로세스의 첫 실행에서만 남음)
+# ==========================================
+startup.finish()
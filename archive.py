@@ -0,0 +1,212 @@
+import argparse
+import base64
+import glob
+import gzip
+import hashlib
+import json
+import math
+import os
+import re
+
+# ==========================================
+# 🗃️ [아카이브] 일자별 gzip NDJSON + manifest 인덱스
+# ==========================================
+# 💡 archive/sensing_YYYY-MM-DD.ndjson.gz : 하루치 기사 (점수 내림차순, 1줄 = 1기사)
+#    archive/manifest.json               : 일자별 건수/점수 범위/카테고리 분포 + 키워드 블룸 필터
+#    → 기간/점수/카테고리/키워드 조건에 안 맞는 날짜는 압축을 풀지 않고 건너뜁니다.
+ARCHIVE_DIR = "archive"
+MANIFEST_FILE = "manifest.json"
+LEGACY_PATTERN = "morning_sensing_*.json"
+# 💡 블룸 필터 크기는 그날 토큰 수 n으로 정합니다: m = -n·ln(p) / ln(2)², k = (m/n)·ln(2)
+#    (고정 32768비트는 하루 150건이면 이미 70% 넘게 차서 단일 토큰 오탐률이 ~28%였음) m, k는 날짜별로 manifest에 저장합니다.
+BLOOM_FP_RATE = 0.01
+BLOOM_MIN_BITS = 1024
+BLOOM_MAX_HASHES = 16
+BLOOM_BITS = 32768          # m/k가 기록되지 않은 예전 manifest 항목용 기본값
+BLOOM_HASHES = 4
+TEXT_FIELDS = ('title_en', 'insight_title', 'core_summary', 'summary_en')
+
+def day_file(date_str):
+    return f"sensing_{date_str}.ndjson.gz"
+
+def _manifest_path(archive_dir):
+    return os.path.join(archive_dir, MANIFEST_FILE)
+
+def load_manifest(archive_dir=ARCHIVE_DIR):
+    path = _manifest_path(archive_dir)
+    if not os.path.exists(path): return {"version": 1, "days": {}}
+    try:
+        with open(path, "r", encoding="utf-8") as f: return json.load(f)
+    except: return {"version": 1, "days": {}}
+
+def _save_manifest(manifest, archive_dir):
+    path = _manifest_path(archive_dir)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    os.replace(tmp, path)
+
+# ==========================================
+# 🔎 [키워드 토큰 & 블룸 필터]
+# ==========================================
+def tokens(text):
+    """색인용 토큰. 영문은 단어 단위, 한/중/일 단어는 단어 + 글자 bigram."""
+    result = set()
+    for w in re.findall(r'\w+', str(text or "").lower()):
+        result.add(w)
+        if not w.isascii() and len(w) > 2:
+            result.update(w[i:i + 2] for i in range(len(w) - 1))
+    return result
+
+def query_tokens(text):
+    """검색어 토큰. 한/중/일 단어는 bigram만 씁니다 — 단어 전체까지 요구하면
+    '스마트링'이 '스마트링은'(조사 붙은 단어)에 매칭되지 않습니다. 두 글자 이하는 단어 그대로."""
+    result = set()
+    for w in re.findall(r'\w+', str(text or "").lower()):
+        if not w.isascii() and len(w) > 2: result.update(w[i:i + 2] for i in range(len(w) - 1))
+        else: result.add(w)
+    return result
+
+def item_tokens(item):
+    toks = set()
+    for k in TEXT_FIELDS: toks |= tokens(item.get(k, ""))
+    for kw in item.get('keywords', []) or []: toks |= tokens(kw)
+    return toks
+
+def bloom_size(n, fp_rate=BLOOM_FP_RATE):
+    """토큰 수 → (비트 수 m, 해시 수 k). m은 8의 배수로 올림."""
+    n = max(n, 1)
+    m = max(BLOOM_MIN_BITS, math.ceil(-n * math.log(fp_rate) / math.log(2) ** 2))
+    m = (m + 7) // 8 * 8
+    k = min(BLOOM_MAX_HASHES, max(1, round(m / n * math.log(2))))
+    return m, k
+
+def _bloom_positions(token, m=BLOOM_BITS, k=BLOOM_HASHES):
+    h = hashlib.blake2b(token.encode(), digest_size=4 * k).digest()
+    return [int.from_bytes(h[i * 4:(i + 1) * 4], "big") % m for i in range(k)]
+
+def build_bloom(token_set, fp_rate=BLOOM_FP_RATE):
+    """토큰 집합 → (base64 비트열, m, k)"""
+    m, k = bloom_size(len(token_set), fp_rate)
+    bits = bytearray(m // 8)
+    for t in token_set:
+        for p in _bloom_positions(t, m, k): bits[p >> 3] |= 1 << (p & 7)
+    return base64.b64encode(bytes(bits)).decode(), m, k
+
+def bloom_contains(meta, token_set):
+    """manifest의 날짜 항목(bloom / bloom_bits / bloom_hashes)에 토큰이 모두 있을 수 있는지."""
+    bits = base64.b64decode(meta["bloom"])
+    m, k = meta.get("bloom_bits", BLOOM_BITS), meta.get("bloom_hashes", BLOOM_HASHES)
+    return all(bits[p >> 3] & (1 << (p & 7)) for t in token_set for p in _bloom_positions(t, m, k))
+
+# ==========================================
+# ✍️ [쓰기] 하루치 저장 & 레거시 변환
+# ==========================================
+def write_day(date_str, items, archive_dir=ARCHIVE_DIR):
+    os.makedirs(archive_dir, exist_ok=True)
+    items = sorted(items, key=lambda x: (-x.get('score', 0), x.get('id', '')))
+    path = os.path.join(archive_dir, day_file(date_str))
+    # 💡 mtime=0 → 같은 내용이면 같은 바이트 (git diff 최소화)
+    with open(path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+        for item in items:
+            gz.write((json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8"))
+
+    categories = {}
+    all_tokens = set()
+    for item in items:
+        categories[item.get('category', '')] = categories.get(item.get('category', ''), 0) + 1
+        all_tokens |= item_tokens(item)
+    scores = [item.get('score', 0) for item in items] or [0]
+
+    bloom, m, k = build_bloom(all_tokens)
+
+    manifest = load_manifest(archive_dir)
+    manifest["days"][date_str] = {
+        "file": day_file(date_str), "count": len(items), "min_score": min(scores), "max_score": max(scores),
+        "categories": categories, "bloom": bloom, "bloom_bits": m, "bloom_hashes": k, "bytes": os.path.getsize(path),
+    }
+    _save_manifest(manifest, archive_dir)
+    return path
+
+def reindex(archive_dir=ARCHIVE_DIR):
+    """저장된 날짜 파일로 manifest의 블룸 필터를 다시 만듭니다 (크기 규칙이 바뀐 뒤 1회 실행)."""
+    manifest = load_manifest(archive_dir)
+    for date_str, meta in manifest["days"].items():
+        all_tokens = set()
+        for item in read_day(date_str, archive_dir): all_tokens |= item_tokens(item)
+        meta["bloom"], meta["bloom_bits"], meta["bloom_hashes"] = build_bloom(all_tokens)
+    _save_manifest(manifest, archive_dir)
+    return sorted(manifest["days"])
+
+def migrate_legacy(archive_dir=ARCHIVE_DIR, remove=True):
+    """archive/morning_sensing_YYYY-MM-DD.json (pretty JSON) → 압축 포맷으로 변환."""
+    converted = []
+    for path in sorted(glob.glob(os.path.join(archive_dir, LEGACY_PATTERN))):
+        date_str = os.path.basename(path)[len("morning_sensing_"):-len(".json")]
+        try:
+            with open(path, "r", encoding="utf-8") as f: items = json.load(f)
+        except Exception as e:
+            print(f"🚨 변환 실패 {path}: {e}")
+            continue
+        write_day(date_str, items, archive_dir)
+        if remove: os.remove(path)
+        converted.append(date_str)
+    return converted
+
+# ==========================================
+# 📖 [읽기] 기간/점수/카테고리/키워드 스캔
+# ==========================================
+def list_days(start=None, end=None, archive_dir=ARCHIVE_DIR):
+    days = sorted(load_manifest(archive_dir)["days"].keys())
+    return [d for d in days if (not start or d >= start) and (not end or d <= end)]
+
+def read_day(date_str, archive_dir=ARCHIVE_DIR):
+    path = os.path.join(archive_dir, day_file(date_str))
+    if not os.path.exists(path): return
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip(): yield json.loads(line)
+
+def scan(start=None, end=None, min_score=None, categories=None, keyword=None, archive_dir=ARCHIVE_DIR):
+    """조건에 맞는 아카이브 기사를 날짜 오름차순으로 yield (각 기사에 archive_date 추가).
+
+    start/end는 'YYYY-MM-DD' (포함). keyword의 토큰(영문 단어 / 한중일 bigram)이 모두 포함되어야 매칭됩니다.
+    """
+    manifest = load_manifest(archive_dir)
+    q_tokens = query_tokens(keyword) if keyword else set()
+    categories = set(categories) if categories else None
+
+    for date_str in sorted(manifest["days"].keys()):
+        if start and date_str < start: continue
+        if end and date_str > end: continue
+        meta = manifest["days"][date_str]
+        # 💡 manifest만 보고 걸러지는 날은 파일을 열지 않습니다.
+        if min_score is not None and meta.get("max_score", 0) < min_score: continue
+        if categories and not categories.intersection(meta.get("categories", {}).keys()): continue
+        if q_tokens and not bloom_contains(meta, q_tokens): continue
+
+        for item in read_day(date_str, archive_dir):
+            # 점수 내림차순으로 저장되어 있으므로 기준 미달이 나오면 그날은 종료
+            if min_score is not None and item.get('score', 0) < min_score: break
+            if categories and item.get('category') not in categories: continue
+            if q_tokens and not q_tokens <= item_tokens(item): continue
+            item['archive_date'] = date_str
+            yield item
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NGEPT 센싱 아카이브 도구")
+    parser.add_argument("--migrate", action="store_true", help="레거시 morning_sensing_*.json을 압축 포맷으로 변환")
+    parser.add_argument("--keep", action="store_true", help="변환 후 레거시 파일을 지우지 않음")
+    parser.add_argument("--reindex", action="store_true", help="manifest 블룸 필터를 토큰 수 기준 크기로 다시 생성")
+    args = parser.parse_args()
+    if args.reindex:
+        done = reindex()
+        print(f"✅ {len(done)}일치 블룸 필터 재생성 완료")
+    elif args.migrate:
+        done = migrate_legacy(remove=not args.keep)
+        print(f"✅ {len(done)}일치 변환 완료: {', '.join(done)}")
+    else:
+        manifest = load_manifest()
+        for d in list_days():
+            meta = manifest["days"][d]
+            print(f"{d}  {meta['count']:>4}건  점수 {meta['min_score']}~{meta['max_score']}  {meta['bytes'] / 1024:.1f}KB")
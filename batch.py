@@ -1,21 +1,37 @@
-import feedparser
 from google import genai
-from google.genai import types
-from bs4 import BeautifulSoup
+import argparse
+import glob
 import json
+import math
 import os
-import re
 from datetime import datetime, timedelta
-import time
 from deep_translator import GoogleTranslator
 import hashlib
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import heapq
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 # 외부 프롬프트
-from prompts import DEFAULT_FILTER_PROMPT
+from prompts import DEFAULT_FILTER_PROMPT, DEFAULT_AI_PROMPT, GEMS_PERSONA
+import analysis_cache
+import archive
+import board
+import buzz
+import channels
+import dedup
+import enrich
+import entities
+import feeds
+import llm
+import records
+import rerank
+import snapshot
+import store
+import thumbs
+import trends
 
-# 💡 Tier 1 주요 매체 리스트 (MUST KNOW 권위 판별용)
-TIER1_SOURCES = ['techcrunch', 'verge', 'wired', 'bloomberg', 'cnbc', 'wsj', 'reuters', 'engadget', 'nikkei', 'gizmodo', 'the information']
+# 💡 전체 파이프라인 기준 AI 심층 채점 대상 수 (샤딩 시 샤드 수만큼 나눠서 분배)
+CANDIDATE_LIMIT = 150
+SHARD_DIR = "shards"
 
 def load_prefs():
     pref_file = "learned_preferences.json"
@@ -25,211 +41,307 @@ def load_prefs():
         except: return []
     return []
 
-def run_morning_batch():
-    print("🌅 [NGEPT 모닝 센싱 V2] 파이프라인 가동 시작...")
-    
+def get_client():
     api_key = os.environ.get("GEMINI_API_KEY", "").strip()
     if not api_key:
         print("🚨 에러: GEMINI_API_KEY가 없습니다.")
-        return
-    client = genai.Client(api_key=api_key)
+        return None
+    return genai.Client(api_key=api_key)
 
-    try:
-        with open("channels.json", "r", encoding="utf-8") as f: channels_data = json.load(f)
-    except Exception as e:
-        print(f"🚨 에러: channels.json 읽기 실패 {e}")
-        return
+def load_channels():
+    # 💡 channels.json → 채널별 유형/Tier/언어/지역을 미리 계산한 레지스트리 (검증 오류는 경고 후 해당 항목만 제외)
+    return channels.load()
 
-    limit = datetime.now() - timedelta(days=3)
-    community_domains = ['reddit', 'v2ex', 'hacker news', 'ycombinator', 'clien', 'dcinside', 'blind']
-    
+# ==========================================
+# 🧩 [샤딩] 채널 분배 규칙
+# ==========================================
+def shard_of(cat, feed, categories, shard_count, shard_by="hash"):
+    """채널이 속할 샤드 번호. 파이썬 hash()는 프로세스마다 달라지므로 md5로 고정합니다."""
+    if shard_by == "category":
+        return sorted(categories).index(cat) % shard_count
+    return int(hashlib.md5(feed["url"].encode()).hexdigest(), 16) % shard_count
+
+def build_tasks(registry, limit, shard_index=0, shard_count=1, shard_by="hash"):
     news_tasks = []
     comm_tasks = []
-    
-    for cat, feeds in channels_data.items():
-        for f in feeds:
-            if f.get("active", True):
-                if any(d in f["url"].lower() for d in community_domains):
-                    comm_tasks.append((cat, f, limit))
-                else:
-                    news_tasks.append((cat, f, limit))
-
-    def fetch_worker(args):
-        cat, f, lim = args
-        articles = []
-        try:
-            d = feedparser.parse(f["url"])
-            if not d.entries: return []
-            # 💡 [해결 3] 최신 30개까지 긁어와 모수를 최대한 넓힙니다.
-            for entry in d.entries[:30]:
-                dt = entry.get('published_parsed') or entry.get('updated_parsed')
-                if not dt: continue
-                p_date = datetime.fromtimestamp(time.mktime(dt))
-                if p_date < lim: continue
-                
-                thumbnail = ""
-                if 'media_content' in entry and len(entry.media_content) > 0: thumbnail = entry.media_content[0].get('url', '')
-                elif 'media_thumbnail' in entry and len(entry.media_thumbnail) > 0: thumbnail = entry.media_thumbnail[0].get('url', '')
-                if not thumbnail:
-                    html_content = str(entry.get('content', [{}])[0].get('value', '')) + str(entry.get('summary', ''))
-                    soup = BeautifulSoup(html_content, "html.parser")
-                    img_tag = soup.find('img')
-                    if img_tag and img_tag.get('src'): thumbnail = img_tag.get('src')
-
-                articles.append({
-                    "id": hashlib.md5(entry.link.encode()).hexdigest()[:12], 
-                    "title_en": entry.title, 
-                    "link": entry.link, 
-                    "source": f["name"],
-                    "category": cat, 
-                    "date_obj": p_date.isoformat(), 
-                    "date": p_date.strftime("%Y.%m.%d"),
-                    "summary_en": BeautifulSoup(entry.get("summary", ""), "html.parser").get_text()[:300], 
-                    "thumbnail": thumbnail
-                })
-        except: pass
-        return articles
+    categories = list(dict.fromkeys(ch["category"] for ch in registry["channels"]))
 
-    # ==========================================
-    # 📡 TRACK A: 커뮤니티 소셜 리스닝 (morning_buzz.json 생성)
-    # ==========================================
-    raw_comm = []
-    print(f"📡 커뮤니티 데이터 수집 중... (채널 {len(comm_tasks)}개)")
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        for f in as_completed([executor.submit(fetch_worker, t) for t in comm_tasks]):
-            raw_comm.extend(f.result())
-            
-    print(f"💬 수집된 커뮤니티 글: {len(raw_comm)}개. AI 핫 키워드 추출 시작...")
-    hot_buzz_keywords = []
-    if raw_comm:
-        # 최근 100개 글 제목을 뭉쳐서 AI에게 전달
-        comm_titles = "\n".join([f"- {item['title_en']}" for item in raw_comm[:100]])
-        buzz_prompt = f"당신은 IT 트렌드 분석가입니다. 아래는 오늘 새벽 글로벌 긱(Geek) 커뮤니티에 올라온 게시글 제목들입니다.\n이 중에서 가장 많이 언급되고 화제가 되는 특정 기업, 제품, 기술, 폼팩터 키워드 15개를 추출하여 JSON 리스트 형태로만 반환하세요.\n[게시글]\n{comm_titles}\n\n[출력 형식]\n{{\"keywords\": [\"Apple\", \"AR Glass\", ...]}}"
-        try:
-            res = client.models.generate_content(model="gemini-2.5-flash", contents=buzz_prompt, config=types.GenerateContentConfig(response_mime_type="application/json"))
-            json_match = re.search(r'\{.*\}', res.text.strip(), re.DOTALL)
-            if json_match:
-                hot_buzz_keywords = json.loads(json_match.group()).get("keywords", [])
-                hot_buzz_keywords = [k.upper() for k in hot_buzz_keywords]
-        except Exception as e: print(f"버즈 추출 실패: {e}")
+    for ch in registry["channels"]:
+        if not ch["active"]: continue
+        if shard_count > 1 and shard_of(ch["category"], ch, categories, shard_count, shard_by) != shard_index: continue
+        (comm_tasks if ch["type"] == 'community' else news_tasks).append((ch, limit))
+    return news_tasks, comm_tasks
+
+def fetch_all(tasks, max_workers, parse_workers=None):
+    # 💡 다운로드는 스레드, 피드 파싱은 프로세스 풀 (feeds.collect). 최신 30개까지 긁어와 모수를 최대한 넓힙니다. [해결 3]
+    return feeds.collect([(ch, lim, 30) for ch, lim in tasks], fetch_workers=max_workers, parse_workers=parse_workers)
+
+# ==========================================
+# 📡 TRACK A: 커뮤니티 소셜 리스닝 (morning_buzz.json 생성)
+# ==========================================
+def extract_buzz_keywords(client, raw_comm, use_llm_labels=False):
+    # 💡 모든 커뮤니티 글을 로컬 n-gram 엔진으로 집계 (시간 감쇠 + 어제까지의 기준선 대비 신규성)
+    weights, baseline = buzz.compute_buzz(raw_comm, previous=buzz.load_buzz())
+    labels = buzz.label_with_llm(client, weights, raw_comm) if use_llm_labels and client else {}
 
     # 💡 [해결 5] 수동 센싱에서도 쓸 수 있도록 Buzz 파일 별도 저장!
     try:
-        with open("morning_buzz.json", "w", encoding="utf-8") as f:
-            json.dump({"date": datetime.now().isoformat(), "keywords": hot_buzz_keywords}, f, ensure_ascii=False)
-        print(f"🔥 morning_buzz.json 저장 완료 (핫 키워드: {len(hot_buzz_keywords)}개)")
+        buzz.save_buzz(weights, baseline, labels)
+        print(f"🔥 morning_buzz.json 저장 완료 (핫 키워드: {len(weights)}개) → {', '.join(list(weights)[:10])}")
     except Exception as e: print(f"버즈 저장 실패: {e}")
+    return weights
 
-    # ==========================================
-    # 📡 TRACK B: 뉴스 Pre-Filtering (초벌 채점)
-    # ==========================================
-    raw_news = []
-    print(f"📡 공식 뉴스 데이터 수집 중... (채널 {len(news_tasks)}개)")
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        for f in as_completed([executor.submit(fetch_worker, t) for t in news_tasks]):
-            raw_news.extend(f.result())
-            
-    print(f"📰 수집된 전체 원본 기사: {len(raw_news)}개. (시간순 무식한 컷오프 폐지!)")
-    
-    # 💡 [해결 3&4] 시간순이 아닌 '제목 기반 Pre-filter' 적용 (단어 필터링으로 300개 압축 후 AI 분석)
-    learned_rules = load_prefs()
-    rule_str = ", ".join(learned_rules)
-    
-    # 1차 초스피드 로컬 텍스트 필터링 (가벼운 연관도 검사)
-    target_keywords = ['ai', 'apple', 'meta', 'google', 'wearable', 'ring', 'glass', 'robot', 'ux', 'release', 'launch']
-    target_keywords.extend([r.lower() for r in rule_str.split()])
-    
+# ==========================================
+# 📡 TRACK B: 뉴스 Pre-Filtering (초벌 채점)
+# ==========================================
+def prefilter_news(raw_news, learned_rules, candidate_limit):
+    # 💡 [해결 3&4] 시간순이 아닌 '제목 기반 Pre-filter' 적용 (단어 필터링으로 압축 후 AI 분석)
+    # 1차 초스피드 로컬 텍스트 필터링 (가벼운 연관도 검사) - 규칙 변경 시 대시보드 재정렬과 같은 함수 사용
+    # 💡 [해결 6] Tier 1 매체에는 태생적으로 강력한 가점 부여 (is_tier1은 수집 시 채널 레지스트리에서 붙어 옴)
     for n in raw_news:
-        text_lower = (n['title_en'] + " " + n['summary_en']).lower()
-        n['pre_score'] = sum(2 for k in target_keywords if k in text_lower)
-        # 💡 [해결 6] Tier 1 매체에는 태생적으로 강력한 가점 부여
-        if any(t in n['source'].lower() for t in TIER1_SOURCES):
-            n['pre_score'] += 10 
-            n['is_tier1'] = True
-        else:
-            n['is_tier1'] = False
-            
-    # 연관도 점수 기반으로 150개만 남기기 (여기서 영양가 없는 기사 대거 탈락)
-    candidate_news = sorted(raw_news, key=lambda x: (x.get('pre_score', 0), x['date_obj']), reverse=True)[:150]
-    print(f"✂️ 제목/매체 연관도 Pre-filter 통과 기사: {len(candidate_news)}개")
+        n['pre_score'] = rerank.pre_score(n, learned_rules)
 
-    # ==========================================
-    # 🧠 TRACK C: 정예 150개 기사 Deep Scoring
-    # ==========================================
-    base_prompt = DEFAULT_FILTER_PROMPT
-    if learned_rules:
-        rules_text = "\n".join([f"- {r}" for r in learned_rules])
-        base_prompt += f"\n\n[🚨 최우선 가중치 (팀장님 선호 학습 규칙)]\n아래 규칙에 부합하는 기사는 반드시 높은 가산점(80점 이상)을 부여하여 핵심 이슈로 선정하세요:\n{rules_text}"
-
-    processed_items = []
-    
-    def ai_scoring_worker(item):
-        try:
-            import random
-            time.sleep(random.uniform(0.5, 1.5))
-            score_query = f"{base_prompt}\n\n[평가 대상]\n매체: {item['source']}\n링크: {item['link']}\n제목: {item['title_en']}\n요약: {item['summary_en'][:200]}"
-            response = client.models.generate_content(model="gemini-2.5-flash", contents=score_query)
-            
-            json_match = re.search(r'\{.*\}', response.text.strip(), re.DOTALL)
-            if json_match:
-                parsed_data = json.loads(json_match.group())
-                item['content_type'] = 'news'
-                item['score'] = int(parsed_data.get('score', 0))
-                item['insight_title'] = parsed_data.get('insight_title') or item['title_en']
-                item['core_summary'] = parsed_data.get('core_summary') or item['summary_en'][:100]
-                item['keywords'] = parsed_data.get('keywords', [])
-                
-                # 💡 [해결 6] Tier 1 매체 + 높은 점수면 'Headline' 등급 부여
-                if item.get('is_tier1') and item['score'] >= 80:
-                    item['score'] = min(100, item['score'] + 5) # 최종 부스팅
-            else: raise ValueError("No JSON")
-        except:
-            item['content_type'] = 'news'
-            item['score'] = 40 # 실패 시 기본 점수 하향
+    # 💡 같은 이벤트를 다룬 신디케이션 기사는 대표 1건만 채점 후보로 올리고, 나머지는 결과만 물려받습니다.
+    reps, members_by_rep = dedup.split_representatives(raw_news)
+    dup_cnt = sum(len(m) for m in members_by_rep.values())
+    if dup_cnt: print(f"🧬 근접 중복 기사 {dup_cnt}개를 {len(members_by_rep)}개 대표 기사로 묶었습니다.")
+
+    # 연관도 점수 기반으로 상위 기사만 남기기 (여기서 영양가 없는 기사 대거 탈락)
+    # 💡 id까지 정렬 키에 넣어 동점일 때도 샤드/재실행 간 결과가 흔들리지 않게 합니다.
+    #    전체를 정렬하지 않고 크기 candidate_limit짜리 힙으로 상위 K개만 뽑습니다 (결과는 정렬 후 자르기와 동일).
+    candidates = heapq.nlargest(candidate_limit, reps, key=lambda x: (x.get('pre_score', 0), x['date_obj'], x['id']))
+    # 💡 채점/저장 단계로 넘어가는 기사만 일반 dict로 풀어 줍니다. 탈락한 레코드는 여기서 버려집니다.
+    members = {c['id']: records.to_dicts(members_by_rep[c['id']]) for c in candidates if c['id'] in members_by_rep}
+    return records.to_dicts(candidates), members
+
+# ==========================================
+# 🧠 TRACK C: 정예 기사 Deep Scoring
+# ==========================================
+def score_candidates(client, candidate_news, learned_rules):
+    base_prompt = rerank.rules_prompt(DEFAULT_FILTER_PROMPT, learned_rules)
+
+    print(f"🧠 정예 기사 {len(candidate_news)}개 AI 심층 채점 시작...")
+    # 💡 스키마 고정 출력 + 검증. 실패한 기사만 모아 재시도하고, 그래도 실패하면 임의 점수 대신 0점 + score_failed로 남깁니다.
+    results, failed = llm.score_with_retry_queue(client, base_prompt, candidate_news)
+    if failed: print(f"⚠️ 재시도 후에도 채점 실패 {len(failed)}건 (0점 처리, 랭킹 제외)")
+
+    def finish(item):
+        parsed = results.get(item['id'])
+        item.pop('body_en', None)   # 본문은 채점 입력용 (content_cache.db에 남아 있으므로 결과 JSON에는 싣지 않음)
+        item['content_type'] = 'news'
+        if parsed:
+            item['score'] = llm.final_score(parsed['score'], item)   # 💡 [해결 6] Tier 1 + 높은 점수면 'Headline' 등급 부스팅
+            item['insight_title'] = parsed['insight_title']
+            item['core_summary'] = parsed['core_summary']
+            item['keywords'] = parsed['keywords']
+        else:
+            item['score'] = 0
+            item['score_failed'] = True
             item['insight_title'] = item['title_en']
             item['core_summary'] = item['summary_en'][:100]
             item['keywords'] = []
-            
+
         try:
             item['insight_title'] = GoogleTranslator(source='auto', target='ko').translate(item['insight_title'])
             item['core_summary'] = GoogleTranslator(source='auto', target='ko').translate(item['core_summary'])
         except: pass
         return item
 
-    print("🧠 정예 기사 150개 AI 심층 채점 시작...")
     with ThreadPoolExecutor(max_workers=5) as executor:
-        for i, future in enumerate(as_completed({executor.submit(ai_scoring_worker, item): item for item in candidate_news})):
-            processed_items.append(future.result())
-
-    # ==========================================
-    # 🎯 TRACK D: 소셜 버즈 융합 & 퍼블리싱
-    # ==========================================
-    final_pool = []
-    for item in processed_items:
-        news_kws = set([str(k).upper() for k in item.get('keywords', [])])
-        overlap = news_kws.intersection(set(hot_buzz_keywords))
-        if overlap:
-            item['score'] = min(100, item['score'] + (len(overlap) * 5))
-            item['community_buzz'] = True
-            item['buzz_words'] = list(overlap)
-        else:
-            item['community_buzz'] = False
-        final_pool.append(item)
+        return list(executor.map(finish, candidate_news))
+
+# ==========================================
+# 🎯 TRACK D: 소셜 버즈 융합 & 퍼블리싱
+# ==========================================
+def fuse_buzz(processed_items, buzz_weights):
+    final_pool = buzz.fuse(processed_items, buzz_weights)
+    # 💡 점수 동점일 때 id로 2차 정렬 → 샤드 완료 순서와 무관하게 같은 결과
+    return sorted(final_pool, key=lambda x: (-x.get('score', 0), x['id']))
 
-    final_pool = sorted(final_pool, key=lambda x: x.get('score', 0), reverse=True)
-    
+def publish(final_pool):
     today_str = datetime.now().strftime("%Y-%m-%d")
-    archive_dir = "archive"
-    if not os.path.exists(archive_dir): os.makedirs(archive_dir)
-        
+
     try:
         with open("today_news.json", "w", encoding="utf-8") as f:
             json.dump(final_pool, f, ensure_ascii=False, indent=4)
-        with open(f"{archive_dir}/morning_sensing_{today_str}.json", "w", encoding="utf-8") as f:
-            json.dump(final_pool, f, ensure_ascii=False, indent=4)
+        # 💡 아카이브는 gzip NDJSON + manifest 인덱스로 저장 (archive.scan으로 기간 조회)
+        archive.write_day(today_str, final_pool)
+        store.replace_pool(final_pool, store.POOL_DAILY, source_mtime=os.path.getmtime("today_news.json"))
+        store.index_day(today_str, final_pool)
+        trends.save_rollup(today_str, final_pool)
         print("✅ 모든 파이프라인 완료 및 데이터 저장 성공!")
     except Exception as e:
         print(f"🚨 저장 실패: {e}")
 
+# ==========================================
+# 💎 [헤드라인 사전 분석] MUST KNOW / Top Picks 1분 요약을 밤사이 미리 생성
+# ==========================================
+def pregenerate_analyses(client, final_pool):
+    """기본 설정 대시보드의 헤드라인 기사에 기본 페르소나/질문으로 만든 1분 요약을 붙여 둡니다.
+    대시보드는 사용자의 페르소나·질문이 기본값과 같을 때(캐시 키 일치) 이 결과를 즉시 보여줍니다."""
+    targets = board.headline_items(final_pool)
+
+    def worker(item):
+        text = llm.generate_text(client, llm.analysis_prompt(DEFAULT_AI_PROMPT, item), "preset_analysis", GEMS_PERSONA)
+        if not text: return False
+        item['preset_analysis'] = {
+            "key": analysis_cache.cache_key(item['id'], analysis_cache.KIND_BASIC, GEMS_PERSONA, DEFAULT_AI_PROMPT),
+            "text": text, "created_at": datetime.now().isoformat(),
+        }
+        return True
+
+    print(f"💎 헤드라인 기사 {len(targets)}개 1분 요약 사전 생성...")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        done = sum(1 for ok in executor.map(worker, targets) if ok)
+    print(f"💎 사전 분석 완료: {done}/{len(targets)}")
+    return done
+
+# ==========================================
+# 🧩 [샤딩] 샤드 실행 & 결정적(Deterministic) 병합
+# ==========================================
+def shard_path(shard_index, shard_count):
+    return os.path.join(SHARD_DIR, f"shard_{shard_index}_of_{shard_count}.json")
+
+def run_shard(shard_index, shard_count, shard_by="hash", candidate_limit=None, parse_workers=None, enrich_text=True):
+    """채널 일부만 수집 + 채점해서 부분 결과 파일을 남깁니다. 버즈 융합/저장은 병합 단계에서 전역으로 수행.
+    parse_workers: 피드 파싱 프로세스 수 (기본: 코어 수). 한 머신에서 샤드 여러 개를 돌릴 땐 코어를 나눠 씁니다.
+    enrich_text: 채점 후보의 원문 본문을 받아 채점 입력에 추가할지 (enrich.py)"""
+    print(f"🧩 [샤드 {shard_index + 1}/{shard_count}] 파이프라인 가동 (분배 기준: {shard_by})")
+    client = get_client()
+    if not client: return None
+    registry = load_channels()
+    if registry is None: return None
+
+    limit = datetime.now() - timedelta(days=3)
+    news_tasks, comm_tasks = build_tasks(registry, limit, shard_index, shard_count, shard_by)
+
+    print(f"📡 커뮤니티 데이터 수집 중... (채널 {len(comm_tasks)}개)")
+    raw_comm = records.to_dicts(dedup.dedup_by_url(fetch_all(comm_tasks, max_workers=10, parse_workers=parse_workers)))
+    print(f"📡 공식 뉴스 데이터 수집 중... (채널 {len(news_tasks)}개)")
+    raw_news = fetch_all(news_tasks, max_workers=20, parse_workers=parse_workers)
+    print(f"📰 수집된 원본 기사: {len(raw_news)}개 / 커뮤니티 글: {len(raw_comm)}개")
+
+    if candidate_limit is None: candidate_limit = math.ceil(CANDIDATE_LIMIT / shard_count)
+    raw_news = dedup.dedup_by_url(raw_news)
+    candidate_news, members_by_rep = prefilter_news(raw_news, load_prefs(), candidate_limit)
+    print(f"✂️ 제목/매체 연관도 Pre-filter 통과 기사: {len(candidate_news)}개")
+    if enrich_text: enrich.enrich(candidate_news)
+    processed_items = dedup.propagate_scores(score_candidates(client, candidate_news, load_prefs()), members_by_rep)
+
+    os.makedirs(SHARD_DIR, exist_ok=True)
+    out_path = shard_path(shard_index, shard_count)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump({"shard": shard_index, "shard_count": shard_count, "shard_by": shard_by, "date": datetime.now().isoformat(),
+                   "items": processed_items, "community": raw_comm, "parse_failures": llm.failure_summary()}, f, ensure_ascii=False)
+    print(f"💾 샤드 결과 저장: {out_path} (채점 {len(processed_items)}개)")
+    return out_path
+
+def merge_shards(shard_dir=SHARD_DIR, use_llm_labels=False, pregenerate=True, prefetch_thumbs=True, export_snapshot=True):
+    """모든 샤드 결과를 모아 중복 제거 → 전역 버즈 추출/융합 → today_news.json + 아카이브 저장."""
+    paths = sorted(glob.glob(os.path.join(shard_dir, "shard_*_of_*.json")))
+    if not paths:
+        print(f"🚨 에러: {shard_dir}/ 에 병합할 샤드 결과가 없습니다.")
+        return None
+
+    shards = []
+    for p in paths:
+        try:
+            with open(p, "r", encoding="utf-8") as f: shards.append(json.load(f))
+        except Exception as e: print(f"🚨 샤드 읽기 실패 {p}: {e}")
+    shards.sort(key=lambda s: s.get("shard", 0))
+
+    expected = max((s.get("shard_count", 1) for s in shards), default=0)
+    if len(shards) < expected:
+        print(f"⚠️ 샤드 {expected}개 중 {len(shards)}개만 도착했습니다. 도착한 결과만 병합합니다.")
+
+    # 💡 같은 기사가 여러 샤드에서 오면 점수가 높은 쪽, 동점이면 샤드 번호가 낮은 쪽을 남깁니다.
+    items_by_id = {}
+    comm_by_id = {}
+    for s in shards:
+        for item in s.get("items", []):
+            prev = items_by_id.get(item["id"])
+            if prev is None or item.get("score", 0) > prev.get("score", 0): items_by_id[item["id"]] = item
+        for item in s.get("community", []):
+            comm_by_id.setdefault(item["id"], item)
+
+    raw_comm = sorted(comm_by_id.values(), key=lambda x: (x['date_obj'], x['id']), reverse=True)
+    # 💡 샤드는 id 해시로 나뉘므로 같은 스토리의 다른 매체 기사가 서로 다른 샤드에서 따로 채점될 수 있습니다.
+    #    합집합에서 근접 중복을 다시 묶어 대표 기사 결과로 통일합니다 (단일 프로세스 실행과 같은 그룹핑).
+    merged_items = sorted(items_by_id.values(), key=lambda x: x['id'])
+    regrouped = dedup.merge_near_duplicates(merged_items)
+    if regrouped: print(f"🧬 샤드 간 근접 중복 {regrouped}건을 대표 기사 결과로 통일했습니다.")
+    failures = {}
+    for s in shards:
+        for kind, c in s.get("parse_failures", {}).items():
+            for k, v in c.items(): failures.setdefault(kind, {}).setdefault(k, 0); failures[kind][k] += v
+    if failures: print(f"📉 LLM 응답 실패 집계 (샤드 합계, failed=파싱·검증 / transport=API 오류): {failures}")
+    print(f"🔗 병합 결과: 채점 기사 {len(items_by_id)}개 / 커뮤니티 글 {len(raw_comm)}개 (샤드 {len(shards)}개)")
+
+    # 💡 버즈 융합은 로컬 계산이라 Gemini 없이도 게시합니다. 키가 없거나 클라이언트 생성에 실패하면
+    #    LLM 버즈 라벨과 헤드라인 사전 분석만 건너뜁니다.
+    try: client = get_client()
+    except Exception as e:
+        print(f"⚠️ Gemini 클라이언트 생성 실패: {e}")
+        client = None
+    if not client and (use_llm_labels or pregenerate): print("⚠️ Gemini 없이 병합합니다: 버즈 LLM 라벨/헤드라인 사전 분석 생략")
+    print(f"💬 수집된 커뮤니티 글: {len(raw_comm)}개. 로컬 버즈 분석 시작...")
+    buzz_weights = extract_buzz_keywords(client, raw_comm, use_llm_labels)
+
+    # 💡 오늘 게시분 키워드만 누적 카운트에 더해 별칭("GOOGLE GEMINI" → "GEMINI")을 갱신한 뒤 융합합니다.
+    learned = entities.learn_from_day(datetime.now().strftime("%Y-%m-%d"), merged_items)
+    print(f"🏷️ 학습된 엔티티 별칭: {len(learned)}개")
+    final_pool = fuse_buzz(merged_items, buzz_weights)
+    # 💡 채점 당시의 규칙 매칭 상태를 기록해 두면, 대시보드에서 규칙을 바꿨을 때 로컬 재정렬의 기준점이 됩니다.
+    rerank.tag_rule_hits(final_pool, load_prefs())
+    # 💡 스토리 클러스터링은 전 카테고리/전 샤드를 합친 뒤 한 번만 계산해서 기사에 저장합니다.
+    dedup.assign_clusters(final_pool)
+    if pregenerate and client: pregenerate_analyses(client, final_pool)
+    if prefetch_thumbs: thumbs.prefetch(final_pool)
+    publish(final_pool)
+    if export_snapshot:
+        try: snapshot.export(final_pool)
+        except Exception as e: print(f"🚨 정적 보드 스냅샷 저장 실패: {e}")
+    return final_pool
+
+def run_morning_batch(workers=1, shard_by="hash", use_llm_labels=False, pregenerate=True, enrich_text=True, prefetch_thumbs=True, export_snapshot=True):
+    print("🌅 [NGEPT 모닝 센싱 V2] 파이프라인 가동 시작...")
+    if not get_client(): return
+
+    # 💡 이전 실행의 샤드 파일이 섞이지 않도록 비우고 시작합니다.
+    for p in glob.glob(os.path.join(SHARD_DIR, "shard_*_of_*.json")): os.remove(p)
+
+    if workers <= 1:
+        run_shard(0, 1, shard_by, enrich_text=enrich_text)
+    else:
+        print(f"🧩 {workers}개 워커 프로세스로 채널을 분산 수집합니다.")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parse_workers = max(1, feeds.cpu_count() // workers)
+            futures = [executor.submit(run_shard, i, workers, shard_by, None, parse_workers, enrich_text) for i in range(workers)]
+            for f in as_completed(futures):
+                try: f.result()
+                except Exception as e: print(f"🚨 샤드 실행 실패: {e}")
+    merge_shards(use_llm_labels=use_llm_labels, pregenerate=pregenerate, prefetch_thumbs=prefetch_thumbs, export_snapshot=export_snapshot)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="NGEPT 모닝 센싱 배치")
+    parser.add_argument("--workers", type=int, default=1, help="로컬 멀티 프로세스 샤딩 수 (기본 1 = 단일 프로세스)")
+    parser.add_argument("--shard", help="CI 매트릭스 잡용 샤드 지정 (예: 0/4). 부분 결과만 shards/ 에 저장합니다.")
+    parser.add_argument("--shard-by", choices=["hash", "category"], default="hash", help="채널 분배 기준")
+    parser.add_argument("--candidates", type=int, help="샤드당 AI 채점 대상 수 (기본: 150 / 샤드 수)")
+    parser.add_argument("--merge", action="store_true", help="shards/ 의 부분 결과를 병합하여 최종 저장")
+    parser.add_argument("--llm-buzz-labels", action="store_true", help="로컬 버즈 상위 키워드를 Gemini로 라벨링 (선택)")
+    parser.add_argument("--no-enrich", action="store_true", help="채점 후보 원문 본문 보강을 건너뜀 (피드 요약만으로 채점)")
+    parser.add_argument("--no-thumbs", action="store_true", help="게시 기사 썸네일 사전 다운로드/축소를 건너뜀")
+    parser.add_argument("--no-snapshot", action="store_true", help="정적 보드 스냅샷(static/board/) 생성을 건너뜀")
+    parser.add_argument("--no-preanalysis", action="store_true", help="헤드라인 기사 1분 요약 사전 생성을 건너뜀")
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    run_morning_batch()
+    args = parse_args()
+    if args.merge:
+        merge_shards(use_llm_labels=args.llm_buzz_labels, pregenerate=not args.no_preanalysis, prefetch_thumbs=not args.no_thumbs, export_snapshot=not args.no_snapshot)
+    elif args.shard:
+        idx, count = (int(x) for x in args.shard.split("/"))
+        run_shard(idx, count, args.shard_by, args.candidates, enrich_text=not args.no_enrich)
+    else:
+        run_morning_batch(args.workers, args.shard_by, args.llm_buzz_labels, pregenerate=not args.no_preanalysis, enrich_text=not args.no_enrich, prefetch_thumbs=not args.no_thumbs, export_snapshot=not args.no_snapshot)
@@ -0,0 +1,274 @@
+import html
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import channels
+import thumbs
+
+# ==========================================
+# 🗂️ [보드 뷰모델] 기사 풀 → MUST KNOW / Top Picks / Stream 분할 + 카드 HTML 사전 렌더링
+# ==========================================
+# 💡 슬라이더/필터를 움직일 때마다 클러스터링·선정·HTML 조립을 다시 하지 않도록,
+#    대시보드는 이 모듈의 결과를 (데이터 버전, 설정) 키로 캐시해 두고 화면 배치만 다시 그립니다.
+#    Streamlit에 의존하지 않는 순수 함수라 정적 내보내기 등 다른 곳에서도 그대로 재사용할 수 있습니다.
+MUST_KNOW_COUNT = 3
+# 기본 화면 설정 (사용자 설정 기본값 & 모닝 배치의 헤드라인 예측에 공통 사용)
+DEFAULT_MIN_SCORE = 50
+DEFAULT_MAX_ARTICLES = 50
+DEFAULT_TOP_PICKS = 6
+DEFAULT_GLOBAL_RATIO = 70
+STREAM_PAGE_SIZE = 12       # 스트림은 한 화면(3열 x 4줄)씩 '더 보기'로 늘려 그림
+STREAM_FILTERS = {
+    "전체보기": lambda a: True,
+    "글로벌 혁신": lambda a: a.get('category') == 'Global Innovation',
+    "중국 동향": lambda a: a.get('category') == 'China & East Asia',
+    "일본/로보틱스": lambda a: a.get('category') == 'Japan & Robotics',
+    "커뮤니티 화제": lambda a: bool(a.get('community_buzz')),
+}
+
+def partition(news_list, total_picks, global_ratio):
+    """점수순 기사 목록 → (must_know, top_picks, stream). 클러스터는 파이프라인이 미리 계산한 cluster_id로 묶기만 합니다."""
+    clusters_by_id = {}
+    for item in news_list:
+        if item.get('category') == 'Global Innovation':
+            clusters_by_id.setdefault(item.get('cluster_id', item['id']), []).append(item)
+    clusters = list(clusters_by_id.values())
+    clusters.sort(key=lambda x: (len(x), max([a.get('score', 0) for a in x])), reverse=True)
+
+    must_know_items = []
+    used_ids = set()
+    for cluster in clusters[:MUST_KNOW_COUNT]:
+        best_item = max(cluster, key=lambda x: x.get('score', 0))
+        best_item['dup_count'] = len(cluster)
+        must_know_items.append(best_item)
+        for a in cluster: used_ids.add(a['id'])
+
+    remaining_news = [a for a in news_list if a['id'] not in used_ids]
+    global_target = int(total_picks * global_ratio)
+    china_target = total_picks - global_target
+
+    global_picks = [a for a in remaining_news if a['category'] == 'Global Innovation'][:global_target]
+    china_picks = [a for a in remaining_news if a['category'] == 'China & East Asia'][:china_target]
+    top_picks = global_picks + china_picks
+    for a in top_picks: used_ids.add(a['id'])
+
+    if len(top_picks) < total_picks:
+        pool = [a for a in remaining_news if a['id'] not in used_ids]
+        pool.sort(key=lambda x: x.get('score', 0), reverse=True)
+        fillers = pool[:total_picks - len(top_picks)]
+        top_picks += fillers
+        for a in fillers: used_ids.add(a['id'])
+
+    stream_news = [a for a in remaining_news if a['id'] not in used_ids]
+    return must_know_items, top_picks, stream_news
+
+def ranked_items(items, min_score=DEFAULT_MIN_SCORE, max_articles=DEFAULT_MAX_ARTICLES):
+    """대시보드에 올라갈 기사 목록. store.query_articles와 같은 순서: 점수 내림차순 → 최신순 → id"""
+    ranked = sorted((a for a in items if a.get('score', 0) >= min_score), key=lambda x: x['id'])
+    ranked.sort(key=lambda x: x.get('date_obj', ''), reverse=True)
+    ranked.sort(key=lambda x: x.get('score', 0), reverse=True)
+    return ranked[:max_articles]
+
+def headline_items(items, min_score=DEFAULT_MIN_SCORE, max_articles=DEFAULT_MAX_ARTICLES, total_picks=DEFAULT_TOP_PICKS, global_ratio=DEFAULT_GLOBAL_RATIO):
+    """기본 설정의 대시보드에서 MUST KNOW + Top Picks에 올라갈 기사들 (원본 기사 객체를 그대로 반환)."""
+    ranked = ranked_items(items, min_score, max_articles)
+    by_id = {a['id']: a for a in ranked}
+    must_know, top_picks, _ = partition([dict(a) for a in ranked], total_picks, global_ratio / 100.0)
+    return [by_id[a['id']] for a in must_know + top_picks]
+
+# 💡 [핵심 연동] 5차원 다면적 데이터 기반 Hero 카드 추천 이유 생성기
+def reason_text(item, has_prefs, now=None):
+    now = now or datetime.now()
+    reasons = []
+
+    # 1. 🧠 학습된 취향(RLHF) 및 AI 스코어링
+    score = item.get("score", 0)
+    if score >= 85 and has_prefs:
+        reasons.append(f"<div class='reason-text'>✔️ <b>맞춤형 타겟팅:</b> 팀장님이 지시하신 <span class='reason-highlight'>선호 기사 학습 규칙</span>에 정확히 부합하여 최고점({score}점)이 부여되었습니다.</div>")
+    elif score >= 90:
+        reasons.append(f"<div class='reason-text'>✔️ <b>핵심 트렌드:</b> AI 매칭 점수 <span class='reason-highlight'>{score}점</span>으로 NGEPT 전략에 매우 강하게 연결됩니다.</div>")
+    else:
+        reasons.append(f"<div class='reason-text'>✔️ <b>주요 동향:</b> AI 매칭 점수 <span class='reason-highlight'>{score}점</span>을 획득하여 유효한 큐레이션으로 선정되었습니다.</div>")
+
+    # 2. ⚡ 정보의 최신성 (Velocity)
+    try:
+        date_str = item.get("date_obj", "")
+        if date_str:
+            pub_date = datetime.fromisoformat(date_str.replace("Z", "+00:00")).replace(tzinfo=None)
+            hours_diff = (now - pub_date).total_seconds() / 3600
+            if 0 <= hours_diff <= 24:
+                reasons.append(f"<div class='reason-text'>✔️ <b>최신 속보:</b> 발행된 지 <span class='reason-highlight'>{max(1, int(hours_diff))}시간 이내</span>의 따끈따끈한 최신 업계 동향입니다.</div>")
+    except: pass
+
+    # 3. 🏢 매체의 권위 (Source Authority)
+    if item.get("is_tier1") or channels.is_tier1_source(item.get("source", "unknown")):
+        reasons.append(f"<div class='reason-text'>✔️ <b>매체 권위:</b> 글로벌 IT 트렌드를 선도하는 <span class='reason-highlight'>Tier 1 매체({_esc(item.get('source'))})</span>에서 다룬 심도 있는 기사입니다.</div>")
+    elif item.get("content_type") == "community":
+        reasons.append(f"<div class='reason-text'>✔️ <b>현장 반응:</b> 얼리어답터들이 모인 <span class='reason-highlight'>해외 긱(Geek) 커뮤니티</span>의 날것 그대로의 생생한 토론입니다.</div>")
+
+    # 4. 🏷️ AI 핵심 추출 키워드 (Topic Tags)
+    kws = item.get("keywords", [])
+    if kws:
+        formatted_kws = ", ".join([f"#{_esc(k)}" for k in kws[:3]])
+        reasons.append(f"<div class='reason-text'>✔️ <b>핵심 키워드:</b> <span class='reason-highlight'>{formatted_kws}</span> 테마를 강하게 내포하고 있어 차세대 기획에 유효합니다.</div>")
+
+    # 5. 📰 기사의 성격/유형 (Article Intent)
+    text_for_intent = (item.get("title_en", "") + " " + item.get("summary_en", "")).lower()
+    if any(w in text_for_intent for w in ['launch', 'unveil', 'release', 'announce', 'introduce', '출시', '공개']):
+        reasons.append("<div class='reason-text'>✔️ <b>기사 성격:</b> 단순 루머가 아닌, 기업의 <span class='reason-highlight'>[신규 폼팩터/서비스 공식 발표]</span> 데이터입니다.</div>")
+    elif any(w in text_for_intent for w in ['review', 'hands-on', 'test', '리뷰']):
+        reasons.append("<div class='reason-text'>✔️ <b>기사 성격:</b> 특정 제품 및 기술에 대한 전문가의 <span class='reason-highlight'>[심층 리뷰 및 벤치마크 분석]</span>이 포함되어 있습니다.</div>")
+    elif any(w in text_for_intent for w in ['earnings', 'revenue', 'q1', 'q2', 'q3', 'q4', 'profit', 'acquire', 'merger', '실적']):
+        reasons.append("<div class='reason-text'>✔️ <b>기사 성격:</b> 비즈니스 규모와 시장 장악력을 보여주는 <span class='reason-highlight'>[기업 실적 및 M&A 동향]</span>입니다.</div>")
+
+    # + 알파: 커뮤니티 버즈 및 중복 보도
+    if item.get("community_buzz"):
+        buzz_kws = _esc(", ".join(item.get("buzz_words", [])))
+        reasons.append(f"<div class='reason-text'>✔️ <b>소셜 화제성:</b> 소셜 미디어 상에서 <span class='reason-highlight'>{buzz_kws}</span> 관련 화제성이 급증해 가산점을 받았습니다.</div>")
+    if item.get("dup_count", 1) > 1:
+        reasons.append(f"<div class='reason-text'>✔️ <b>교차 검증:</b> <span class='reason-highlight'>{item['dup_count']}개 이상의 매체</span>에서 동시다발적으로 보도 중인 확실한 메가 트렌드입니다.</div>")
+
+    return "".join(reasons)
+
+# ==========================================
+# 🖼️ [카드 HTML] 섹션별 카드 마크업
+# ==========================================
+# 💡 카드/섹션 스타일은 대시보드와 정적 스냅샷(snapshot.py)이 같은 마크업을 쓰므로 여기서 한 벌만 관리합니다.
+CARD_CSS = """    .hero-banner { background: linear-gradient(135deg, #fdfbfb 0%, #ebedee 100%); padding: 1.2rem 2rem; border-radius: 12px; text-align: center; margin-bottom: 0.5rem; box-shadow: 0 4px 15px rgba(0,0,0,0.03); border: 1px solid #eaeaea; position: relative; }
+    .hero-badge { display: inline-block; background: #2c3e50; color: white; padding: 3px 10px; border-radius: 20px; font-size: 0.75rem; font-weight: bold; margin-bottom: 6px; letter-spacing: 1px; }
+    .hero-h1 { margin: 0; font-size: 2.1rem; font-weight: 900; background: linear-gradient(45deg, #1A2980 0%, #26D0CE 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; }
+    .hero-subtitle { margin-top: 5px; font-size: 1rem; color: #64748B; font-weight: 600; letter-spacing: -0.5px; margin-bottom: 0; }
+    
+    .hero-img-box { position: relative; border-radius: 8px; overflow: hidden; aspect-ratio: 4/3; margin-bottom: 5px; }
+    .hero-bg { position: absolute; top: 0; left: 0; width: 100%; height: 100%; object-fit: cover; z-index: 1; }
+    .hero-overlay { position: absolute; top: 0; left: 0; width: 100%; height: 100%; background: linear-gradient(to bottom, rgba(0,0,0,0.1) 0%, rgba(0,0,0,0.85) 100%); z-index: 2; }
+    .hero-content { position: absolute; bottom: 0; left: 0; width: 100%; padding: 15px; z-index: 3; color: white; }
+    
+    /* 💡 Feature 2: 5차원 추천 이유 오버레이 CSS */
+    .reason-icon { position: absolute; top: 12px; right: 12px; z-index: 15; background: rgba(255, 255, 255, 0.2); color: white; border-radius: 50%; width: 28px; height: 28px; display: flex; justify-content: center; align-items: center; font-size: 13px; cursor: help; backdrop-filter: blur(4px); border: 1px solid rgba(255,255,255,0.4); }
+    .reason-icon:hover { background: rgba(0, 114, 255, 0.8); }
+    .reason-overlay { position: absolute; top: 0; left: 0; width: 100%; height: 100%; background: rgba(15, 23, 42, 0.9); backdrop-filter: blur(5px); z-index: 14; opacity: 0; visibility: hidden; transition: all 0.3s ease; display: flex; flex-direction: column; justify-content: center; padding: 25px; box-sizing: border-box; text-align: left; }
+    .reason-icon:hover + .reason-overlay, .reason-overlay:hover { opacity: 1; visibility: visible; }
+    .reason-title { font-size: 0.95rem; font-weight: 800; color: #38BDF8; margin-bottom: 15px; }
+    .reason-text { font-size: 0.85rem; color: #E2E8F0; line-height: 1.5; margin-bottom: 6px; }
+    .reason-highlight { color: #BAE6FD; font-weight: 700; background: rgba(56, 189, 248, 0.15); padding: 1px 5px; border-radius: 4px; }
+    
+    .badge { display: inline-block; padding: 4px 10px; border-radius: 12px; font-size: 0.75rem; font-weight: 700; margin-bottom: 8px; margin-right: 6px; }
+    .badge-fire { background: #e74c3c; color: white; }
+    .badge-score { background: #34495e; color: white; }
+    .badge-global { background: #9b59b6; color: white; }
+    .badge-china { background: #e67e22; color: white; }
+    .badge-buzz { background: #f39c12; color: white; }
+    .badge-tag { background: #ecf0f1; color: #333; font-weight: 600; padding: 4px 12px; border-radius: 20px; font-size: 0.8rem; margin-right: 8px; display: inline-block; margin-bottom: 8px;}
+    .hero-title { font-size: 1.15rem; font-weight: 800; line-height: 1.3; margin-bottom: 8px; text-shadow: 0 1px 3px rgba(0,0,0,0.5); }
+    .section-header { font-size: 1.4rem; font-weight: 700; margin: 15px 0 10px 0; display: flex; align-items: center; gap: 10px; border-bottom: 2px solid #f0f0f0; padding-bottom: 8px; }
+    .section-desc { font-size: 1rem; color: #888; font-weight: normal; margin-left: 5px; }
+"""
+
+HERO_BANNER_HTML = """
+<div class="hero-banner">
+    <div class="hero-badge">AI-POWERED CURATION</div>
+    <h1 class="hero-h1">NGEPT Sensing Dashboard</h1>
+    <p class="hero-subtitle">차세대 경험기획팀 데일리 트렌드 분석</p>
+</div>
+"""
+
+# 💡 카드에는 피드에서 온 문자열(제목/요약/매체명/링크/키워드)이 들어가므로 전부 이스케이프합니다.
+#    공개 정적 보드(snapshot)에서 제목에 섞인 마크업이 그대로 실행되면 저장형 XSS가 됩니다.
+def _esc(value):
+    return html.escape(str(value if value is not None else ""), quote=True)
+
+def _href(url):
+    """링크 속성값: http(s)만 허용하고 (javascript: 등은 '#') 이스케이프합니다."""
+    url = str(url or "").strip()
+    try: ok = urlsplit(url).scheme in ("http", "https")
+    except ValueError: ok = False
+    return _esc(url) if ok else "#"
+
+def _thumb(item, width, base=None):
+    return _esc(thumbs.thumb_url(item, width, base=base))
+
+def _hero_html(item, badge_html, fallback_text, reason, thumb_base=None):
+    return (
+        '<div class="hero-img-box">'
+        f'<a href="{_href(item.get("link"))}" target="_blank" style="display:block; width:100%; height:100%;">'
+        f'<img src="{_thumb(item, 800, thumb_base)}" class="hero-bg" onerror="this.src=\'https://via.placeholder.com/800x600/1a1a1a/ffffff?text={fallback_text}\';">'
+        '<div class="hero-overlay"></div>'
+        '</a>'
+        '<div class="reason-icon" title="추천 이유 확인">💡</div>'
+        '<div class="reason-overlay">'
+        '<div class="reason-title">🎯 Why Recommended?</div>'
+        f'{reason}'
+        '</div>'
+        '<div class="hero-content">'
+        f'{badge_html}'
+        f'<div class="hero-title">{_esc(item.get("insight_title", item.get("title_en", "")))}</div>'
+        '</div></div>'
+    )
+
+def must_know_html(item, reason, thumb_base=None):
+    dup_badge = f"🔥 {item['dup_count']}개 매체 중복 보도" if item.get('dup_count', 1) > 1 else "🔥 글로벌 핫트렌드"
+    buzz_badge = f"<span class='badge badge-buzz' title='커뮤니티 언급: {_esc(', '.join(item.get('buzz_words', [])))}'>💬 긱(Geek) 화제</span>" if item.get('community_buzz') else ""
+    badges = f'<span class="badge badge-fire">{dup_badge}</span> <span class="badge badge-score">MATCH {item.get("score", 0)}%</span> {buzz_badge}'
+    return _hero_html(item, badges, "MUST+KNOW", reason, thumb_base)
+
+def top_pick_html(item, reason, thumb_base=None):
+    cat_badge = "<span class='badge badge-global'>🌐 Global</span>" if item['category'] == 'Global Innovation' else ("<span class='badge badge-china'>🇨🇳 China</span>" if item['category'] == 'China & East Asia' else f"<span class='badge' style='background:#7f8c8d;'>{_esc(item['category'][:6])}</span>")
+    buzz_badge = f"<span class='badge badge-buzz' title='커뮤니티 언급: {_esc(', '.join(item.get('buzz_words', [])))}'>💬 커뮤니티 화제</span>" if item.get('community_buzz') else ""
+    badges = f'{cat_badge} <span class="badge badge-score">MATCH {item.get("score", 0)}%</span> {buzz_badge}'
+    return _hero_html(item, badges, "TOP+PICK", reason, thumb_base)
+
+def source_meta_html(item):
+    return f"""
+                        <div style='display: flex; flex-direction: column; justify-content: center;'>
+                            <a href='{_href(item.get("link"))}' target='_blank' style='color:#1E293B; font-weight:800; font-size: 0.85rem; text-decoration:none; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; line-height: 1.2;'>📰 {_esc(item.get("source", "Source"))}</a>
+                            <span style='font-size: 0.7rem; color: #64748B; margin-top: 3px;'>{_esc(item.get("date", ""))}</span>
+                        </div>
+                        """
+
+def date_meta_html(item):
+    return f"""
+                            <div style='display: flex; flex-direction: column; justify-content: center;'>
+                                <span style='font-size: 0.7rem; color: #64748B; margin-top: 3px;'>{_esc(item.get("date", ""))}</span>
+                            </div>
+                            """
+
+def stream_card_html(item, thumb_base=None):
+    buzz_tag = "<span style='background:#f39c12; color:white; padding:2px 6px; border-radius:8px; font-size:0.65rem; font-weight:bold; margin-left:5px;'>💬 화제</span>" if item.get('community_buzz') else ""
+    return (
+        '<div style="display:flex; justify-content:space-between; align-items:center; margin-bottom:12px;">'
+        '<div style="display:flex; align-items:center; gap:8px;">'
+        '<div style="width:24px; height:24px; background:#f0f2f5; border-radius:50%; display:flex; justify-content:center; align-items:center; font-size:12px;">📰</div>'
+        f'<a href="{_href(item.get("link"))}" target="_blank" style="font-weight:800; font-size:0.95rem; color:#1E293B; text-decoration:none;">{_esc(item.get("source", "Source"))}</a>'
+        '</div><div>'
+        f'<span style="background-color:#E3F2FD; color:#1565C0; padding:4px 8px; border-radius:12px; font-size:0.7rem; font-weight:700;">MATCH {item.get("score", 0)}%</span> '
+        f'{buzz_tag}'
+        '</div></div>'
+        f'<a href="{_href(item.get("link"))}" target="_blank">'
+        f'<img src="{_thumb(item, 600, thumb_base)}" loading="lazy" decoding="async" style="width:100%; aspect-ratio:16/9; object-fit:cover; border-radius:8px; display:block; margin-bottom:12px;" onerror="this.src=\'https://via.placeholder.com/600x338?text=No+Image\';">'
+        f'</a>'
+        f'<div style="font-weight:700; font-size:1.05rem; line-height:1.4; color:#262626; margin-bottom:8px;">💡 {_esc(item.get("insight_title", item.get("title_en", "")))}</div>'
+        f'<div style="font-size:0.85rem; color:#444; line-height:1.5; margin-bottom:12px;">{_esc(item.get("core_summary", item.get("summary_ko", "")))}</div>'
+    )
+
+def build_view(news_list, total_picks, global_ratio, has_prefs, now=None, thumb_base=None):
+    """화면 한 장에 필요한 모든 것을 한 번에 계산합니다: 섹션 분할, 카드 HTML, 스트림 필터별 인덱스.
+    thumb_base: 로컬 썸네일 주소 접두어 (기본은 Streamlit 정적 서빙 경로, 정적 스냅샷은 상대 경로)"""
+    must_know, top_picks, stream = partition(news_list, total_picks, global_ratio)
+    for item in must_know:
+        item['card_html'] = must_know_html(item, reason_text(item, has_prefs, now), thumb_base)
+        item['meta_html'] = source_meta_html(item)
+    for item in top_picks:
+        item['card_html'] = top_pick_html(item, reason_text(item, has_prefs, now), thumb_base)
+        item['meta_html'] = source_meta_html(item)
+    for item in stream:
+        item['card_html'] = stream_card_html(item, thumb_base)
+        item['meta_html'] = date_meta_html(item)
+    return {
+        "must_know": must_know,
+        "top_picks": top_picks,
+        "stream": stream,
+        "stream_filters": {name: [i for i, a in enumerate(stream) if match(a)] for name, match in STREAM_FILTERS.items()},
+        "total_picks": total_picks,
+        "count": len(news_list),
+    }
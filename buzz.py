@@ -0,0 +1,170 @@
+import json
+import math
+import os
+import re
+from datetime import datetime
+
+import entities
+
+# ==========================================
+# 💬 [로컬 버즈 엔진] 커뮤니티 전체 글 n-gram 빈도 × 시간 감쇠 × 과거 대비 신규성
+# ==========================================
+# 💡 LLM에 제목 100개만 던지던 방식 대신, 수집된 모든 커뮤니티 글을 로컬에서 집계합니다.
+#    결과는 morning_buzz.json에 {키워드: 가중치(0~1)}로 저장되고 버즈 융합 단계에서 가중 가산점으로 쓰입니다.
+BUZZ_FILE = "morning_buzz.json"
+HALF_LIFE_HOURS = 12        # 12시간 지난 글은 절반 가중치
+BASELINE_ALPHA = 0.3        # 과거 버즈 기준선(EMA) 갱신 비율
+TOP_N = 30
+MAX_NGRAM = 3
+BUZZ_MAX_BOOST = 8          # 가중치 1.0 키워드 1개 매칭 시 최대 가산점
+
+STOPWORDS = {
+    'a', 'an', 'the', 'and', 'or', 'but', 'of', 'to', 'in', 'on', 'for', 'with', 'at', 'by', 'from', 'as', 'is', 'are',
+    'was', 'were', 'be', 'been', 'it', 'its', 'this', 'that', 'these', 'those', 'i', 'you', 'we', 'they', 'he', 'she',
+    'my', 'your', 'our', 'their', 'me', 'us', 'them', 'what', 'why', 'how', 'when', 'where', 'who', 'which', 'can',
+    'could', 'would', 'should', 'will', 'do', 'does', 'did', 'not', 'no', 'yes', 'just', 'any', 'anyone', 'some',
+    'new', 'now', 'out', 'up', 'about', 'into', 'than', 'then', 'so', 'if', 'get', 'got', 'has', 'have', 'had',
+    'there', 'here', 'all', 'more', 'most', 'one', 'also', 'like', 'vs', 'via', 'after', 'before', 'over', 'only',
+    'really', 'still', 'even', 'way', 'make', 'made', 'use', 'using', 'help', 'need', 'question', 'best', 'good',
+    'first', 'people', 'think', 'know', 'today', 'year', 'years', 'day', 'days', 'time', 'thing', 'things', 'being',
+    'reddit', 'discussion', 'thread', 'weekly', 'daily', 'megathread', 'hn', 'ask', 'show', 'tell', 'tech',
+    'week', 'month', 'buy', 'worth', 'price', 'update', 'issue', 'problem', 'looking', 'recommendation', 'advice',
+}
+_TOKEN_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9\+\-\.']*[A-Za-z0-9\+]|[A-Za-z0-9]|[぀-ヿ㐀-鿿가-힯]{2,}")
+
+def _tokens(title):
+    return [t.lower().strip(".'") for t in _TOKEN_RE.findall(str(title or ""))]
+
+def _is_term_token(t):
+    return t not in STOPWORDS and (len(t) > 1 or t.isdigit()) and not re.fullmatch(r'\d{1,2}', t)
+
+def extract_terms(title):
+    """제목 1개 → 후보 키워드 집합 (불용어가 끼지 않은 연속 1~3그램)."""
+    toks = _tokens(title)
+    terms = set()
+    for n in range(1, MAX_NGRAM + 1):
+        for i in range(len(toks) - n + 1):
+            gram = toks[i:i + n]
+            if all(_is_term_token(t) for t in gram) and not all(t.isdigit() for t in gram):
+                terms.add(" ".join(gram).upper())
+    return terms
+
+def _age_hours(item, now):
+    try: return max(0.0, (now - datetime.fromisoformat(item.get('date_obj', ''))).total_seconds() / 3600)
+    except: return 0.0
+
+def load_buzz(path=BUZZ_FILE):
+    if not os.path.exists(path): return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f: return json.load(f)
+    except: return {}
+
+def buzz_weights(buzz_data):
+    """morning_buzz.json → {키워드: 가중치}. 가중치가 없던 예전 파일은 키워드마다 1.0."""
+    weights = buzz_data.get("weights")
+    if weights: return {k.upper(): float(v) for k, v in weights.items()}
+    return {str(k).upper(): 1.0 for k in buzz_data.get("keywords", [])}
+
+def compute_buzz(community_items, previous=None, now=None, top_n=TOP_N):
+    """모든 커뮤니티 글을 훑어 (가중치 dict, 다음날용 기준선 dict)를 반환합니다.
+
+    term 점수 = Σ(글마다 시간 감쇠 가중치) × 매체 다양성 보정, 이후 과거 기준선 대비 신규성으로 나눠 줍니다.
+    """
+    now = now or datetime.now()
+    previous = previous or {}
+    decay = math.log(2) / HALF_LIFE_HOURS
+
+    raw = {}
+    posts = {}
+    sources = {}
+    for item in community_items:
+        w = math.exp(-decay * _age_hours(item, now))
+        for term in extract_terms(item.get('title_en', '')):
+            raw[term] = raw.get(term, 0.0) + w
+            posts[term] = posts.get(term, 0) + 1
+            sources.setdefault(term, set()).add(item.get('source', ''))
+
+    # 한 번만 언급된 단어는 잡음이 대부분이라 2개 이상 글에서 나온 term만 남기고, 여러 커뮤니티에서 나오면 가점.
+    raw = {t: v * (1 + 0.5 * math.log(len(sources[t]))) for t, v in raw.items() if posts[t] >= 2}
+
+    baseline = previous.get("baseline", {})
+    scored = {}
+    for term, v in raw.items():
+        base = baseline.get(term, 0.0)
+        novelty = v / (v + base) if base else 1.0
+        scored[term] = v * novelty * (1 + 0.25 * (term.count(" ")))   # 구(phrase)에 약간의 우대
+
+    # 💡 이미 뽑힌 구에 포함되는 단어(예: 'VISION PRO' 뒤의 'VISION')는 중복 선정하지 않습니다.
+    selected = []
+    for term in sorted(scored, key=lambda t: (-scored[t], t)):
+        parts = set(term.split())
+        if any(parts <= set(s.split()) or set(s.split()) <= parts for s in selected): continue
+        selected.append(term)
+        if len(selected) >= top_n: break
+
+    top = scored[selected[0]] if selected else 1.0
+    weights = {t: round(scored[t] / top, 3) for t in selected}
+
+    new_baseline = {t: round((1 - BASELINE_ALPHA) * b, 4) for t, b in baseline.items()}
+    for term, v in raw.items():
+        new_baseline[term] = round(new_baseline.get(term, 0.0) + BASELINE_ALPHA * v, 4)
+    new_baseline = {t: b for t, b in new_baseline.items() if b >= 0.05}
+    return weights, new_baseline
+
+def label_with_llm(client, weights, community_items):
+    """(선택) 상위 키워드를 사람이 읽기 좋은 이름으로 다듬습니다. 실패하면 원래 키워드를 그대로 씁니다."""
+    import llm
+    if not weights: return {}
+    terms = list(weights.keys())[:15]
+    sample = "\n".join(f"- {i['title_en']}" for i in community_items if extract_terms(i.get('title_en', '')) & set(terms))[:4000]
+    prompt = ("당신은 IT 트렌드 분석가입니다. 아래 [키워드]는 커뮤니티 글에서 통계적으로 뽑힌 화제 키워드입니다.\n"
+              "[게시글 샘플]을 참고해 각 키워드를 기업/제품/기술명 형태의 짧은 라벨로 정리하세요. 의미 없는 키워드는 빈 문자열로 두세요.\n"
+              f"[키워드]\n{json.dumps(terms, ensure_ascii=False)}\n[게시글 샘플]\n{sample}\n\n"
+              '[출력 형식]\n{"labels": [{"keyword": "원래 키워드", "label": "라벨"}, ...]}')
+    labels = llm.generate_json(client, prompt, llm.BUZZ_LABEL_SCHEMA, llm.validate_labels, "buzz_labels")
+    if labels is None:
+        print("버즈 라벨링 실패 (통계 키워드 그대로 사용)")
+        return {}
+    return {k: v for k, v in labels.items() if k in weights}
+
+def save_buzz(weights, baseline, labels=None, path=BUZZ_FILE):
+    data = {
+        "date": datetime.now().isoformat(),
+        "keywords": list(weights.keys())[:15],   # 예전 포맷 호환 (상위 15개)
+        "weights": weights,
+        "baseline": baseline,
+    }
+    if labels: data["labels"] = labels
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    return data
+
+# ==========================================
+# 🎯 [버즈 융합] 기사 키워드 × 버즈 가중치 → 가산점
+# ==========================================
+def canonical_weights(weights, index=None):
+    """버즈 키워드를 대표 엔티티로 접어서 {대표 키: 가중치} (같은 엔티티면 큰 가중치 유지)."""
+    index = index or entities.get_index()
+    folded = {}
+    for k, w in weights.items():
+        c = entities.canonical(k, index)
+        if w > folded.get(c, 0.0): folded[c] = w
+    return folded
+
+def fuse(items, weights):
+    # 💡 별칭 역색인으로 버즈 쪽은 한 번만 정규화 → 기사 키워드마다 dict 조회 2번(별칭→대표, 대표→가중치)으로 끝.
+    index = entities.get_index()
+    weights = canonical_weights(weights, index)
+    for item in items:
+        news_kws = {entities.canonical(k, index) for k in item.get('keywords', []) or []}
+        overlap = sorted(k for k in news_kws if k in weights)
+        if overlap:
+            boost = sum(max(1, round(BUZZ_MAX_BOOST * weights[k])) for k in overlap)
+            item['score'] = min(100, item['score'] + boost)
+            item['buzz_boost'] = boost
+            item['community_buzz'] = True
+            item['buzz_words'] = overlap
+        else:
+            item['buzz_boost'] = 0
+            item['community_buzz'] = False
+    return items
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+# ==========================================
+# 📻 [채널 레지스트리] channels.json → 분류 메타데이터를 미리 계산한 채널 목록
+# ==========================================
+# 💡 커뮤니티 판별(URL/매체명 부분 문자열 검사)과 Tier 1 판별을 기사마다 반복하지 않고,
+#    채널 파일을 읽을 때 채널별로 한 번만 계산해 둡니다. 기사에는 channel_id만 붙이고
+#    이후 단계는 registry["by_id"][channel_id] 로 O(1) 조회합니다.
+#    channels.json의 채널 항목에 type / tier / lang / region 을 직접 적으면 자동 판별보다 우선합니다.
+CHANNELS_FILE = "channels.json"
+COMMUNITY_DOMAINS = ['reddit', 'v2ex', 'hacker news', 'ycombinator', 'clien', 'dcinside', 'blind']
+TIER1_SOURCES = ['techcrunch', 'verge', 'wired', 'bloomberg', 'cnbc', 'wsj', 'reuters', 'engadget', 'nikkei', 'gizmodo', 'the information']
+CHANNEL_TYPES = ('news', 'community')
+
+# 카테고리 기본 언어/지역 (채널에 명시값이 없고 도메인으로도 알 수 없을 때)
+CATEGORY_LOCALE = {
+    'Global Innovation': ('en', 'global'),
+    'China & East Asia': ('zh', 'east_asia'),
+    'Japan & Robotics': ('ja', 'japan'),
+}
+TLD_LOCALE = {'jp': ('ja', 'japan'), 'cn': ('zh', 'china'), 'kr': ('ko', 'korea'), 'tw': ('zh', 'taiwan')}
+
+def channel_id(url):
+    """채널 URL → 8자리 고정 id (샤드 분배와 같은 md5 기반이라 프로세스/실행마다 같음)."""
+    return hashlib.md5(url.strip().encode()).hexdigest()[:8]
+
+def is_community(name, url):
+    name_lower, url_lower = name.lower(), url.lower()
+    return any(d in url_lower or d in name_lower for d in COMMUNITY_DOMAINS)
+
+@lru_cache(maxsize=4096)
+def is_tier1_source(source):
+    """매체명 → Tier 1 여부. 채널 id가 없는 예전 기사용 (매체명 단위로 캐시)."""
+    source_lower = (source or "").lower()
+    return any(t in source_lower for t in TIER1_SOURCES)
+
+def _locale(category, name, url):
+    if "(english)" in name.lower(): return ('en', CATEGORY_LOCALE.get(category, ('en', 'global'))[1])
+    host = urlsplit(url).hostname or ""
+    tld = host.rsplit(".", 1)[-1]
+    if tld in TLD_LOCALE: return TLD_LOCALE[tld]
+    return CATEGORY_LOCALE.get(category, ('en', 'global'))
+
+def _entry_errors(f):
+    """채널 항목 1개 검사 → 오류 메시지 리스트 (name/url이 있다는 전제)."""
+    errors = []
+    if urlsplit(f["url"].strip()).scheme not in ("http", "https"):
+        errors.append(f"URL이 http(s)가 아닙니다: {f['url']}")
+    if f.get("type") and f["type"] not in CHANNEL_TYPES:
+        errors.append(f"type은 {CHANNEL_TYPES} 중 하나여야 합니다.")
+    if f.get("tier") is not None and f["tier"] not in (1, 2):
+        errors.append("tier는 1 또는 2여야 합니다.")
+    return errors
+
+def _has_name_url(f):
+    return isinstance(f, dict) and str(f.get("name", "")).strip() and str(f.get("url", "")).strip()
+
+def validate(channels_data):
+    """파일 구조 검사 → 오류 메시지 리스트 (비어 있으면 정상)."""
+    if not isinstance(channels_data, dict): return ["최상위는 {카테고리: [채널, ...]} 형태여야 합니다."]
+    errors = []
+    seen = {}
+    for cat, feeds in channels_data.items():
+        if not isinstance(feeds, list):
+            errors.append(f"[{cat}] 채널 목록이 리스트가 아닙니다.")
+            continue
+        for i, f in enumerate(feeds):
+            where = f"[{cat}] #{i + 1}"
+            if not _has_name_url(f):
+                errors.append(f"{where} name/url이 없습니다.")
+                continue
+            errors.extend(f"{where} ({f['name']}) {e}" for e in _entry_errors(f))
+            url = f["url"].strip()
+            if url in seen: errors.append(f"{where} ({f['name']}) URL 중복: {seen[url]}")
+            else: seen[url] = f"[{cat}] {f['name']}"
+    return errors
+
+def compile_registry(channels_data):
+    """{카테고리: [채널]} → {"channels": [채널 정보], "by_id": {id: 채널 정보}, "errors": [...]}.
+    형식이 잘못된 항목(name/url 누락, http(s)가 아닌 URL, 모르는 type, 1/2가 아닌 tier)은 건너뛰고 errors에 남깁니다.
+    (같은 URL이 여러 카테고리에 있으면 먼저 나온 쪽만 사용)"""
+    errors = validate(channels_data)
+    registry = {"channels": [], "by_id": {}, "errors": errors}
+    if not isinstance(channels_data, dict): return registry
+    for cat, feeds in channels_data.items():
+        if not isinstance(feeds, list): continue
+        for f in feeds:
+            if not _has_name_url(f) or _entry_errors(f): continue
+            cid = channel_id(f["url"])
+            if cid in registry["by_id"]: continue
+            lang, region = _locale(cat, f["name"], f["url"])
+            info = {
+                "id": cid,
+                "name": f["name"],
+                "url": f["url"].strip(),
+                "category": cat,
+                "active": f.get("active", True),
+                "type": f.get("type") or ('community' if is_community(f["name"], f["url"]) else 'news'),
+                "tier": f.get("tier") or (1 if is_tier1_source(f["name"]) else 2),
+                "lang": f.get("lang") or lang,
+                "region": f.get("region") or region,
+            }
+            registry["channels"].append(info)
+            registry["by_id"][cid] = info
+    return registry
+
+# 💡 대시보드는 매 rerun마다 같은 채널 dict를 넘기므로, 내용 해시가 같으면 컴파일 결과를 그대로 돌려줍니다.
+_REGISTRY = None
+_REGISTRY_KEY = None
+
+def registry(channels_data):
+    global _REGISTRY, _REGISTRY_KEY
+    digest = hashlib.md5(json.dumps(channels_data, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+    if _REGISTRY is None or digest != _REGISTRY_KEY:
+        _REGISTRY = compile_registry(channels_data)
+        _REGISTRY_KEY = digest
+        for e in _REGISTRY["errors"]: print(f"⚠️ channels.json: {e}")
+    return _REGISTRY
+
+def load(path=CHANNELS_FILE):
+    """파일에서 읽어 컴파일된 레지스트리 반환. 읽기 실패 시 None."""
+    if not os.path.exists(path): return None
+    try:
+        with open(path, "r", encoding="utf-8") as f: return registry(json.load(f))
+    except Exception as e:
+        print(f"🚨 에러: {path} 읽기 실패 {e}")
+        return None
+
+def channel_of(item, reg):
+    """기사 → 채널 정보 (channel_id가 없거나 모르는 채널이면 None)."""
+    return reg["by_id"].get(item.get('channel_id'))
+
+def item_type(item, reg):
+    ch = channel_of(item, reg)
+    if ch: return ch["type"]
+    return 'community' if is_community(item.get('source', ''), item.get('link', '')) else 'news'
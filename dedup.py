@@ -0,0 +1,207 @@
+import hashlib
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# ==========================================
+# 🔗 [URL 정규화] 트래킹 파라미터 제거 & 기사 ID 생성
+# ==========================================
+# 💡 이름만으로 확실한 트래킹 키만 지웁니다. id / p / source 처럼 기사 자체를 가리킬 수 있는 파라미터를 지우면
+#    서로 다른 기사가 같은 id가 되어 저장소/아카이브에서 한쪽이 조용히 덮어써집니다.
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'yclid', 'twclid', 'ttclid', 'igshid', 'li_fat_id',
+    '_hsenc', '_hsmi', 'mkt_tok', 'ncid', 'cmpid', 'sr_share', 'smid', 'soc_src', 'soc_trk', 'taid', 'guccounter',
+    'ref_src', 'yptr', 'traffic_source', 'oly_anon_id', 'oly_enc_id', 'vero_id',
+}
+TRACKING_PREFIXES = ('utm_', 'mc_', 'guce_', 'hsa_')
+# 일반적인 이름(src/ref/source ...)은 값이 피드/공유 표시일 때만 트래킹으로 봅니다 (예: Engadget ?src=rss)
+FEED_MARKER_PARAMS = {'src', 'ref', 'source', 'feed', 'via'}
+FEED_MARKER_VALUES = {'rss', 'rss2', 'atom', 'feed', 'feeds', 'feedburner', 'twitter', 'facebook', 'share'}
+
+def _is_tracking(key, value):
+    key = key.lower()
+    if key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES): return True
+    return key in FEED_MARKER_PARAMS and value.lower() in FEED_MARKER_VALUES
+
+def canonical_url(url):
+    """같은 기사를 가리키는 URL을 하나의 형태로 맞춥니다 (?src=rss, utm_*, www., 끝 슬래시, #fragment 등 제거)."""
+    if not url: return ""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    scheme = "https" if parts.scheme in ("http", "https", "") else parts.scheme.lower()
+    host = parts.netloc.lower()
+    if host.startswith("www."): host = host[4:]
+    if host.endswith(":80") or host.endswith(":443"): host = host.rsplit(":", 1)[0]
+    path = re.sub(r'/{2,}', '/', parts.path or "/")
+    if len(path) > 1 and path.endswith("/"): path = path[:-1]
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking(k, v)]
+    return urlunsplit((scheme, host, path, urlencode(sorted(query)), ""))
+
+def article_id(url):
+    return hashlib.md5(canonical_url(url).encode()).hexdigest()[:12]
+
+def dedup_by_url(items):
+    """정규화된 URL(=id)이 같은 기사는 먼저 들어온 1건만 남깁니다. (TechCrunch ↔ TechCrunch Startups 피드 중복 등)"""
+    seen = set()
+    unique = []
+    for item in items:
+        if item['id'] in seen: continue
+        seen.add(item['id'])
+        unique.append(item)
+    return unique
+
+# ==========================================
+# 🧬 [MinHash] 제목 Shingle 기반 근접 중복(신디케이션) 탐지
+# ==========================================
+NUM_PERM = 64
+LSH_BANDS = 16              # 16 밴드 × 4 행 → 자카드 유사도 약 0.5부터 후보로 잡힘
+NEAR_DUP_THRESHOLD = 0.5
+_MERSENNE = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+def _perm_params(n):
+    params = []
+    for i in range(n):
+        h = hashlib.blake2b(f"minhash-{i}".encode(), digest_size=16).digest()
+        params.append((int.from_bytes(h[:8], "big") % (_MERSENNE - 1) + 1, int.from_bytes(h[8:], "big") % _MERSENNE))
+    return params
+
+_PERMS = _perm_params(NUM_PERM)
+
+def normalize_title(text):
+    text = str(text or "").lower()
+    text = re.sub(r'\s+[-|–—]\s+[^-|–—]{1,40}$', '', text)   # " - The Verge" 같은 매체명 꼬리 제거
+    return re.sub(r'[^\w]+', ' ', text).strip()
+
+def shingles(text, k=4):
+    """문자 k-gram shingle. 띄어쓰기가 없는 중국어/일본어 제목에도 그대로 동작합니다."""
+    norm = normalize_title(text)
+    if len(norm) <= k: return {norm} if norm else set()
+    return {norm[i:i + k] for i in range(len(norm) - k + 1)}
+
+def minhash_signature(shingle_set):
+    if not shingle_set: return None
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big") & _MAX_HASH for s in shingle_set]
+    return tuple(min((a * h + b) % _MERSENNE for h in hashes) & _MAX_HASH for a, b in _PERMS)
+
+def estimate_jaccard(sig_a, sig_b):
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+def lsh_candidate_pairs(signatures, bands=LSH_BANDS):
+    rows = NUM_PERM // bands
+    pairs = set()
+    for b in range(bands):
+        buckets = {}
+        for idx, sig in enumerate(signatures):
+            if sig is None: continue
+            buckets.setdefault(sig[b * rows:(b + 1) * rows], []).append(idx)
+        for members in buckets.values():
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    pairs.add((members[i], members[j]))
+    return pairs
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def group_near_duplicates(items, threshold=NEAR_DUP_THRESHOLD, text_key='title_en'):
+    """제목이 거의 같은 기사끼리 묶어 그룹 리스트를 반환합니다. 각 그룹의 첫 번째가 대표 기사입니다."""
+    signatures = [minhash_signature(shingles(item.get(text_key, ''))) for item in items]
+    parent = list(range(len(items)))
+    for i, j in lsh_candidate_pairs(signatures):
+        if estimate_jaccard(signatures[i], signatures[j]) >= threshold:
+            ri, rj = _find(parent, i), _find(parent, j)
+            if ri != rj: parent[max(ri, rj)] = min(ri, rj)
+
+    groups = {}
+    for idx in range(len(items)):
+        groups.setdefault(_find(parent, idx), []).append(items[idx])
+
+    # 💡 대표 기사: Tier 1 → 초벌 점수 → 요약이 풍부한 기사 → id 순 (매 실행마다 같은 결과)
+    def rep_key(x):
+        return (not x.get('is_tier1', False), -x.get('pre_score', 0), -len(x.get('summary_en', '')), x['id'])
+    return [sorted(g, key=rep_key) for g in groups.values()]
+
+# ==========================================
+# 📋 [결과 전파] 대표 기사 채점 결과를 같은 그룹 기사에 복사
+# ==========================================
+PROPAGATED_FIELDS = ('content_type', 'score', 'insight_title', 'core_summary', 'keywords', 'score_failed')
+
+def propagate_scores(scored_reps, members_by_rep):
+    results = []
+    for rep in scored_reps:
+        results.append(rep)
+        for member in members_by_rep.get(rep['id'], []):
+            for k in PROPAGATED_FIELDS:
+                if k in rep: member[k] = rep[k]
+            member['dup_of'] = rep['id']
+            results.append(member)
+    return results
+
+def merge_near_duplicates(items, threshold=NEAR_DUP_THRESHOLD):
+    """샤드 병합용: 서로 다른 샤드에 떨어져 따로 채점된 근접 중복 기사를 합집합 위에서 다시 묶고,
+    그룹 대표(채점 성공 기사 우선, 그다음 group_near_duplicates의 대표 순서)의 결과로 통일합니다.
+    items를 제자리에서 갱신하고, 결과가 바뀐 기사 수를 반환합니다."""
+    changed = 0
+    for group in group_near_duplicates(items, threshold):
+        if len(group) < 2: continue
+        rep = min(group, key=lambda x: bool(x.get('score_failed')))   # min은 동률이면 앞쪽(원래 대표 순서) 유지
+        rep.pop('dup_of', None)
+        for member in group:
+            if member is rep: continue
+            if any(member.get(k) != rep.get(k) for k in PROPAGATED_FIELDS): changed += 1
+            for k in PROPAGATED_FIELDS:
+                if k in rep: member[k] = rep[k]
+                else: member.pop(k, None)
+            member['dup_of'] = rep['id']
+    return changed
+
+def split_representatives(items, threshold=NEAR_DUP_THRESHOLD):
+    """(대표 기사 리스트, {대표 id: [나머지 멤버]}) 반환. 대표만 LLM 채점하고 결과는 propagate_scores로 전파합니다."""
+    reps = []
+    members_by_rep = {}
+    for group in group_near_duplicates(items, threshold):
+        reps.append(group[0])
+        if len(group) > 1: members_by_rep[group[0]['id']] = group[1:]
+    return reps, members_by_rep
+
+# ==========================================
+# 🗂️ [스토리 클러스터링] 같은 이슈를 다룬 기사 묶기 (MUST KNOW 용)
+# ==========================================
+STORY_LSH_BANDS = 32        # 32 밴드 × 2 행 → 겹치는 단어가 적은 짧은 제목 쌍도 후보로 잡힘
+STORY_OVERLAP_THRESHOLD = 0.4
+STOPWORDS = {
+    'a', 'an', 'the', 'and', 'or', 'but', 'of', 'to', 'in', 'on', 'for', 'with', 'at', 'by', 'from', 'as', 'is', 'are',
+    'was', 'be', 'its', 'it', 'this', 'that', 'new', 'how', 'why', 'what', 'you', 'your', 'can', 'will', 'now', 'after',
+}
+
+def title_words(text):
+    return {w for w in re.findall(r'\w+', str(text).lower()) if w not in STOPWORDS}
+
+def assign_clusters(items, threshold=STORY_OVERLAP_THRESHOLD):
+    """전체 풀에 cluster_id / cluster_size를 한 번만 계산해 붙입니다. (대시보드는 id로 묶기만 하면 됨)
+
+    LSH로 후보 쌍만 뽑은 뒤, 기존 대시보드 규칙과 같은 '작은 쪽 단어 집합 대비 겹침 비율 ≥ 0.4'로 확정합니다.
+    """
+    word_sets = [title_words(item.get('title_en', '')) for item in items]
+    signatures = [minhash_signature(ws) for ws in word_sets]
+    parent = list(range(len(items)))
+    for i, j in lsh_candidate_pairs(signatures, bands=STORY_LSH_BANDS):
+        a, b = word_sets[i], word_sets[j]
+        if len(a & b) / min(len(a), len(b)) >= threshold:
+            ri, rj = _find(parent, i), _find(parent, j)
+            if ri != rj: parent[max(ri, rj)] = min(ri, rj)
+
+    groups = {}
+    for idx in range(len(items)):
+        groups.setdefault(_find(parent, idx), []).append(items[idx])
+    for group in groups.values():
+        cluster_id = min(item['id'] for item in group)
+        for item in group:
+            item['cluster_id'] = cluster_id
+            item['cluster_size'] = len(group)
+    return items
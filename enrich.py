@@ -0,0 +1,139 @@
+import sqlite3
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+import dedup
+
+# ==========================================
+# 📄 [본문 보강] 채점 후보 상위 기사만 원문 본문을 받아 채점 입력에 추가
+# ==========================================
+# 💡 피드 요약이 한 줄뿐인 매체가 많아 LLM이 제목만 보고 점수를 짐작하는 경우가 생깁니다.
+#    사전 필터를 통과한 상위 후보만 기사 페이지를 받아 본문을 추출하고, 결과는 정규화 URL 키로
+#    별도 SQLite 파일에 캐시해 다음 실행에서는 다시 받지 않습니다. (실패도 짧게 캐시해 매번 두드리지 않음)
+CONTENT_DB = "content_cache.db"
+ENRICH_TOP = 150            # 본문을 받을 최대 후보 수 (사전 필터 순위 상위부터)
+MAX_WORKERS = 8
+PER_HOST_LIMIT = 2          # 같은 매체 서버에 동시에 붙는 요청 수 상한
+FETCH_TIMEOUT = 10
+MAX_HTML_BYTES = 1_500_000  # 페이지 원문은 이 크기까지만 읽음
+MAX_TEXT_CHARS = 2000       # 기사당 저장하는 본문 길이 상한
+MIN_PARAGRAPH = 40          # 이보다 짧은 <p>는 메뉴/캡션으로 보고 버림
+CACHE_TTL_DAYS = 30
+FAIL_TTL_HOURS = 24
+USER_AGENT = "Mozilla/5.0 (compatible; NGEPT-Sensing/1.0; +https://github.com/jashnet/it-sensing-board)"
+
+CONTENT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_text (
+    url TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    ok INTEGER NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_page_text_fetched_at ON page_text (fetched_at);
+"""
+
+def _connect(path=CONTENT_DB):
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")   # 로컬 멀티 샤드가 같은 파일에 동시에 씀
+    conn.executescript(CONTENT_SCHEMA)
+    return conn
+
+def load_cached(urls, path=CONTENT_DB):
+    """{정규화 URL: 본문 또는 None(최근 실패)} — 만료된 항목은 빠집니다."""
+    now = datetime.now()
+    found = {}
+    urls = list(urls)
+    conn = _connect(path)
+    try:
+        for i in range(0, len(urls), 500):   # SQLite 바인딩 변수 개수 제한
+            chunk = urls[i:i + 500]
+            for url, text, ok, fetched_at in conn.execute(
+                    f"SELECT url, text, ok, fetched_at FROM page_text WHERE url IN ({','.join('?' * len(chunk))})", chunk):
+                age = now - datetime.fromisoformat(fetched_at)
+                if ok and age < timedelta(days=CACHE_TTL_DAYS): found[url] = text
+                elif not ok and age < timedelta(hours=FAIL_TTL_HOURS): found[url] = None
+    finally:
+        conn.close()
+    return found
+
+def save_cached(rows, path=CONTENT_DB):
+    """rows: [(정규화 URL, 본문 또는 None)]"""
+    now = datetime.now()
+    conn = _connect(path)
+    try:
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO page_text (url, text, ok, fetched_at) VALUES (?, ?, ?, ?)",
+                             [(url, text or "", 1 if text else 0, now.isoformat()) for url, text in rows])
+            conn.execute("DELETE FROM page_text WHERE fetched_at < ?", ((now - timedelta(days=CACHE_TTL_DAYS)).isoformat(),))
+    finally:
+        conn.close()
+
+def extract_text(html, max_chars=MAX_TEXT_CHARS):
+    """기사 HTML → 본문 문단 텍스트. <article>/<main> 안의 충분히 긴 <p>만 모읍니다."""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript", "nav", "header", "footer", "aside", "form", "figure"]): tag.decompose()
+    paras = []
+    for root in (soup.find("article"), soup.find("main"), soup):
+        if root is None: continue
+        paras = [p.get_text(" ", strip=True) for p in root.find_all("p")]
+        paras = [p for p in paras if len(p) >= MIN_PARAGRAPH]
+        if paras: break
+    return "\n".join(paras)[:max_chars]
+
+_host_locks = defaultdict(lambda: threading.BoundedSemaphore(PER_HOST_LIMIT))
+_host_guard = threading.Lock()
+
+def _host_slot(url):
+    with _host_guard: return _host_locks[urlsplit(url).hostname or ""]
+
+def fetch_text(url):
+    """기사 페이지 1건 → 본문 (실패/비HTML이면 None). 같은 호스트는 PER_HOST_LIMIT개까지만 동시에 받습니다."""
+    with _host_slot(url):
+        try:
+            with requests.get(url, timeout=FETCH_TIMEOUT, headers={"User-Agent": USER_AGENT}, stream=True) as res:
+                res.raise_for_status()
+                if "html" not in res.headers.get("content-type", "html"): return None
+                body = b""
+                for chunk in res.iter_content(64 * 1024):
+                    body += chunk
+                    if len(body) >= MAX_HTML_BYTES: break
+                # requests는 charset이 없으면 ISO-8859-1로 가정하므로, 그 경우엔 UTF-8로 읽습니다
+                enc = res.encoding if res.encoding and res.encoding.lower() != "iso-8859-1" else "utf-8"
+                html = body.decode(enc, errors="replace")
+            return extract_text(html) or None
+        except: return None
+
+def enrich(items, limit=ENRICH_TOP, max_workers=MAX_WORKERS, path=CONTENT_DB):
+    """items 앞쪽 limit건에 body_en(본문 발췌)을 붙입니다. items는 사전 필터 순위순이어야 합니다.
+    반환: {"cached": 캐시 적중, "fetched": 새로 받음, "failed": 실패}"""
+    targets = {}
+    for item in items[:limit]:
+        targets.setdefault(dedup.canonical_url(item['link']), []).append(item)
+    if not targets: return {"cached": 0, "fetched": 0, "failed": 0}
+
+    try: texts = load_cached(list(targets), path)
+    except Exception as e:
+        print(f"⚠️ 본문 캐시 읽기 실패: {e}")
+        texts = {}
+    cached = sum(1 for t in texts.values() if t)
+    missing = [url for url in targets if url not in texts]
+    # 캐시 키는 정규화 URL, 실제 요청은 원래 링크로 보냅니다 (일부 매체는 쿼리가 있어야 열림)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        fetched = list(executor.map(lambda url: fetch_text(targets[url][0]['link']), missing))
+    texts.update(zip(missing, fetched))
+    try:
+        if missing: save_cached(list(zip(missing, fetched)), path)
+    except Exception as e: print(f"⚠️ 본문 캐시 저장 실패: {e}")
+
+    for url, group in targets.items():
+        if texts.get(url):
+            for item in group: item['body_en'] = texts[url]
+    stats = {"cached": cached, "fetched": sum(1 for t in fetched if t), "failed": sum(1 for t in fetched if not t)}
+    print(f"📄 본문 보강: 캐시 {stats['cached']}건 / 신규 {stats['fetched']}건 / 실패 {stats['failed']}건")
+    return stats
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+from datetime import datetime
+
+import archive
+
+# ==========================================
+# 🏷️ [엔티티 정규화] 별칭/한영 표기 → 대표 키워드
+# ==========================================
+# 💡 "GEMINI" / "GOOGLE GEMINI" / "제미나이"가 모두 같은 키워드로 잡히도록
+#    별칭 사전을 {별칭 키: 대표 키워드} 역색인으로 컴파일해 두고, 융합/트렌드 집계는 dict 조회 1번으로 끝냅니다.
+ALIASES_FILE = "entity_aliases.json"
+
+SEED_ALIASES = {
+    "GEMINI": ["GOOGLE GEMINI", "제미나이", "구글 제미나이", "제미니"],
+    "OPENAI": ["OPEN AI", "오픈AI", "오픈에이아이"],
+    "CHATGPT": ["CHAT GPT", "챗GPT", "챗지피티"],
+    "ANTHROPIC": ["앤트로픽", "앤스로픽"],
+    "CLAUDE": ["ANTHROPIC CLAUDE", "클로드"],
+    "APPLE": ["애플", "APPLE INC"],
+    "VISION PRO": ["APPLE VISION PRO", "비전 프로", "비전프로"],
+    "IPHONE": ["아이폰", "APPLE IPHONE"],
+    "SAMSUNG": ["삼성", "삼성전자", "SAMSUNG ELECTRONICS"],
+    "GALAXY RING": ["SAMSUNG GALAXY RING", "갤럭시 링", "갤럭시링"],
+    "GOOGLE": ["구글", "ALPHABET"],
+    "META": ["메타", "FACEBOOK", "META PLATFORMS"],
+    "MICROSOFT": ["마이크로소프트", "MS"],
+    "NVIDIA": ["엔비디아"],
+    "XIAOMI": ["샤오미", "小米"],
+    "HUAWEI": ["화웨이", "华为"],
+    "AMAZON": ["아마존"],
+    "TESLA": ["테슬라"],
+    "SMART GLASSES": ["SMART GLASS", "스마트 글래스", "스마트글래스", "AI GLASSES"],
+    "SMART RING": ["스마트 링", "스마트링"],
+    "WEARABLE": ["WEARABLES", "웨어러블"],
+    "HUMANOID ROBOT": ["HUMANOID ROBOTS", "휴머노이드", "휴머노이드 로봇"],
+    "XR": ["EXTENDED REALITY", "확장현실"],
+    "AR": ["AUGMENTED REALITY", "증강현실"],
+    "VR": ["VIRTUAL REALITY", "가상현실"],
+}
+# 접두어로 붙어도 의미가 같은 기업명 (예: "GOOGLE GEMINI" → "GEMINI") — 학습 시에만 사용
+COMPANY_PREFIXES = {"APPLE", "GOOGLE", "SAMSUNG", "META", "MICROSOFT", "AMAZON", "OPENAI", "ANTHROPIC", "XIAOMI",
+                    "HUAWEI", "SONY", "NVIDIA", "QUALCOMM", "OPPO", "VIVO", "HONOR", "ONEPLUS", "NOTHING", "TESLA"}
+# 💡 별칭이 가리키면 안 되는 일반어 ("META AI" → "AI", "GOOGLE SMART GLASSES" → "SMART GLASSES" 같은 잘못된 접기 방지)
+GENERIC_TERMS = {
+    "AI", "GENERATIVE AI", "GEN AI", "LLM", "MODEL", "MODELS", "AGENT", "AGENTS", "ASSISTANT", "CHATBOT", "APP", "APPS",
+    "PHONE", "PHONES", "SMARTPHONE", "SMARTPHONES", "TABLET", "LAPTOP", "PC", "TV", "WATCH", "SMARTWATCH", "EARBUDS",
+    "GLASSES", "HEADSET", "DEVICE", "DEVICES", "CHIP", "CHIPS", "SEMICONDUCTOR", "CLOUD", "SEARCH", "BROWSER", "OS",
+    "SOFTWARE", "HARDWARE", "PLATFORM", "SERVICE", "STORE", "UPDATE", "FEATURE", "FEATURES", "DATA", "PRIVACY",
+    "SECURITY", "ADS", "EARNINGS", "STOCK", "SHARES", "REVENUE", "LAYOFFS", "ROBOT", "ROBOTS", "ROBOTICS",
+    "SMART GLASSES", "SMART RING", "WEARABLE", "HUMANOID ROBOT", "XR", "AR", "VR", "MR",
+}
+MIN_ALIAS_CHARS = 3         # 이보다 짧은 대표어(공백 제외)로는 접지 않음
+
+def key(text):
+    """비교용 정규화 키: 대문자, 구두점/공백 정리."""
+    text = str(text or "").upper().replace("&", " AND ")
+    text = re.sub(r"[\-_/·.,:;'\"’`()\[\]]+", " ", text)
+    return " ".join(text.split())
+
+def compile_index(alias_map):
+    """{대표: [별칭...]} → {별칭 키: 대표 키} 역색인."""
+    index = {}
+    for canon, aliases in alias_map.items():
+        ck = key(canon)
+        index[ck] = ck
+        for a in aliases: index.setdefault(key(a), ck)
+    return index
+
+def load_learned(path=ALIASES_FILE):
+    if not os.path.exists(path): return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f: return json.load(f).get("aliases", {})
+    except: return {}
+
+_INDEX = None
+_INDEX_MTIME = None
+_INDEX_VERSION = None
+
+def get_index(path=ALIASES_FILE):
+    """씨앗 사전 + 학습된 별칭을 합친 역색인 (파일이 바뀔 때만 다시 컴파일)."""
+    global _INDEX, _INDEX_MTIME, _INDEX_VERSION
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    if _INDEX is None or mtime != _INDEX_MTIME:
+        learned = load_learned(path)
+        index = compile_index(SEED_ALIASES)
+        for alias, canon in learned.items():
+            index.setdefault(key(alias), index.get(key(canon), key(canon)))
+        _INDEX, _INDEX_MTIME = index, mtime
+        _INDEX_VERSION = hashlib.md5(json.dumps(learned, sort_keys=True, ensure_ascii=False).encode()).hexdigest()[:12]
+    return _INDEX
+
+def index_version(path=ALIASES_FILE):
+    """학습된 별칭 내용의 해시. 정규화한 키워드를 누적해 두는 쪽(stats)이 별칭이 바뀌었는지 확인할 때 씁니다.
+    (파일은 매일 다시 쓰이지만 별칭이 그대로면 같은 값)"""
+    get_index(path)
+    return _INDEX_VERSION
+
+def canonical(keyword, index=None):
+    k = key(keyword)
+    return (index or get_index()).get(k, k)
+
+# ==========================================
+# 📚 [별칭 학습] 키워드 누적 카운트에서 "기업명 + X" → "X" 패턴 학습
+# ==========================================
+# 💡 매 병합마다 아카이브 전체를 다시 읽지 않도록, 대표 키 기준 키워드 카운트와 반영한 날짜를
+#    별칭 파일에 함께 저장해 두고 그날 게시분만 더합니다. (카운트가 없는 예전 파일이면 아카이브로 한 번 채움)
+def load_state(path=ALIASES_FILE):
+    if not os.path.exists(path): return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f: return json.load(f)
+    except: return {}
+
+def _count_keywords(items, index, counts):
+    for item in items:
+        for kw in item.get('keywords', []) or []:
+            k = key(kw)
+            if k: counts[index.get(k, k)] += 1
+
+def is_specific(term, prefixes):
+    """별칭의 대표어로 쓸 만큼 구체적인지: 일반어/너무 짧은 말이 아니고, 한 기업명 뒤에만 붙어 나와야 합니다.
+    (META AI · GOOGLE AI 처럼 여러 기업 뒤에 붙는 말은 고유명사가 아님)"""
+    if term in GENERIC_TERMS or term in COMPANY_PREFIXES: return False
+    if len(term.replace(" ", "")) < MIN_ALIAS_CHARS: return False
+    return len(prefixes) <= 1
+
+def derive_aliases(counts, min_count=2, index=None):
+    """{대표 키: 횟수} → {별칭 키: 대표 키}"""
+    index = index or compile_index(SEED_ALIASES)
+    candidates = {}
+    prefixes_by_rest = {}
+    for k in counts:
+        parts = k.split(" ")
+        if len(parts) < 2: continue
+        prefix = index.get(parts[0], parts[0])
+        if prefix not in COMPANY_PREFIXES: continue
+        rest = " ".join(parts[1:])
+        rest = index.get(rest, rest)
+        candidates[k] = rest
+        prefixes_by_rest.setdefault(rest, set()).add(prefix)
+    return {k: rest for k, rest in sorted(candidates.items())
+            if k not in index and counts.get(rest, 0) >= min_count and is_specific(rest, prefixes_by_rest[rest])}
+
+def _save_state(counts, days, learned, path):
+    state = {"updated": datetime.now().isoformat(), "aliases": dict(sorted(learned.items())),
+             "days": sorted(days), "counts": dict(sorted(counts.items()))}
+    with open(path + ".tmp", "w", encoding="utf-8") as f: json.dump(state, f, ensure_ascii=False, indent=1)
+    os.replace(path + ".tmp", path)
+
+def learn_from_day(day, items, min_count=2, path=ALIASES_FILE):
+    """그날 게시 기사의 키워드를 누적 카운트에 더하고(같은 날은 한 번만) 별칭을 다시 계산합니다."""
+    index = compile_index(SEED_ALIASES)
+    state = load_state(path)
+    counts = Counter(state.get("counts", {}))
+    days = set(state.get("days", []))
+    if "counts" not in state:
+        for d in archive.list_days():
+            if d == day: continue
+            _count_keywords(archive.read_day(d), index, counts)
+            days.add(d)
+    if day not in days:
+        _count_keywords(items, index, counts)
+        days.add(day)
+    learned = derive_aliases(counts, min_count, index)
+    _save_state(counts, days, learned, path)
+    return learned
+
+def learn_from_archive(min_count=2, path=ALIASES_FILE):
+    """아카이브 전체로 카운트를 처음부터 다시 만듭니다 (규칙을 바꾼 뒤 재구축용)."""
+    index = compile_index(SEED_ALIASES)
+    counts = Counter()
+    days = archive.list_days()
+    for day in days: _count_keywords(archive.read_day(day), index, counts)
+    learned = derive_aliases(counts, min_count, index)
+    _save_state(counts, days, learned, path)
+    return learned
@@ -0,0 +1,128 @@
+import atexit
+import multiprocessing
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+import feedparser
+import requests
+from bs4 import BeautifulSoup
+
+import dedup
+import records
+
+# ==========================================
+# 📡 [피드 수집] 네트워크 다운로드(스레드) ↔ XML/HTML 파싱(프로세스) 분리
+# ==========================================
+# 💡 스레드 40개로 받아도 feedparser XML 파싱, 날짜 변환, 기사당 BeautifulSoup 2회는 GIL에 묶여 코어 1개만 씁니다.
+#    다운로드는 스레드 풀이 맡고, 받은 원문 바이트는 코어 수만큼 띄운 프로세스 풀에서 파싱해 기사 튜플만 돌려받습니다.
+#    대시보드는 같은 프로세스에서 여러 번 수집하므로 파싱 풀은 한 번 띄워 재사용합니다.
+#    워커는 spawn으로 띄웁니다: Streamlit 서버처럼 스레드가 도는 프로세스를 fork하면 잠긴 락까지 복사돼
+#    자식이 멈출 수 있어서, 빈 인터프리터에서 이 모듈만 다시 import하게 합니다. (풀은 재사용하므로 기동 비용은 한 번)
+FETCH_TIMEOUT = 15
+USER_AGENT = "Mozilla/5.0 (compatible; NGEPT-Sensing/1.0; +https://github.com/jashnet/it-sensing-board)"
+MIN_PROCESS_FEEDS = 4       # 피드가 이보다 적으면 프로세스 왕복 비용이 더 커서 그냥 현재 프로세스에서 파싱
+
+_pool = None
+_pool_size = 0
+
+def cpu_count():
+    try: return len(os.sched_getaffinity(0))   # 컨테이너/러너에 실제로 할당된 코어 수
+    except AttributeError: return os.cpu_count() or 1
+
+def _parse_pool(workers):
+    global _pool, _pool_size
+    if _pool is None or _pool_size != workers:
+        if _pool is not None: _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        _pool_size = workers
+    return _pool
+
+def _drop_pool():
+    """워커가 죽어 풀이 깨졌을 때 버리고, 다음 수집에서 새로 띄우게 합니다."""
+    global _pool
+    if _pool is not None: _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+
+@atexit.register
+def _shutdown_pool():
+    if _pool is not None: _pool.shutdown(wait=False, cancel_futures=True)
+
+def fetch_payload(url, timeout=FETCH_TIMEOUT):
+    """피드 원문 (바이트, content-type). 실패하면 (None, None)."""
+    try:
+        res = requests.get(url, timeout=timeout, headers={"User-Agent": USER_AGENT})
+        res.raise_for_status()
+        return res.content, res.headers.get("content-type", "")
+    except: return None, None
+
+def _thumbnail(entry):
+    if 'media_content' in entry and len(entry.media_content) > 0: return entry.media_content[0].get('url', '')
+    if 'media_thumbnail' in entry and len(entry.media_thumbnail) > 0: return entry.media_thumbnail[0].get('url', '')
+    html_content = ""
+    if hasattr(entry, 'content') and isinstance(entry.content, list): html_content += entry.content[0].get('value', '')
+    if hasattr(entry, 'summary'): html_content += entry.summary
+    if html_content:
+        img_tag = BeautifulSoup(html_content, "html.parser").find('img')
+        if img_tag and img_tag.get('src'): return img_tag.get('src')
+    return ""
+
+def parse_feed(args):
+    """(카테고리, 채널명, 원문 바이트, content-type, 수집 하한 시각, 최대 건수) → 기사 튜플 리스트. 프로세스 풀에서 실행됩니다.
+    프로세스 간 전달량을 줄이려고 채널 정보는 빼고 (id, 제목, 링크, timestamp, 요약, 썸네일)만 돌려줍니다."""
+    cat, name, payload, content_type, limit, max_entries = args
+    rows = []
+    limit_ts = limit.timestamp()
+    try:
+        d = feedparser.parse(payload, response_headers={"content-type": content_type} if content_type else None)
+        for entry in d.entries[:max_entries]:
+            dt = entry.get('published_parsed') or entry.get('updated_parsed')
+            if not dt: continue
+            ts = time.mktime(dt)
+            if ts < limit_ts: continue
+            rows.append((dedup.article_id(entry.link), entry.title, entry.link, ts,
+                         BeautifulSoup(entry.get("summary", ""), "html.parser").get_text()[:300], _thumbnail(entry)))
+    except: pass
+    return rows
+
+def collect(tasks, fetch_workers=40, parse_workers=None, on_progress=None):
+    """tasks: [(채널 정보, 수집 하한 시각, 피드당 최대 건수)] → 전체 기사 리스트 (records.Article).
+    채널 정보는 channels.compile_registry가 만든 dict (id / name / url / category / tier ...) 입니다.
+
+    on_progress(완료 채널 수, 전체 채널 수)는 호출한 스레드에서 불립니다 (Streamlit 진행 표시용).
+    """
+    if not tasks: return []
+    parse_workers = parse_workers or cpu_count()
+    use_processes = parse_workers > 1 and len(tasks) >= MIN_PROCESS_FEEDS
+    pool = None
+    if use_processes:
+        try: pool = _parse_pool(parse_workers)
+        except Exception as e: print(f"⚠️ 파싱 프로세스 풀 생성 실패, 현재 프로세스에서 파싱합니다: {e}")
+
+    articles = []
+    parse_futures = []
+
+    def add(channel, rows):
+        articles.extend(records.from_row(channel, row) for row in rows)
+
+    with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+        fetches = {executor.submit(fetch_payload, ch["url"]): (ch, limit, max_entries) for ch, limit, max_entries in tasks}
+        for i, fut in enumerate(as_completed(fetches)):
+            ch, limit, max_entries = fetches[fut]
+            payload, content_type = fut.result()
+            if payload:
+                job = (ch["category"], ch["name"], payload, content_type, limit, max_entries)
+                future = None
+                if pool:
+                    try: future = pool.submit(parse_feed, job)
+                    except Exception: pool = None; _drop_pool()   # 풀이 깨지면 남은 피드는 현재 프로세스에서 파싱
+                if future: parse_futures.append((future, ch, job))
+                else: add(ch, parse_feed(job))
+            if on_progress: on_progress(i + 1, len(tasks))
+    for fut, ch, job in parse_futures:
+        try: add(ch, fut.result())
+        except Exception as e:   # 워커 프로세스가 죽은 경우 등 → 이 피드만 현재 프로세스에서 다시 파싱
+            _drop_pool()
+            print(f"⚠️ 파싱 워커 실패, 현재 프로세스에서 재시도: {job[1]} ({e})")
+            add(ch, parse_feed(job))
+    return articles
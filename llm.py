@@ -0,0 +1,286 @@
+import json
+import random
+import re
+import threading
+import time
+
+# ==========================================
+# 🔌 [LLM 공통] Gemini 호출 헬퍼 (스키마 고정 출력 / 스트리밍)
+# ==========================================
+MODEL = "gemini-2.5-flash"
+MAX_ATTEMPTS = 2            # 스키마 검증 실패 시 같은 요청 재시도 횟수 (첫 호출 포함)
+# 💡 API/네트워크 오류(429·5xx·타임아웃)는 응답 파싱 실패와 별개입니다. 지수 백오프로 따로 재시도하고 'transport'로 집계합니다.
+TRANSPORT_RETRIES = 3       # 첫 호출 이후 재시도 횟수
+BACKOFF_BASE = 2.0          # 초, 재시도마다 2배 + 0~1초 지터
+NO_RETRY_CODES = {400, 401, 403, 404}   # 요청/키 자체가 잘못된 경우는 기다려도 같음
+PACING = (0.1, 0.8)         # 동시 채점 호출 사이 지터 (요청이 한꺼번에 몰려 429가 나지 않게)
+
+# ==========================================
+# 📐 [응답 스키마] 채점 / 버즈 라벨 / 발표 슬라이드
+# ==========================================
+# 💡 response_schema로 모양을 고정해서, 정규식으로 JSON을 긁어내다 실패하면 기본 점수를 주던 방식을 없앱니다.
+SCORE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "score": {"type": "INTEGER"},
+        "insight_title": {"type": "STRING"},
+        "core_summary": {"type": "STRING"},
+        "content_type": {"type": "STRING", "enum": ["news", "community"]},
+        "keywords": {"type": "ARRAY", "items": {"type": "STRING"}},
+    },
+    "required": ["score", "insight_title", "core_summary", "content_type", "keywords"],
+}
+BUZZ_LABEL_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "labels": {"type": "ARRAY", "items": {
+            "type": "OBJECT",
+            "properties": {"keyword": {"type": "STRING"}, "label": {"type": "STRING"}},
+            "required": ["keyword", "label"],
+        }},
+    },
+    "required": ["labels"],
+}
+SLIDES_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "slides": {"type": "ARRAY", "items": {
+            "type": "OBJECT",
+            "properties": {
+                "slide_num": {"type": "INTEGER"},
+                "title": {"type": "STRING"},
+                "image_keyword": {"type": "STRING"},
+                "content": {"type": "ARRAY", "items": {"type": "STRING"}},
+                "refs": {"type": "ARRAY", "items": {
+                    "type": "OBJECT",
+                    "properties": {"title": {"type": "STRING"}, "url": {"type": "STRING"}},
+                    "required": ["title", "url"],
+                }},
+            },
+            "required": ["slide_num", "title", "content"],
+        }},
+    },
+    "required": ["slides"],
+}
+
+# ==========================================
+# ✅ [검증] 스키마를 통과했더라도 값 범위/타입을 한 번 더 정리
+# ==========================================
+def _text(v):
+    if not isinstance(v, str) or not v.strip(): raise ValueError("빈 문자열")
+    return v.strip()
+
+def validate_score(data):
+    score = int(data["score"])
+    if not 0 <= score <= 100: raise ValueError(f"점수 범위 밖: {score}")
+    content_type = data.get("content_type", "news")
+    if content_type not in ("news", "community"): raise ValueError(f"content_type: {content_type}")
+    keywords = [str(k).strip() for k in data.get("keywords", []) if str(k).strip()][:5]
+    return {"score": score, "insight_title": _text(data["insight_title"]), "core_summary": _text(data["core_summary"]),
+            "content_type": content_type, "keywords": keywords}
+
+def validate_labels(data):
+    return {str(r["keyword"]).upper(): str(r.get("label", "")).strip() for r in data["labels"] if isinstance(r, dict) and r.get("keyword")}
+
+def validate_slide(data):
+    content = [str(c) for c in data.get("content", []) if str(c).strip()]
+    if not content: raise ValueError("빈 슬라이드")
+    refs = [{"title": str(r.get("title", "Link")), "url": str(r.get("url", "#"))} for r in data.get("refs", []) or [] if isinstance(r, dict)]
+    return {"slide_num": int(data.get("slide_num", 0)), "title": _text(data["title"]),
+            "image_keyword": str(data.get("image_keyword") or "technology"), "content": content, "refs": refs}
+
+# ==========================================
+# 📉 [파싱 실패 카운터] 종류별 실패/재시도 횟수 (프로세스 단위)
+# ==========================================
+_lock = threading.Lock()
+PARSE_FAILURES = {}
+
+def _count(kind, key="failed"):
+    with _lock:
+        c = PARSE_FAILURES.setdefault(kind, {"failed": 0, "retried": 0, "gave_up": 0, "transport": 0})
+        c[key] += 1
+
+def failure_summary():
+    with _lock: return {k: dict(v) for k, v in PARSE_FAILURES.items()}
+
+def parse_json(text):
+    """스키마 모드에서는 순수 JSON이 오지만, 혹시 코드 펜스가 붙어 오면 벗겨서 파싱합니다."""
+    text = (text or "").strip()
+    text = re.sub(r"^```(?:json)?\s*|\s*```$", "", text)
+    return json.loads(text)
+
+# 💡 google.genai는 무거워서 설정 객체를 만들 때 import 합니다 (대시보드는 AI 호출 전까지 SDK를 올리지 않음).
+def text_config(system_instruction=None):
+    from google.genai import types
+    return types.GenerateContentConfig(system_instruction=system_instruction)
+
+def json_config(schema, system_instruction=None):
+    from google.genai import types
+    return types.GenerateContentConfig(system_instruction=system_instruction, response_mime_type="application/json", response_schema=schema)
+
+class TransportError(Exception):
+    """응답 자체를 받지 못한 API/네트워크 오류 (백오프 재시도까지 실패)."""
+
+def _generate(client, contents, config, kind, model=MODEL):
+    """generate_content + 전송 오류 지수 백오프. 끝내 실패하면 TransportError."""
+    for attempt in range(TRANSPORT_RETRIES + 1):
+        try: return client.models.generate_content(model=model, contents=contents, config=config)
+        except Exception as e:
+            code = getattr(e, "code", None)
+            if code in NO_RETRY_CODES or attempt == TRANSPORT_RETRIES:
+                _count(kind, "transport")
+                raise TransportError(f"{type(e).__name__}: {e}") from e
+            delay = BACKOFF_BASE * 2 ** attempt + random.uniform(0, 1)
+            print(f"⏳ [{kind}] API 오류({code or type(e).__name__}), {delay:.1f}초 후 재시도")
+            time.sleep(delay)
+
+def call_json(client, contents, config, validate, kind, model=MODEL):
+    """스키마 고정 호출 1회 + 검증. 파싱/검증 실패면 None (실패 카운터 증가), 전송 오류는 TransportError."""
+    res = _generate(client, contents, config, kind, model)
+    try: return validate(parse_json(res.text))
+    except Exception as e:
+        _count(kind)
+        print(f"⚠️ [{kind}] 구조화 응답 검증 실패: {e}")
+        return None
+
+def generate_json(client, contents, schema, validate, kind, system_instruction=None, attempts=MAX_ATTEMPTS, model=MODEL):
+    """단건 호출용: 검증에 실패하면 같은 요청을 재시도하고, 끝내 실패하거나 전송 오류면 None."""
+    config = json_config(schema, system_instruction)
+    for attempt in range(attempts):
+        if attempt: _count(kind, "retried")
+        try: parsed = call_json(client, contents, config, validate, kind, model)
+        except TransportError as e:
+            print(f"🚨 [{kind}] API 호출 실패: {e}")
+            return None
+        if parsed is not None: return parsed
+    _count(kind, "gave_up")
+    return None
+
+def generate_text(client, contents, kind, system_instruction=None, model=MODEL):
+    """일반 텍스트 단건 호출 (전송 오류 백오프 포함). 끝내 실패하거나 빈 응답이면 None."""
+    try: res = _generate(client, contents, text_config(system_instruction), kind, model)
+    except TransportError as e:
+        print(f"🚨 [{kind}] API 호출 실패: {e}")
+        return None
+    if not res.text:
+        _count(kind)
+        return None
+    return res.text
+
+SCORE_BODY_CHARS = 1200     # 본문 보강(enrich)이 붙인 본문 중 채점 프롬프트에 넣는 길이
+
+# 💡 LLM 원점수 → 게시 점수. 모닝 배치 채점 / 수동 센싱 채점 / 대시보드 재채점(rerank.rescore)이
+#    모두 이 함수만 거치므로, 같은 기사는 어느 경로로 채점돼도 같은 점수가 됩니다.
+TIER1_BOOST = 5             # Tier 1 매체 + 높은 점수면 'Headline' 등급 가산
+TIER1_BOOST_MIN = 80
+
+def final_score(raw_score, item):
+    """Tier 1 가산 → 버즈 가산(buzz_boost, 이미 융합된 기사만) 순으로 더하고 0~100으로 자릅니다."""
+    if 'is_tier1' in item: tier1 = item['is_tier1']
+    else:   # 채널 id 이전의 예전 기사
+        import channels
+        tier1 = channels.is_tier1_source(item.get('source', ''))
+    score = raw_score
+    if tier1 and score >= TIER1_BOOST_MIN: score = min(100, score + TIER1_BOOST)
+    return max(0, min(100, score + item.get('buzz_boost', 0)))
+
+def score_query(prompt, item):
+    query = f"{prompt}\n\n[평가 대상]\n매체(출처): {item['source']}\n링크: {item['link']}\n제목: {item['title_en']}\n요약: {item['summary_en'][:200]}"
+    if item.get('body_en'): query += f"\n본문 발췌: {item['body_en'][:SCORE_BODY_CHARS]}"
+    return query
+
+def score_article(client, prompt, item):
+    """기사 1건 채점 1회 → 검증된 dict 또는 None. 재시도는 score_with_retry_queue의 대기열에서 따로 돌립니다.
+    전송 오류는 _generate 안에서 백오프 재시도하고, 그래도 실패하면 TransportError가 올라갑니다."""
+    return call_json(client, score_query(prompt, item), json_config(SCORE_SCHEMA), validate_score, "score")
+
+def _paced_score(client, prompt, item):
+    """→ (검증된 dict 또는 None, 전송 오류 여부)"""
+    time.sleep(random.uniform(*PACING))
+    try: return score_article(client, prompt, item), False
+    except TransportError as e:
+        print(f"🚨 [score] API 호출 실패: {item.get('title_en', '')[:40]} ({e})")
+        return None, True
+
+def score_with_retry_queue(client, prompt, items, on_result=None, max_workers=5, retry_rounds=MAX_ATTEMPTS - 1):
+    """전체를 한 번 채점한 뒤, 응답 검증에 실패한 기사만 모아 잠시 쉬었다가 재시도합니다.
+    전송 오류로 끝난 기사는 이미 백오프 재시도를 거쳤으므로 대기열에 다시 넣지 않습니다.
+    반환: {id: 검증된 dict}, 끝까지 실패한 기사 목록. on_result(item, parsed)는 1차 채점 진행 표시에 씁니다."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    results = {}
+    queue = list(items)
+    unreachable = []
+    for round_no in range(retry_rounds + 1):
+        if not queue: break
+        if round_no:
+            print(f"🔁 검증 실패 {len(queue)}건 재시도 ({round_no}/{retry_rounds})")
+            for _ in queue: _count("score", "retried")
+            time.sleep(BACKOFF_BASE * round_no)
+        failed = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_paced_score, client, prompt, item): item for item in queue}
+            for f in as_completed(futures):
+                item = futures[f]
+                parsed, transport = f.result()
+                if parsed: results[item['id']] = parsed
+                elif transport: unreachable.append(item)
+                else: failed.append(item)
+                if on_result and not round_no: on_result(item, parsed)
+        queue = failed
+    for _ in queue: _count("score", "gave_up")
+    return results, queue + unreachable
+
+# ==========================================
+# 🌊 [스트리밍] 조각이 도착하는 대로 화면에 흘려보내기
+# ==========================================
+def stream_text(client, contents, config=None, model=MODEL):
+    """generate_content_stream → 텍스트 조각 제너레이터 (st.write_stream에 그대로 넘길 수 있음)."""
+    for chunk in client.models.generate_content_stream(model=model, contents=contents, config=config):
+        if chunk.text: yield chunk.text
+
+def analysis_prompt(base_prompt, item):
+    """'AI 분석' 1분 요약 프롬프트. 대시보드 모달과 모닝 배치 사전 생성이 같은 문장을 써야 캐시 키가 맞습니다."""
+    return f"{base_prompt}\n\n[기사 정보]\n제목: {item['title_en']}\n요약: {item['summary_en']}\n**[출력 지침]**\n1. 리포트가 길어지면 안 됩니다. 각 항목은 '2~3줄 이내의 짧은 Bullet Point'로 요약하세요.\n2. 'Implication (기획자 참고 아이디어)' 항목을 마지막에 추가하여 구체적이고 참신한 아이디어를 제안해 주세요."
+
+def iter_array_objects(text_chunks, on_text=None):
+    """스트리밍 중인 JSON에서 첫 번째 배열의 원소 객체가 닫히는 즉시 하나씩 yield 합니다.
+
+    {"slides": [ {...}, {...} ]} 이든 [ {...}, {...} ] 이든 동작하며, 문자열 안의 괄호는 무시합니다.
+    on_text가 주어지면 전체 누적 텍스트를 조각마다 넘겨줍니다 (실패 시 원문 확인용).
+    """
+    buf = ""
+    stack = []
+    array_level = None
+    start = None
+    in_string = escape = False
+    pos = 0
+    for chunk in text_chunks:
+        buf += chunk
+        if on_text: on_text(buf)
+        while pos < len(buf):
+            ch = buf[pos]
+            if in_string:
+                if escape: escape = False
+                elif ch == "\\": escape = True
+                elif ch == '"': in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in "[{":
+                if ch == "{" and array_level is not None and len(stack) == array_level: start = pos
+                stack.append(ch)
+                if ch == "[" and array_level is None: array_level = len(stack)
+            elif ch in "]}" and stack:
+                stack.pop()
+                if ch == "}" and start is not None and len(stack) == array_level:
+                    try: yield json.loads(buf[start:pos + 1])
+                    except ValueError: pass
+                    start = None
+            pos += 1
+
+def stream_json_items(client, contents, schema, validate, kind, system_instruction=None, model=MODEL):
+    """스키마 고정 스트리밍 호출에서 배열 원소를 검증하며 하나씩 yield 합니다. 검증에 실패한 원소는 건너뜁니다."""
+    for obj in iter_array_objects(stream_text(client, contents, json_config(schema, system_instruction), model)):
+        try: yield validate(obj)
+        except Exception as e:
+            _count(kind)
+            print(f"⚠️ [{kind}] 스트리밍 원소 검증 실패: {e}")
@@ -16,6 +16,9 @@ GEMS_PERSONA = """
    - 이 시그널을 바탕으로 우리가 당장 연구하거나 대응해야 할 제품적, UX적 방향성은 무엇인가?
 """
 
+# 기본 'AI 분석' 질문 (모닝 배치가 헤드라인 기사 1분 요약을 미리 만들 때도 이 값을 씁니다)
+DEFAULT_AI_PROMPT = "위 기사를 우리 팀의 'NOD 프로젝트' 관점에서 심층 분석해줘."
+
 # ==========================================
 # 🎯 [필터 설정] 초고속 1차 필터링 및 채점용
 # ==========================================
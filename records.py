@@ -0,0 +1,74 @@
+import sys
+from datetime import datetime
+
+# ==========================================
+# 🗜️ [기사 레코드] 수집 ~ 사전 필터 구간용 경량 기사 객체
+# ==========================================
+# 💡 피드 수천 개 × 30일 창이면 채점 전 원본 기사가 수십만 건이 됩니다.
+#    기사마다 dict(키 문자열 + 해시 테이블) 대신 __slots__ 객체로 들고, 매체명/카테고리는 intern해서 한 벌만 공유합니다.
+#    날짜는 timestamp(float) 하나로만 저장하고 date_obj / date 문자열은 읽을 때 만들어 줍니다.
+#    기존 코드가 item['title_en'], item.get('pre_score') 처럼 쓰던 방식은 그대로 동작하고,
+#    채점 대상으로 뽑힌 기사만 to_dict()로 일반 dict가 되어 JSON 저장/대시보드 단계로 넘어갑니다.
+FIELDS = ('id', 'title_en', 'link', 'source', 'category', 'channel_id', 'ts', 'summary_en', 'thumbnail', 'is_tier1', 'pre_score')
+_FIELD_SET = frozenset(FIELDS)
+DERIVED = ('date_obj', 'date')
+
+class Article:
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, category, source, article_id, title_en, link, ts, summary_en, thumbnail, channel_id=""):
+        self.id = article_id
+        self.title_en = title_en
+        self.link = link
+        self.source = sys.intern(source)
+        self.category = sys.intern(category)
+        self.channel_id = sys.intern(channel_id)
+        self.ts = ts
+        self.summary_en = summary_en
+        self.thumbnail = thumbnail
+        self.is_tier1 = False
+        self.pre_score = 0
+        self.extra = None       # 그 밖의 필드는 실제로 쓰일 때만 dict 생성
+
+    # --- dict 호환 인터페이스 ---
+    def __getitem__(self, key):
+        if key in _FIELD_SET: return getattr(self, key)
+        if key == 'date_obj': return datetime.fromtimestamp(self.ts).isoformat()
+        if key == 'date': return datetime.fromtimestamp(self.ts).strftime("%Y.%m.%d")
+        if self.extra and key in self.extra: return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _FIELD_SET: setattr(self, key, value)
+        elif key in DERIVED: raise KeyError(f"{key}는 ts에서 계산되는 필드입니다")
+        else:
+            if self.extra is None: self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        return key in _FIELD_SET or key in DERIVED or bool(self.extra and key in self.extra)
+
+    def get(self, key, default=None):
+        try: return self[key]
+        except KeyError: return default
+
+    def to_dict(self):
+        d = {"id": self.id, "title_en": self.title_en, "link": self.link, "source": self.source, "category": self.category,
+             "channel_id": self.channel_id, "date_obj": self['date_obj'], "date": self['date'], "summary_en": self.summary_en, "thumbnail": self.thumbnail}
+        if self.is_tier1: d["is_tier1"] = True
+        if self.pre_score: d["pre_score"] = self.pre_score
+        if self.extra: d.update(self.extra)
+        return d
+
+    def __repr__(self):
+        return f"Article({self.id!r}, {self.source!r}, {self.title_en[:40]!r})"
+
+def from_row(channel, row):
+    """(채널 정보, feeds.parse_feed가 돌려준 튜플 (id, 제목, 링크, timestamp, 요약, 썸네일)) → Article.
+    Tier 1 여부는 채널 레지스트리에서 미리 계산된 값을 그대로 물려받습니다."""
+    article = Article(channel["category"], channel["name"], *row, channel_id=channel["id"])
+    article.is_tier1 = channel["tier"] == 1
+    return article
+
+def to_dicts(items):
+    return [i.to_dict() if isinstance(i, Article) else i for i in items]
@@ -0,0 +1,116 @@
+import math
+import re
+import time
+
+import entities
+
+# ==========================================
+# 🎚️ [선호 규칙 재정렬] 학습 규칙이 바뀌면 캐시된 풀을 로컬에서 즉시 재계산
+# ==========================================
+# 💡 규칙 추가/삭제 때마다 전체 재수집·재채점을 하지 않고,
+#    1) 사전 점수(pre_score)와 규칙 매칭을 로컬에서 다시 계산해 점수를 가감하고
+#    2) 규칙 매칭 여부가 바뀐 기사만 LLM 재채점 대기열에 올립니다.
+RULE_BOOST = 10             # 새로 매칭된 규칙 1개당 가산점 (삭제된 규칙은 같은 만큼 감점)
+RULE_MIN_TERM_RATIO = 0.3   # 규칙 핵심어 중 이 비율 이상이 기사에 나오면 매칭
+PRE_FILTER_KEYWORDS = ['ai', 'apple', 'meta', 'google', 'wearable', 'ring', 'glass', 'robot', 'ux', 'release', 'launch']
+
+RULE_STOPWORDS = {
+    '기사', '점수', '부여', '이상', '이하', '높은', '낮은', '가산점', '감점', '관련', '경우', '사례', '반드시', '우선', '최우선',
+    '선정', '포함', '포함된', '내용', '대한', '위한', '같은', '있는', '하는', '특히', '모든', '주세요', '하세요', '등', '및',
+    'the', 'and', 'for', 'with', 'about', 'article', 'articles', 'score', 'scores', 'high', 'higher', 'give', 'points',
+}
+_PARTICLE_RE = re.compile(r'(에서|으로|에게|처럼|까지|부터|하는|적인|들을|들이|들의|을|를|이|가|은|는|에|의|로|와|과|도)$')
+
+def rules_prompt(base_prompt, learned_rules):
+    if not learned_rules: return base_prompt
+    rules_text = "\n".join([f"- {r}" for r in learned_rules])
+    return base_prompt + f"\n\n[🚨 최우선 가중치 (팀장님 선호 학습 규칙)]\n아래 규칙에 부합하는 기사는 반드시 높은 가산점(80점 이상)을 부여하여 핵심 이슈로 선정하세요:\n{rules_text}"
+
+def pre_score(item, learned_rules):
+    """제목+요약 단어 매칭 기반 1차 연관도 (+ Tier 1 매체 가점). is_tier1은 수집 단계에서 미리 표시됩니다."""
+    keywords = PRE_FILTER_KEYWORDS + [w.lower() for w in ", ".join(learned_rules).split()]
+    text_lower = (item.get('title_en', '') + " " + item.get('summary_en', '')).lower()
+    return sum(2 for k in keywords if k in text_lower) + (10 if item.get('is_tier1') else 0)
+
+# ==========================================
+# 🧩 [규칙 매칭] 규칙 문장 → 핵심어 → 기사 텍스트 부분 일치
+# ==========================================
+def rule_terms(rule):
+    """규칙 문장에서 핵심어만 추립니다. 별칭 사전에 있는 단어는 대표 엔티티도 함께 찾습니다 (제미나이 ↔ GEMINI)."""
+    index = entities.get_index()
+    terms = []
+    for w in re.findall(r'\w+', str(rule).lower()):
+        # 별칭 사전에 있는 단어는 그대로 ('제미나이'의 '이'는 조사가 아님)
+        if not w.isascii() and entities.key(w) not in index: w = _PARTICLE_RE.sub('', w)
+        if len(w) < 2 or w in RULE_STOPWORDS or re.fullmatch(r'\d+\w?', w): continue
+        forms = {w, entities.canonical(w, index).lower()}
+        if forms not in terms: terms.append(forms)
+    return terms
+
+def compile_rules(learned_rules):
+    return [(rule, rule_terms(rule)) for rule in learned_rules]
+
+def _item_text(item):
+    parts = [item.get(k, '') or '' for k in ('title_en', 'summary_en', 'insight_title', 'core_summary')]
+    parts.extend(str(k) for k in item.get('keywords', []) or [])
+    return " ".join(parts).lower()
+
+def rule_hits(item, compiled_rules):
+    text = _item_text(item)
+    hits = []
+    for rule, terms in compiled_rules:
+        if not terms: continue
+        found = sum(1 for forms in terms if any(f in text for f in forms))
+        if found >= max(1, math.ceil(len(terms) * RULE_MIN_TERM_RATIO)): hits.append(rule)
+    return hits
+
+def tag_rule_hits(items, learned_rules):
+    """LLM 채점 직후 호출: 채점 당시 규칙 매칭 상태와 점수를 기록해 두면 이후 재정렬의 기준점이 됩니다."""
+    compiled = compile_rules(learned_rules)
+    for item in items:
+        hits = rule_hits(item, compiled)
+        item['rule_hits'] = hits
+        item['scored_rule_hits'] = hits
+        item['base_score'] = item.get('score', 0)
+    return items
+
+def rerank(items, old_rules, new_rules):
+    """규칙 변경을 캐시된 기사에 반영합니다. 매칭 상태가 바뀐 기사 id 목록을 반환 (LLM 재채점 대상)."""
+    old_compiled = compile_rules(old_rules)
+    new_compiled = compile_rules(new_rules)
+    changed = []
+    for item in items:
+        if item.get('content_type', 'news') != 'news': continue
+        # 💡 기준점이 없는 예전 기사는 '변경 전 규칙으로 채점된 상태'로 간주합니다.
+        if 'scored_rule_hits' not in item:
+            item['scored_rule_hits'] = rule_hits(item, old_compiled)
+            item['base_score'] = item.get('score', 0)
+        prev_hits = item.get('rule_hits', item['scored_rule_hits'])
+        hits = rule_hits(item, new_compiled)
+        scored = set(item['scored_rule_hits'])
+        delta = RULE_BOOST * (len(set(hits) - scored) - len(scored - set(hits)))
+        item['rule_hits'] = hits
+        item['pre_score'] = pre_score(item, new_rules)
+        item['score'] = max(0, min(100, item.get('base_score', item.get('score', 0)) + delta))
+        if set(hits) != set(prev_hits): changed.append(item['id'])
+    return changed
+
+# ==========================================
+# 🔁 [부분 재채점] 대기열에 오른 기사만 LLM으로 다시 채점
+# ==========================================
+def rescore(client, items, prompt, max_workers=5):
+    """items를 제자리에서 갱신합니다. 점수는 llm.final_score로 배치와 같게 마무리하고(버즈 가산점 유지), 실패한 기사는 로컬 점수를 유지합니다."""
+    import llm
+    t0 = time.time()
+    results, _ = llm.score_with_retry_queue(client, prompt, items, max_workers=max_workers)
+    for item in items:
+        parsed = results.get(item['id'])
+        if not parsed: continue
+        item['base_score'] = llm.final_score(parsed['score'], item)   # 배치와 같은 Tier 1 / 버즈 가산 규칙
+        item['score'] = item['base_score']
+        item['scored_rule_hits'] = item.get('rule_hits', [])   # 재채점 후에는 현재 매칭 상태가 새 기준점
+        item.pop('score_failed', None)
+        if parsed['keywords']: item['keywords'] = parsed['keywords']
+    ok = len(results)
+    print(f"🔁 재채점 {ok}/{len(items)}건 완료 ({time.time() - t0:.1f}s)")
+    return ok
@@ -0,0 +1,142 @@
+import html
+import json
+import os
+from datetime import datetime
+
+import board
+import thumbs
+
+# ==========================================
+# 📸 [정적 스냅샷] 모닝 보드를 HTML + JSON 파일로 미리 렌더링
+# ==========================================
+# 💡 데일리 보드는 다음 배치 전까지 모든 방문자에게 똑같은데, 방문할 때마다 Streamlit 스크립트가
+#    today_news.json 전체를 다시 읽고 카드를 조립했습니다. 모닝 배치가 기본 설정(점수 하한/기사 수/Top Picks 비율)
+#    기준 보드를 board.build_view로 한 번 만들어 static/board/ 에 index.html + board.json으로 떨굽니다.
+#    아무 정적 웹서버(GitHub Pages, nginx 등)로 그대로 서빙하면 되고, 맞춤 설정·AI 분석·수동 센싱 같은
+#    상호작용만 Streamlit 대시보드(SENSING_APP_URL)로 넘어갑니다.
+#    (Streamlit 정적 서빙은 .html을 text/plain으로 내보내므로 index.html은 일반 웹서버용, board.json은 양쪽 모두 사용 가능)
+SNAPSHOT_DIR = os.path.join("static", "board")
+THUMB_BASE = thumbs.PUBLIC_BASE_URL   # 썸네일 파일은 저장소에 없으므로 게시 주소(thumbs 브랜치)로 연결
+APP_URL_ENV = "SENSING_APP_URL"    # 설정돼 있으면 페이지 상단/카드에 대시보드 링크를 붙임
+
+PAGE_CSS = """
+    body { margin: 0; background: #FFFFFF; color: #262626; font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; }
+    .page { max-width: 1200px; margin: 0 auto; padding: 1.5rem 1rem 3rem; }
+    .grid { display: grid; grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 1rem; }
+    @media (max-width: 900px) { .grid { grid-template-columns: minmax(0, 1fr); } }
+    .card { border: 1px solid rgba(49, 51, 63, 0.2); border-radius: 8px; padding: 1rem; }
+    .card[hidden] { display: none; }
+    .card-meta { display: flex; justify-content: space-between; align-items: center; margin-top: 15px; gap: 8px; }
+    .app-link { border-radius: 6px; padding: 4px 10px; color: #0284C7; font-weight: 700; background-color: #E0F2FE; font-size: 0.65rem; white-space: nowrap; text-decoration: none; }
+    .app-link:hover { background-color: #BAE6FD; color: #0369A1; }
+    .generated { text-align: center; font-size: 0.8rem; color: #64748B; margin-bottom: 1rem; }
+    .filters { display: flex; justify-content: center; flex-wrap: wrap; background: #F1F5F9; padding: 4px; border-radius: 9999px; width: fit-content; margin: 0 auto 1.5rem; }
+    .filters button { background: transparent; border: none; padding: 8px 24px; border-radius: 9999px; cursor: pointer; color: #64748B; font-weight: 600; font-size: 0.9rem; }
+    .filters button.active { background: #0072FF; color: #FFFFFF; font-weight: 800; box-shadow: 0 4px 12px rgba(0, 114, 255, 0.25); }
+    .more { display: block; margin: 1.5rem auto 0; padding: 8px 24px; border: 1px solid #E2E8F0; border-radius: 12px; background: white; cursor: pointer; font-weight: 600; }
+    .empty { text-align: center; color: #64748B; }
+"""
+
+# 스트림 필터/더 보기: 필터별 인덱스는 board.json과 같은 값을 페이지에 심어 두고 보이기/숨기기만 합니다.
+STREAM_JS = """
+(function () {
+  var filters = JSON.parse(document.getElementById('stream-filters').textContent);
+  var pageSize = %d, current = Object.keys(filters)[0], visible = pageSize;
+  var cards = document.querySelectorAll('#stream .card'), more = document.getElementById('stream-more');
+  var empty = document.getElementById('stream-empty');
+  function render() {
+    var show = {};
+    filters[current].slice(0, visible).forEach(function (i) { show[i] = true; });
+    cards.forEach(function (c) { c.hidden = !show[c.dataset.i]; });
+    var total = filters[current].length, shown = Math.min(visible, total);
+    more.hidden = total <= visible;
+    more.textContent = '⬇️ 더 보기 (' + shown + ' / ' + total + ')';
+    empty.hidden = total > 0;
+    document.querySelectorAll('.filters button').forEach(function (b) { b.classList.toggle('active', b.dataset.f === current); });
+  }
+  document.querySelectorAll('.filters button').forEach(function (b) {
+    b.addEventListener('click', function () { current = b.dataset.f; visible = pageSize; render(); });
+  });
+  more.addEventListener('click', function () { visible += pageSize; render(); });
+  render();
+})();
+"""
+
+def _write(path, text):
+    with open(path + ".tmp", "w", encoding="utf-8") as f: f.write(text)
+    os.replace(path + ".tmp", path)
+
+def compact_item(item):
+    """board.json용 카드 1장: 화면에 그리는 데 필요한 필드만."""
+    d = {
+        "id": item['id'],
+        "title": item.get("insight_title", item.get("title_en", "")),
+        "summary": item.get("core_summary", item.get("summary_ko", "")),
+        "link": item.get("link", ""),
+        "source": item.get("source", ""),
+        "category": item.get("category", ""),
+        "date": item.get("date", ""),
+        "score": item.get("score", 0),
+        "thumb": board._thumb(item, 800, THUMB_BASE),
+    }
+    if item.get("reason_html"): d["reason"] = item["reason_html"]
+    if item.get("community_buzz"): d["buzz"] = item.get("buzz_words", [])
+    if item.get("dup_count", 1) > 1: d["dup_count"] = item["dup_count"]
+    return d
+
+def _card(item, app_url, index=None):
+    attr = f' data-i="{index}"' if index is not None else ""
+    link = f'<a class="app-link" href="{html.escape(app_url)}" target="_blank">AI 분석</a>' if app_url else ""
+    return f'<div class="card"{attr}>{item["card_html"]}<div class="card-meta">{item["meta_html"]}{link}</div></div>'
+
+def render_page(view, generated_at, app_url=None):
+    total_picks = view["total_picks"]
+    parts = [board.HERO_BANNER_HTML, f'<div class="generated">{generated_at} 모닝 배치 기준 · 기본 설정 보드']
+    if app_url: parts.append(f' · <a href="{html.escape(app_url)}" target="_blank">맞춤 설정/AI 분석은 대시보드에서</a>')
+    parts.append('</div>')
+
+    if view["must_know"]:
+        parts.append("<div class='section-header'>🔥 MUST KNOW <span class='section-desc'>글로벌 매체 핵심 이슈</span></div>")
+        parts.append('<div class="grid">' + "".join(_card(i, app_url) for i in view["must_know"]) + '</div>')
+    if view["top_picks"]:
+        parts.append(f"<div class='section-header'>🏆 Today's Top Picks <span class='section-desc'>글로벌 & 중국 큐레이션 (총 {total_picks}개)</span></div>")
+        parts.append('<div class="grid">' + "".join(_card(i, app_url) for i in view["top_picks"]) + '</div>')
+    if view["stream"]:
+        parts.append("<br><div class='section-header'>🌊 Sensing Stream <span class='section-desc'>기타 관심 동향 타임라인</span></div>")
+        parts.append('<div class="filters">' + "".join(f'<button data-f="{html.escape(name)}">{html.escape(name)}</button>' for name in view["stream_filters"]) + '</div>')
+        parts.append('<div id="stream" class="grid">' + "".join(_card(item, app_url, i) for i, item in enumerate(view["stream"])) + '</div>')
+        parts.append('<p id="stream-empty" class="empty" hidden>해당 조건에 맞는 기사가 없습니다.</p><button id="stream-more" class="more" hidden></button>')
+        filters_json = json.dumps(view["stream_filters"], ensure_ascii=False, separators=(",", ":"))
+        parts.append(f'<script type="application/json" id="stream-filters">{filters_json}</script>')
+        parts.append(f'<script>{STREAM_JS % board.STREAM_PAGE_SIZE}</script>')
+
+    return ('<!DOCTYPE html>\n<html lang="ko"><head><meta charset="utf-8">'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">'
+            '<title>NGEPT Sensing Dashboard</title>'
+            f'<style>{PAGE_CSS}{board.CARD_CSS}</style></head>'
+            f'<body><div class="page">{"".join(parts)}</div></body></html>\n')
+
+def export(final_pool, out_dir=SNAPSHOT_DIR, now=None):
+    """게시 기사 풀 → 기본 설정 보드의 index.html + board.json. 반환: 보드에 오른 기사 수"""
+    now = now or datetime.now()
+    news_list = [dict(a) for a in board.ranked_items(final_pool)]   # build_view가 카드 HTML을 붙이므로 사본 사용
+    # 💡 공용 스냅샷이라 개인 학습 규칙(has_prefs) 문구 없이 점수 기준 추천 이유를 씁니다.
+    view = board.build_view(news_list, board.DEFAULT_TOP_PICKS, board.DEFAULT_GLOBAL_RATIO / 100.0, False, now=now, thumb_base=THUMB_BASE)
+    for item in view["must_know"] + view["top_picks"]:
+        item["reason_html"] = board.reason_text(item, False, now)
+
+    generated_at = now.strftime("%Y-%m-%d %H:%M")
+    data = {
+        "generated_at": now.isoformat(timespec="seconds"),
+        "settings": {"min_score": board.DEFAULT_MIN_SCORE, "max_articles": board.DEFAULT_MAX_ARTICLES,
+                     "top_picks": board.DEFAULT_TOP_PICKS, "global_ratio": board.DEFAULT_GLOBAL_RATIO},
+        "must_know": [compact_item(i) for i in view["must_know"]],
+        "top_picks": [compact_item(i) for i in view["top_picks"]],
+        "stream": [compact_item(i) for i in view["stream"]],
+        "stream_filters": view["stream_filters"],
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    _write(os.path.join(out_dir, "board.json"), json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+    _write(os.path.join(out_dir, "index.html"), render_page(view, generated_at, os.environ.get(APP_URL_ENV, "").strip() or None))
+    print(f"📸 정적 보드 스냅샷 저장: {out_dir}/ (MUST KNOW {len(view['must_know'])} / Top Picks {len(view['top_picks'])} / Stream {len(view['stream'])})")
+    return view["count"]
@@ -0,0 +1,33 @@
+import json
+import os
+import time
+from datetime import datetime
+
+# ==========================================
+# ⏱️ [콜드 스타트 측정] 대시보드 프로세스의 첫 화면까지 걸린 시간 기록
+# ==========================================
+# 💡 app.py 맨 위에서 가장 먼저 import되므로, 이 모듈이 처음 로드된 시각 = 새 프로세스에서 스크립트가 처음 돈 시각입니다.
+#    rerun 때는 모듈이 다시 로드되지 않아 측정은 프로세스(컨테이너 재시작)당 한 번만 남습니다.
+#    구간: imports(모듈 import 완료) → board_view(보드 뷰모델 준비) → first_run(첫 실행 끝)
+#    결과는 콘솔과 STARTUP_LOG(JSON Lines)에 남겨 재시작마다 추이를 볼 수 있습니다.
+STARTUP_LOG = "startup_log.jsonl"
+T0 = time.perf_counter()
+_marks = {}
+_done = False
+
+def mark(name):
+    """첫 실행 중에만 T0 기준 경과 시간(ms)을 기록합니다."""
+    if not _done: _marks[name] = round((time.perf_counter() - T0) * 1000, 1)
+
+def finish(path=STARTUP_LOG):
+    """첫 실행이 끝났을 때 한 번만 기록합니다. 반환: 기록한 dict (이미 기록했으면 None)"""
+    global _done
+    if _done: return None
+    mark("first_run")
+    _done = True
+    record = {"at": datetime.now().isoformat(timespec="seconds"), "pid": os.getpid(), **_marks}
+    print(f"⏱️ 대시보드 콜드 스타트: {_marks}")
+    try:
+        with open(path, "a", encoding="utf-8") as f: f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except Exception as e: print(f"⚠️ 시작 시간 기록 실패: {e}")
+    return record
@@ -0,0 +1,51 @@
+import entities
+
+# ==========================================
+# 📊 [풀 통계] 저장 시점에 누적해 두는 요약 통계
+# ==========================================
+# 💡 통계 모달/0건 안내 패널이 열릴 때마다 기사 풀을 여러 번 훑지 않도록,
+#    풀을 쓰는 쪽(store)이 기사를 넣고 뺄 때마다 이 카운터를 +1/-1로 갱신해 둡니다.
+#    점수는 0~100 히스토그램으로 들고 있어 '최소 N점 이상' 건수도 풀 크기와 무관하게 바로 나옵니다.
+SCORE_BUCKETS = (("90-100", 90, 100), ("70-89", 70, 89), ("50-69", 50, 69), ("0-49", 0, 49))
+
+# 💡 키워드는 entities 별칭으로 정규화해 세는데, 별칭은 배치마다 새로 학습됩니다. 더할 때와 뺄 때 별칭이 다르면
+#    ("GOOGLE GEMINI"로 더하고 "GEMINI"로 빼기) 카운터가 어긋나므로, 어떤 별칭으로 셌는지(alias_version)를 함께 남기고
+#    읽는 쪽(store)은 값이 다르면 풀 전체로 다시 계산합니다.
+def empty():
+    return {"total": 0, "sources": {}, "categories": {}, "score_hist": [0] * 101, "keywords": {}, "buzz_words": {}, "buzz_articles": 0,
+            "alias_version": entities.index_version()}
+
+def is_current(stats):
+    return stats.get("alias_version") == entities.index_version()
+
+def _bump(counter, key, sign):
+    v = counter.get(key, 0) + sign
+    if v > 0: counter[key] = v
+    else: counter.pop(key, None)
+
+def apply(stats, item, sign=1):
+    """기사 1건을 통계에 더하거나(sign=1) 뺍니다(sign=-1)."""
+    stats["total"] += sign
+    _bump(stats["sources"], item.get("source", "Unknown"), sign)
+    _bump(stats["categories"], item.get("category", ""), sign)
+    stats["score_hist"][max(0, min(100, int(item.get("score", 0) or 0)))] += sign
+    for k in {entities.canonical(k) for k in item.get("keywords", []) or [] if str(k).strip()}:
+        _bump(stats["keywords"], k, sign)
+    if item.get("community_buzz"):
+        stats["buzz_articles"] += sign
+        for k in set(item.get("buzz_words", []) or []): _bump(stats["buzz_words"], k, sign)
+    return stats
+
+def compute(items):
+    stats = empty()
+    for item in items: apply(stats, item)
+    return stats
+
+def count_at_least(stats, min_score):
+    return sum(stats["score_hist"][max(0, min(100, int(min_score))):])
+
+def buckets(stats):
+    return {name: sum(stats["score_hist"][lo:hi + 1]) for name, lo, hi in SCORE_BUCKETS}
+
+def top(counter, n=15):
+    return [k for k, _ in sorted(counter.items(), key=lambda kv: (-kv[1], kv[0]))[:n]]
@@ -0,0 +1,373 @@
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+import archive
+import buzz
+import dedup
+import stats
+
+# ==========================================
+# 🗄️ [기사 저장소] SQLite(WAL) 기반 인덱스 쿼리
+# ==========================================
+# 💡 today_news.json / manual_cache.json은 호환용 내보내기로 유지하고,
+#    대시보드는 이 DB에서 화면에 필요한 만큼만 인덱스 쿼리로 가져옵니다.
+DB_FILE = "sensing.db"
+POOL_DAILY = "daily"
+POOL_MANUAL = "manual"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    pool TEXT NOT NULL,
+    id TEXT NOT NULL,
+    date_obj TEXT,
+    score INTEGER NOT NULL DEFAULT 0,
+    category TEXT,
+    source TEXT,
+    cluster_id TEXT,
+    content_type TEXT,
+    community_buzz INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    PRIMARY KEY (pool, id)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_score ON articles (pool, score DESC, date_obj DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_date ON articles (pool, date_obj DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (pool, category, score DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (pool, source);
+CREATE INDEX IF NOT EXISTS idx_articles_cluster ON articles (pool, cluster_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS search_docs (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    day TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    score INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_docs_day ON search_docs (day);
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5 (
+    title, insight_title, core_summary, summary, keywords,
+    content='', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TABLE IF NOT EXISTS search_indexed_days (
+    day TEXT PRIMARY KEY
+);
+"""
+
+_initialized = set()
+
+def connect(path=DB_FILE):
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if path not in _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        _initialized.add(path)
+    return conn
+
+def _row(pool, item):
+    return (
+        pool, item['id'], item.get('date_obj', ''), int(item.get('score', 0) or 0), item.get('category', ''),
+        item.get('source', ''), item.get('cluster_id', item['id']), item.get('content_type', 'news'),
+        1 if item.get('community_buzz') else 0, json.dumps(item, ensure_ascii=False),
+    )
+
+_UPSERT_SQL = (
+    "INSERT INTO articles (pool, id, date_obj, score, category, source, cluster_id, content_type, community_buzz, data) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(pool, id) DO UPDATE SET date_obj=excluded.date_obj, score=excluded.score, category=excluded.category, "
+    "source=excluded.source, cluster_id=excluded.cluster_id, content_type=excluded.content_type, "
+    "community_buzz=excluded.community_buzz, data=excluded.data"
+)
+
+# ==========================================
+# 📊 [풀 통계] 쓰기 시점에 함께 갱신
+# ==========================================
+def _load_stats(conn, pool):
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (f"{pool}_stats",)).fetchone()
+    if row:
+        pool_stats = json.loads(row[0])
+        if stats.is_current(pool_stats): return pool_stats
+    # 통계가 없던 예전 DB, 또는 엔티티 별칭이 바뀐 뒤에는 한 번만 풀 전체로 다시 계산해 저장
+    pool_stats = stats.compute(json.loads(r[0]) for r in conn.execute("SELECT data FROM articles WHERE pool = ?", (pool,)))
+    _save_stats(conn, pool, pool_stats)
+    return pool_stats
+
+def _save_stats(conn, pool, pool_stats):
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (f"{pool}_stats", json.dumps(pool_stats, ensure_ascii=False)))
+
+def load_stats(pool):
+    """카테고리/매체/점수 히스토그램/키워드/버즈 요약. 풀 크기와 무관하게 meta 1행만 읽습니다."""
+    conn = connect()
+    try:
+        with conn: return _load_stats(conn, pool)
+    finally:
+        conn.close()
+
+def upsert_articles(items, pool):
+    conn = connect()
+    try:
+        with conn:
+            # 💡 바뀌는 기사만 통계에서 빼고(-1) 새 값으로 다시 더합니다(+1).
+            pool_stats = _load_stats(conn, pool)
+            ids = [item['id'] for item in items]
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                for (data,) in conn.execute(f"SELECT data FROM articles WHERE pool = ? AND id IN ({','.join('?' * len(chunk))})", [pool, *chunk]):
+                    stats.apply(pool_stats, json.loads(data), -1)
+            for item in items: stats.apply(pool_stats, item)
+            conn.executemany(_UPSERT_SQL, [_row(pool, item) for item in items])
+            _save_stats(conn, pool, pool_stats)
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (f"{pool}_updated_at", datetime.now().isoformat()))
+    finally:
+        conn.close()
+
+def pool_version(pool):
+    """풀이 마지막으로 바뀐 시각. 대시보드 뷰모델 캐시 키로 씁니다."""
+    conn = connect()
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (f"{pool}_updated_at",)).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+def replace_pool(items, pool, source_mtime=None):
+    """풀 전체를 새 결과로 교체 (모닝 배치/수동 센싱 1회 실행 = 풀 1개). 한 트랜잭션이라 읽는 쪽은 빈 풀을 보지 않습니다."""
+    conn = connect()
+    try:
+        with conn:
+            conn.execute("DELETE FROM articles WHERE pool = ?", (pool,))
+            conn.executemany(_UPSERT_SQL, [_row(pool, item) for item in items])
+            _save_stats(conn, pool, stats.compute({item['id']: item for item in items}.values()))   # 같은 id는 마지막 행만 남으므로 통계도 동일하게
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (f"{pool}_updated_at", datetime.now().isoformat()))
+            if source_mtime is not None:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (f"{pool}_source_mtime", repr(source_mtime)))
+            # 새로 채점된 풀이 들어오면 이전 풀 기준의 재채점 대기열은 의미가 없음
+            conn.execute("DELETE FROM meta WHERE key = ?", (f"{pool}_rescore_queue",))
+    finally:
+        conn.close()
+
+def load_rescore_queue(pool):
+    """학습 규칙 변경으로 매칭 상태가 바뀌어 LLM 재채점을 기다리는 기사 id 목록."""
+    conn = connect()
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (f"{pool}_rescore_queue",)).fetchone()
+    finally:
+        conn.close()
+    return json.loads(row[0]) if row else []
+
+def save_rescore_queue(pool, ids):
+    conn = connect()
+    try:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (f"{pool}_rescore_queue", json.dumps(sorted(set(ids)))))
+    finally:
+        conn.close()
+
+def get_articles(pool, ids):
+    if not ids: return []
+    conn = connect()
+    try:
+        rows = conn.execute(f"SELECT data FROM articles WHERE pool = ? AND id IN ({','.join('?' * len(ids))})", [pool, *ids]).fetchall()
+    finally:
+        conn.close()
+    return [json.loads(r[0]) for r in rows]
+
+def sync_from_json(json_path, pool):
+    """JSON 내보내기 파일이 DB보다 새로우면(예: CI가 커밋한 today_news.json) 한 번만 읽어 DB에 반영합니다."""
+    if not os.path.exists(json_path): return False
+    mtime = os.path.getmtime(json_path)
+    conn = connect()
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (f"{pool}_source_mtime",)).fetchone()
+    finally:
+        conn.close()
+    if row and float(row[0]) >= mtime: return False
+    try:
+        with open(json_path, "r", encoding="utf-8") as f: items = json.load(f)
+    except: return False
+    # 💡 클러스터 정보가 없는 예전 파일은 여기서 한 번만 계산해 저장합니다.
+    if items and 'cluster_id' not in items[0]: dedup.assign_clusters(items)
+    replace_pool(items, pool, source_mtime=mtime)
+    return True
+
+def query_articles(pool, min_score=None, categories=None, content_type=None, limit=None, offset=0):
+    sql = "SELECT data FROM articles WHERE pool = ?"
+    params = [pool]
+    if min_score is not None:
+        sql += " AND score >= ?"
+        params.append(min_score)
+    if categories:
+        sql += f" AND category IN ({','.join('?' * len(categories))})"
+        params.extend(categories)
+    if content_type:
+        sql += " AND content_type = ?"
+        params.append(content_type)
+    sql += " ORDER BY score DESC, date_obj DESC, id"
+    if limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+    conn = connect()
+    try:
+        return [json.loads(r[0]) for r in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+def count_articles(pool, min_score=None):
+    sql = "SELECT COUNT(*) FROM articles WHERE pool = ?"
+    params = [pool]
+    if min_score is not None:
+        sql += " AND score >= ?"
+        params.append(min_score)
+    conn = connect()
+    try:
+        return conn.execute(sql, params).fetchone()[0]
+    finally:
+        conn.close()
+
+# ==========================================
+# 🔎 [전문 검색] FTS5 인덱스 (아카이브 + 수동 센싱 전체)
+# ==========================================
+# 💡 unicode61 토크나이저는 한국어 조사를 분리하지 못하므로('스마트링은'), 한/중/일 단어는
+#    글자 bigram을 함께 색인하고 검색어도 bigram AND 조건으로 바꿔서 찾습니다.
+SEARCH_WEIGHTS = (3.0, 3.0, 1.5, 1.0, 2.0)   # title, insight_title, core_summary, summary, keywords
+
+def _fts_text(text):
+    text = str(text or "")
+    bigrams = [w[i:i + 2] for w in re.findall(r'\w+', text.lower()) if not w.isascii() and len(w) > 2 for i in range(len(w) - 1)]
+    return text + (" " + " ".join(bigrams) if bigrams else "")
+
+def _fts_query(query):
+    terms = []
+    for w in re.findall(r'\w+', str(query or "").lower()):
+        if w.isascii(): terms.append(f'"{w}"*')
+        elif len(w) > 2: terms.extend(f'"{w[i:i + 2]}"' for i in range(len(w) - 1))
+        else: terms.append(f'"{w}"')
+    return " AND ".join(terms)
+
+def _fts_values(item):
+    return (
+        _fts_text(item.get('title_en', '')), _fts_text(item.get('insight_title', '')), _fts_text(item.get('core_summary', '')),
+        _fts_text(item.get('summary_en', '')), _fts_text(" ".join(str(k) for k in item.get('keywords', []) or [])),
+    )
+
+def index_articles(items, day, origin, conn=None):
+    """기사를 검색 인덱스에 추가/갱신합니다. 같은 기사가 여러 날 잡히면 가장 최근 날짜로 덮어씁니다."""
+    own = conn is None
+    conn = conn or connect()
+    try:
+        with conn:
+            for item in items:
+                old = conn.execute("SELECT rowid, day FROM search_docs WHERE id = ?", (item['id'],)).fetchone()
+                if old:
+                    if old[1] > day: continue
+                    # contentless FTS5 테이블은 'delete' 명령에 기존 색인 값을 그대로 넘겨야 합니다.
+                    prev = json.loads(conn.execute("SELECT data FROM search_docs WHERE rowid = ?", (old[0],)).fetchone()[0])
+                    conn.execute("INSERT INTO search_fts (search_fts, rowid, title, insight_title, core_summary, summary, keywords) VALUES ('delete', ?, ?, ?, ?, ?, ?)", (old[0], *_fts_values(prev)))
+                    conn.execute("DELETE FROM search_docs WHERE rowid = ?", (old[0],))
+                cur = conn.execute("INSERT INTO search_docs (id, day, origin, score, data) VALUES (?, ?, ?, ?, ?)",
+                                   (item['id'], day, origin, int(item.get('score', 0) or 0), json.dumps(item, ensure_ascii=False)))
+                conn.execute("INSERT INTO search_fts (rowid, title, insight_title, core_summary, summary, keywords) VALUES (?, ?, ?, ?, ?, ?)", (cur.lastrowid, *_fts_values(item)))
+    finally:
+        if own: conn.close()
+
+def sync_search_from_archive():
+    """아직 색인하지 않은 아카이브 날짜만 증분 색인합니다."""
+    conn = connect()
+    try:
+        done = {r[0] for r in conn.execute("SELECT day FROM search_indexed_days")}
+        new_days = [d for d in archive.list_days() if d not in done]
+        for day in new_days: index_day(day, list(archive.read_day(day)), conn)
+        return new_days
+    finally:
+        conn.close()
+
+def index_day(day, items, conn=None):
+    """모닝 배치 하루치를 색인하고 해당 날짜를 색인 완료로 표시합니다."""
+    own = conn is None
+    conn = conn or connect()
+    try:
+        index_articles(items, day, "daily", conn)
+        with conn: conn.execute("INSERT OR IGNORE INTO search_indexed_days (day) VALUES (?)", (day,))
+    finally:
+        if own: conn.close()
+
+def search(query, since=None, min_score=None, limit=30):
+    """BM25 순위로 검색 결과(기사 dict + day, rank)를 반환합니다. since는 'YYYY-MM-DD'."""
+    match = _fts_query(query)
+    if not match: return []
+    sql = (f"SELECT d.data, d.day, bm25(search_fts, {', '.join(str(w) for w in SEARCH_WEIGHTS)}) AS rank "
+           "FROM search_fts JOIN search_docs d ON d.rowid = search_fts.rowid WHERE search_fts MATCH ?")
+    params = [match]
+    if since:
+        sql += " AND d.day >= ?"
+        params.append(since)
+    if min_score is not None:
+        sql += " AND d.score >= ?"
+        params.append(min_score)
+    sql += " ORDER BY rank LIMIT ?"
+    params.append(limit)
+    conn = connect()
+    try:
+        results = []
+        for data, day, rank in conn.execute(sql, params):
+            item = json.loads(data)
+            item['day'] = day
+            item['rank'] = rank
+            results.append(item)
+        return results
+    finally:
+        conn.close()
+
+# ==========================================
+# 🧭 [연관 기사 검색] 심층 리포트 참고 기사 (BM25)
+# ==========================================
+RELATED_MAX_TERMS = 16
+
+def _related_query(item):
+    """기사 키워드 + 영문 제목의 핵심 단어를 OR로 엮은 FTS 질의 (불용어 제외, 키워드 우선)."""
+    terms = []
+    words = " ".join(str(k) for k in item.get('keywords', []) or []) + " " + item.get('title_en', '')
+    for w in re.findall(r'\w+', words.lower()):
+        if w.isascii() and (len(w) < 3 or w in buzz.STOPWORDS or w.isdigit()): continue
+        if not w.isascii() and len(w) < 2: continue
+        if w not in terms: terms.append(w)
+    return " OR ".join(f'"{w}"' for w in terms[:RELATED_MAX_TERMS])
+
+def related(item, k=8, since=None):
+    """현재 풀 + 아카이브 색인에서 item과 가장 관련 깊은 기사 k개 (같은 기사/같은 스토리 클러스터는 제외)."""
+    match = _related_query(item)
+    if not match: return []
+    sql = (f"SELECT d.data, d.day, bm25(search_fts, {', '.join(str(w) for w in SEARCH_WEIGHTS)}) AS rank "
+           "FROM search_fts JOIN search_docs d ON d.rowid = search_fts.rowid WHERE search_fts MATCH ?")
+    params = [match]
+    if since:
+        sql += " AND d.day >= ?"
+        params.append(since)
+    sql += " ORDER BY rank LIMIT ?"
+    params.append(k * 3)
+    conn = connect()
+    try:
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+    results = []
+    seen = {item.get('id'), item.get('cluster_id')} - {None}
+    seen_titles = {item.get('title_en', '').lower()}
+    for data, day, rank in rows:
+        doc = json.loads(data)
+        if doc.get('id') in seen or doc.get('cluster_id') in seen or doc.get('title_en', '').lower() in seen_titles: continue
+        seen.add(doc.get('id'))
+        if doc.get('cluster_id'): seen.add(doc['cluster_id'])
+        seen_titles.add(doc.get('title_en', '').lower())
+        doc['day'] = day
+        doc['rank'] = rank
+        results.append(doc)
+        if len(results) >= k: break
+    return results
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+# 💡 모듈이 저장소 최상위에 평평하게 있으므로 루트를 import 경로에 올립니다.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path: sys.path.insert(0, ROOT)
+
+@pytest.fixture
+def tmp_db(tmp_path, monkeypatch):
+    """store/trends/analysis_cache가 쓰는 sensing.db를 임시 폴더에 새로 만듭니다 (DB 경로가 상대 경로라 chdir로 충분)."""
+    import analysis_cache
+    import store
+    import trends
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(store, "_initialized", set())
+    monkeypatch.setattr(trends, "_initialized", False)
+    monkeypatch.setattr(analysis_cache, "_initialized", False)
+    return tmp_path
+
+@pytest.fixture
+def make_item():
+    """테스트용 기사 dict 팩토리: make_item("a", score=80, title_en="...")"""
+    def make(id, **fields):
+        item = {"id": id, "score": 0, "category": "Global", "source": "Src", "date_obj": "2026-10-19T00:00:00"}
+        item.update(fields)
+        return item
+    return make
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import analysis_cache
+
+class _Clock(datetime):
+    current = datetime(2026, 10, 19, 9, 0)
+
+    @classmethod
+    def now(cls, tz=None): return cls.current
+
+@pytest.fixture
+def clock(tmp_db, monkeypatch):
+    monkeypatch.setattr(analysis_cache, "datetime", _Clock)
+    _Clock.current = datetime(2026, 10, 19, 9, 0)
+    def tick(**kw):
+        _Clock.current += timedelta(**kw)
+    return tick
+
+def test_cache_key_separates_persona_prompt_and_option():
+    keys = {analysis_cache.cache_key("a", analysis_cache.KIND_DEEP, p, q, o)
+            for p in ("전략가", "디자이너") for q in ("요약해줘", "비판해줘") for o in ("", "web")}
+    assert len(keys) == 8
+    assert analysis_cache.cache_key("a", "basic", "p", "q") == analysis_cache.cache_key("a", "basic", "p", "q")
+
+def test_get_put_invalidate(clock):
+    analysis_cache.put("k", "a", analysis_cache.KIND_DEEP, [{"slide_num": 1, "title": "요약"}])
+    assert analysis_cache.get("k") == [{"slide_num": 1, "title": "요약"}]
+    analysis_cache.invalidate("k")
+    assert analysis_cache.get("k") is None
+
+def test_ttl_expires_entries(clock):
+    analysis_cache.put("old", "a", analysis_cache.KIND_BASIC, "오래된 분석")
+    clock(days=analysis_cache.CACHE_TTL_DAYS - 1)
+    assert analysis_cache.get("old") == "오래된 분석"   # 읽어도 생성 시각 기준이라 수명이 늘지 않음
+    clock(days=2)
+    assert analysis_cache.get("old") is None
+
+def test_put_purges_expired_and_evicts_least_recently_used(clock, monkeypatch):
+    monkeypatch.setattr(analysis_cache, "CACHE_MAX_ENTRIES", 3)
+    analysis_cache.put("expired", "x", "basic", "x")
+    clock(days=analysis_cache.CACHE_TTL_DAYS + 1)
+    for k in ("k1", "k2", "k3"):
+        analysis_cache.put(k, k, "basic", k)
+        clock(minutes=1)
+    assert analysis_cache.get("k1") == "k1"   # k1을 최근에 씀 → 가장 오래 안 쓴 건 k2
+    clock(minutes=1)
+    analysis_cache.put("k4", "k4", "basic", "k4")
+    conn = analysis_cache._connect()
+    try: keys = {r[0] for r in conn.execute("SELECT key FROM analysis_cache")}
+    finally: conn.close()
+    assert keys == {"k1", "k3", "k4"}
@@ -0,0 +1,77 @@
+import base64
+import json
+import os
+
+import archive
+
+def _day(make_item, prefix, scores, **kw):
+    return [make_item(f"{prefix}{i}", score=s, title_en=f"Story {prefix}{i}", **kw) for i, s in enumerate(scores)]
+
+def test_write_and_read_day_sorted(tmp_path, make_item):
+    d = str(tmp_path)
+    archive.write_day("2026-10-19", _day(make_item, "a", [40, 90, 70]), d)
+    assert [i["score"] for i in archive.read_day("2026-10-19", d)] == [90, 70, 40]
+    meta = archive.load_manifest(d)["days"]["2026-10-19"]
+    assert (meta["count"], meta["min_score"], meta["max_score"], meta["categories"]) == (3, 40, 90, {"Global": 3})
+    assert list(archive.read_day("2026-01-01", d)) == []
+
+def test_bloom_size_and_false_positive_rate():
+    assert archive.bloom_size(0) == (archive.BLOOM_MIN_BITS, archive.BLOOM_MAX_HASHES)
+    members = {f"token{i}" for i in range(5000)}
+    bloom, m, k = archive.build_bloom(members)
+    assert m == archive.bloom_size(5000)[0] and k == 7
+    meta = {"bloom": bloom, "bloom_bits": m, "bloom_hashes": k}
+    assert all(archive.bloom_contains(meta, {t}) for t in list(members)[:500])
+    false_hits = sum(archive.bloom_contains(meta, {f"other{i}"}) for i in range(5000))
+    assert false_hits / 5000 < 0.02   # 목표 1%
+
+def test_bloom_reads_legacy_manifest_defaults():
+    bits = bytearray(archive.BLOOM_BITS // 8)
+    for p in archive._bloom_positions("gemini"): bits[p >> 3] |= 1 << (p & 7)
+    meta = {"bloom": base64.b64encode(bytes(bits)).decode()}   # bloom_bits / bloom_hashes 없는 예전 항목
+    assert archive.bloom_contains(meta, {"gemini"}) and not archive.bloom_contains(meta, {"gemini", "orion"})
+
+def test_query_tokens_match_korean_particles(make_item):
+    item = make_item("a", insight_title="삼성 스마트링은 수면 분석 강화")
+    assert archive.query_tokens("스마트링") <= archive.item_tokens(item)
+    assert not archive.query_tokens("스마트워치") <= archive.item_tokens(item)
+    assert archive.query_tokens("AI 링") == {"ai", "링"}
+
+def test_scan_filters_and_skips_days(tmp_path, make_item, monkeypatch):
+    d = str(tmp_path)
+    archive.write_day("2026-10-17", _day(make_item, "a", [95, 80, 30], insight_title="스마트링은 수면을 본다"), d)
+    archive.write_day("2026-10-18", _day(make_item, "b", [60, 50]), d)
+    archive.write_day("2026-10-19", _day(make_item, "c", [85], category="China", keywords=["Galaxy Ring"]), d)
+
+    opened = []
+    read_day = archive.read_day
+    def counting_read(date_str, archive_dir):
+        for item in read_day(date_str, archive_dir):
+            opened.append(item["id"])
+            yield item
+    monkeypatch.setattr(archive, "read_day", counting_read)
+
+    hits = list(archive.scan(min_score=80, archive_dir=d))
+    assert [(i["id"], i["archive_date"]) for i in hits] == [("a0", "2026-10-17"), ("a1", "2026-10-17"), ("c0", "2026-10-19")]
+    assert opened == ["a0", "a1", "a2", "c0"]   # 10-18은 max_score로 건너뛰고, 10-17은 30점에서 중단
+
+    opened.clear()
+    assert [i["id"] for i in archive.scan(keyword="스마트링", archive_dir=d)] == ["a0", "a1", "a2"]
+    assert set(opened) == {"a0", "a1", "a2"}   # 블룸 필터로 다른 날은 열지 않음
+    assert [i["id"] for i in archive.scan(categories=["China"], keyword="galaxy ring", archive_dir=d)] == ["c0"]
+    assert [i["id"] for i in archive.scan(start="2026-10-18", end="2026-10-18", archive_dir=d)] == ["b0", "b1"]
+
+def test_migrate_legacy_and_reindex(tmp_path, make_item):
+    d = str(tmp_path)
+    legacy = os.path.join(d, "morning_sensing_2026-10-01.json")
+    with open(legacy, "w", encoding="utf-8") as f: json.dump(_day(make_item, "x", [10, 70]), f)
+    with open(os.path.join(d, "morning_sensing_2026-10-02.json"), "w", encoding="utf-8") as f: f.write("{broken")
+    assert archive.migrate_legacy(d) == ["2026-10-01"]
+    assert not os.path.exists(legacy) and os.path.exists(os.path.join(d, "morning_sensing_2026-10-02.json"))
+    assert [i["id"] for i in archive.read_day("2026-10-01", d)] == ["x1", "x0"]
+
+    manifest = archive.load_manifest(d)
+    manifest["days"]["2026-10-01"].update(bloom="", bloom_bits=8, bloom_hashes=1)   # 예전 크기 규칙으로 저장된 항목
+    archive._save_manifest(manifest, d)
+    assert archive.reindex(d) == ["2026-10-01"]
+    assert [i["id"] for i in archive.scan(keyword="story x1", archive_dir=d)] == ["x1"]
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import board
+import store
+
+NOW = datetime(2026, 10, 19, 9, 0)
+
+def _pool(make_item):
+    specs = [("g1", 95, "Global Innovation", "s1"), ("g2", 90, "Global Innovation", "s1"), ("g3", 88, "Global Innovation", "s2"),
+             ("g4", 80, "Global Innovation", "s3"), ("g5", 75, "Global Innovation", "s4"), ("g6", 70, "Global Innovation", "s5"),
+             ("c1", 85, "China & East Asia", "c1"), ("c2", 60, "China & East Asia", "c2"), ("j1", 65, "Japan & Robotics", "j1"),
+             ("low", 30, "Global Innovation", "low")]
+    return [make_item(i, score=s, category=c, cluster_id=cl, title_en=f"Story {i}", link=f"https://ex.com/{i}", date_obj="2026-10-19T08:00:00") for i, s, c, cl in specs]
+
+def test_ranked_items_matches_store_order(tmp_db, make_item):
+    items = [make_item("b", score=70, date_obj="2026-10-19T01:00:00"), make_item("a", score=70, date_obj="2026-10-19T01:00:00"),
+             make_item("c", score=70, date_obj="2026-10-19T05:00:00"), make_item("d", score=90), make_item("e", score=10)]
+    store.replace_pool(items, store.POOL_DAILY)
+    expected = [i["id"] for i in store.query_articles(store.POOL_DAILY, min_score=50, limit=3)]
+    assert [i["id"] for i in board.ranked_items(items, 50, 3)] == expected == ["d", "c", "a"]
+
+def test_partition_respects_global_ratio_and_fills(make_item):
+    ranked = board.ranked_items(_pool(make_item))
+    must_know, top_picks, stream = board.partition([dict(a) for a in ranked], 4, 0.5)
+    assert [a["id"] for a in must_know] == ["g1", "g3", "g4"]   # s1(2건) 클러스터 대표 g1 + 나머지 상위 클러스터
+    assert must_know[0]["dup_count"] == 2
+    assert [a["id"] for a in top_picks] == ["g5", "g6", "c1", "c2"]
+    assert [a["id"] for a in stream] == ["j1"]
+    # 중국 기사가 모자라면 남은 기사 중 점수순으로 채움
+    _, top_picks, _ = board.partition([dict(a) for a in ranked if a["category"] != "China & East Asia"], 4, 0.5)
+    assert [a["id"] for a in top_picks] == ["g5", "g6", "j1"]
+
+def test_build_view_renders_every_section(make_item):
+    news = board.ranked_items(_pool(make_item))
+    view = board.build_view(news, 4, 0.5, has_prefs=False, now=NOW, thumb_base="thumbs/")
+    assert view["count"] == len(news) == 9 and view["total_picks"] == 4
+    for item in view["must_know"] + view["top_picks"] + view["stream"]:
+        assert item["card_html"] and item["meta_html"]
+    assert "최신 속보" in view["must_know"][0]["card_html"]   # now 기준 1시간 전 기사
+
+def test_headline_items_returns_originals_untouched(make_item):
+    pool = _pool(make_item)
+    heads = board.headline_items(pool, total_picks=4, global_ratio=50)
+    assert [a["id"] for a in heads] == ["g1", "g3", "g4", "g5", "g6", "c1", "c2"]
+    assert all(any(a is p for p in pool) for a in heads)
+    assert not any("dup_count" in a or "card_html" in a for a in pool)
+
+def test_stream_filters_index_the_stream(make_item):
+    stream = [make_item(f"s{i}", score=60, category=["Global Innovation", "China & East Asia", "Japan & Robotics"][i % 3],
+                        link=f"https://ex.com/{i}", community_buzz=(i % 4 == 0)) for i in range(30)]
+    view = board.build_view(stream, 0, 0.5, has_prefs=False, now=NOW)
+    stream = view["stream"]
+    assert len(view["must_know"]) == board.MUST_KNOW_COUNT and view["top_picks"] == [] and len(stream) == 27
+    filters = view["stream_filters"]
+    assert list(filters) == list(board.STREAM_FILTERS)
+    assert filters["전체보기"] == list(range(27))
+    assert filters["중국 동향"] == [i for i, a in enumerate(stream) if a["category"] == "China & East Asia"] and len(filters["중국 동향"]) == 10
+    assert all(stream[i]["community_buzz"] for i in filters["커뮤니티 화제"])
+    assert len(filters["커뮤니티 화제"]) == sum(1 for a in stream if a["community_buzz"])
+    # 첫 화면은 한 페이지만, '더 보기' 한 번에 한 페이지씩 늘어남
+    assert len(filters["전체보기"][:board.STREAM_PAGE_SIZE]) == 12 and len(filters["전체보기"][:2 * board.STREAM_PAGE_SIZE]) == 24
+
+def test_stream_card_images_load_lazily(make_item):
+    card = board.stream_card_html(make_item("s1", link="https://ex.com/1", title_en="Story"))
+    assert 'loading="lazy"' in card and 'decoding="async"' in card
@@ -0,0 +1,59 @@
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+import buzz
+
+NOW = datetime(2026, 10, 19, 9, 0)
+
+def _post(title, hours_ago=0, source="r/gadgets"):
+    return {"title_en": title, "source": source, "date_obj": (NOW - timedelta(hours=hours_ago)).isoformat()}
+
+@pytest.fixture(autouse=True)
+def no_learned_aliases(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)   # 작업 폴더의 entity_aliases.json 영향 없이
+
+def test_extract_terms_skips_stopwords_and_numbers():
+    assert buzz.extract_terms("Is the Galaxy Ring 2 worth it?") == {"GALAXY", "RING", "GALAXY RING"}   # it, 2(한두 자리 숫자) 제외
+    assert buzz.extract_terms("iOS 26.1 beta") == {"IOS", "26.1", "BETA", "IOS 26.1", "26.1 BETA", "IOS 26.1 BETA"}
+    assert buzz.extract_terms("스마트링 후기") == {"스마트링", "후기", "스마트링 후기"}
+
+def test_compute_buzz_time_decay_and_phrase_dedup():
+    posts = [_post("Galaxy Ring"), _post("Galaxy Ring"), _post("Pixel Fold", 24), _post("Pixel Fold", 24), _post("Lonely Gadget")]
+    weights, _ = buzz.compute_buzz(posts, now=NOW)
+    # 하루 지난 글은 반감기 12시간 → 1/4, 'GALAXY'/'RING'은 이미 뽑힌 구에 포함되어 제외, 1회 언급은 잡음으로 제외
+    assert weights == {"GALAXY RING": 1.0, "PIXEL FOLD": 0.25}
+
+def test_compute_buzz_rewards_source_diversity():
+    posts = [_post("Orion", source="r/oculus"), _post("Orion", source="Hacker News"), _post("Pixel"), _post("Pixel")]
+    weights, _ = buzz.compute_buzz(posts, now=NOW)
+    # 같은 언급 수라도 두 커뮤니티에서 나오면 (1 + 0.5·ln 2)배
+    assert weights == {"ORION": 1.0, "PIXEL": round(1 / (1 + 0.5 * math.log(2)), 3)}
+
+def test_compute_buzz_novelty_against_ema_baseline():
+    posts = [_post("Orion"), _post("Orion"), _post("Pixel"), _post("Pixel")]
+    previous = {"baseline": {"ORION": 2.0, "OLD TOPIC": 0.06}}
+    weights, baseline = buzz.compute_buzz(posts, previous=previous, now=NOW)
+    assert weights == {"PIXEL": 1.0, "ORION": 0.5}   # 어제도 화제였던 키워드는 신규성 v / (v + 기준선)만큼 감점
+    assert baseline["ORION"] == pytest.approx(0.7 * 2.0 + 0.3 * 2.0)
+    assert baseline["PIXEL"] == pytest.approx(0.3 * 2.0)
+    assert "OLD TOPIC" not in baseline   # 0.06 × 0.7 < 0.05 → 정리
+
+def test_buzz_weights_reads_legacy_file():
+    assert buzz.buzz_weights({"keywords": ["gemini", "Orion"]}) == {"GEMINI": 1.0, "ORION": 1.0}
+    assert buzz.buzz_weights({"weights": {"gemini": 0.5}, "keywords": ["x"]}) == {"GEMINI": 0.5}
+
+def test_save_and_load_buzz(tmp_path):
+    path = str(tmp_path / "buzz.json")
+    buzz.save_buzz({"A": 1.0, "B": 0.5}, {"A": 0.3}, {"A": "Apple"}, path)
+    data = buzz.load_buzz(path)
+    assert data["keywords"] == ["A", "B"] and data["labels"] == {"A": "Apple"} and buzz.load_buzz(str(tmp_path / "x.json")) == {}
+
+def test_fuse_matches_through_aliases(make_item):
+    items = [make_item("a", score=95, keywords=["Gemini", "Pixel"]), make_item("b", score=60, keywords=["Orion"])]
+    buzz.fuse(items, {"GOOGLE GEMINI": 0.5, "제미나이": 0.2, "PIXEL": 0.01})
+    a, b = items
+    # GEMINI: 별칭 중 큰 가중치 0.5 → 4점, PIXEL: 최소 1점, 100점 상한
+    assert (a["score"], a["buzz_boost"], a["buzz_words"], a["community_buzz"]) == (100, 5, ["GEMINI", "PIXEL"], True)
+    assert (b["score"], b["buzz_boost"], b["community_buzz"]) == (60, 0, False)
@@ -0,0 +1,28 @@
+import channels
+
+def test_compile_registry_skips_invalid_entries():
+    data = {
+        "Global Innovation": [
+            {"name": "TechCrunch", "url": "https://techcrunch.com/feed/"},
+            {"name": "Bad Type", "url": "https://ex.com/a.xml", "type": "blog"},
+            {"name": "Bad Tier", "url": "https://ex.com/b.xml", "tier": 3},
+            {"name": "Bad Scheme", "url": "ftp://ex.com/c.xml"},
+            {"name": "No URL"},
+        ],
+        "China & East Asia": [
+            {"name": "TechCrunch again", "url": "https://techcrunch.com/feed/"},
+            {"name": "V2EX", "url": "https://www.v2ex.com/index.xml", "tier": 1},
+        ],
+    }
+    reg = channels.compile_registry(data)
+    assert [c["name"] for c in reg["channels"]] == ["TechCrunch", "V2EX"]
+    assert len(reg["errors"]) == 5 and reg["errors"] == channels.validate(data)
+    tc, v2ex = reg["channels"]
+    assert (tc["type"], tc["tier"], tc["lang"]) == ("news", 1, "en")
+    assert (v2ex["type"], v2ex["tier"], v2ex["region"]) == ("community", 1, "east_asia")
+    assert all(c["type"] in channels.CHANNEL_TYPES and c["tier"] in (1, 2) for c in reg["channels"])
+    assert reg["by_id"][channels.channel_id("https://techcrunch.com/feed/")] is tc
+
+def test_compile_registry_rejects_non_dict():
+    reg = channels.compile_registry(["https://ex.com/feed"])
+    assert reg["channels"] == [] and len(reg["errors"]) == 1
@@ -0,0 +1,103 @@
+import dedup
+
+# ==========================================
+# 🔗 URL 정규화
+# ==========================================
+def test_canonical_url_strips_tracking_and_noise():
+    a = "http://www.TechCrunch.com/2026/10/19/story/?utm_source=rss&src=rss#comments"
+    b = "https://techcrunch.com/2026/10/19/story"
+    assert dedup.canonical_url(a) == dedup.canonical_url(b) == "https://techcrunch.com/2026/10/19/story"
+
+def test_canonical_url_keeps_meaningful_query_sorted():
+    assert dedup.canonical_url("https://ex.com/a?b=2&utm_medium=x&a=1") == "https://ex.com/a?a=1&b=2"
+    assert dedup.canonical_url("https://ex.com:443//a//b/") == "https://ex.com/a/b"
+    assert dedup.canonical_url("") == ""
+
+def test_content_bearing_query_keeps_articles_distinct():
+    for a, b in [("https://ex.com/view?id=1", "https://ex.com/view?id=2"),
+                 ("https://blog.ex.com/?p=101", "https://blog.ex.com/?p=102"),
+                 ("https://ex.com/story?source=ap", "https://ex.com/story?source=reuters"),
+                 ("https://ex.com/a?ref=v2", "https://ex.com/a")]:
+        assert dedup.canonical_url(a) != dedup.canonical_url(b)
+        assert dedup.article_id(a) != dedup.article_id(b)
+    # 일반 이름이라도 값이 피드 표시면 제거
+    assert dedup.canonical_url("https://ex.com/a?source=rss&feed=atom&pk_id=3") == "https://ex.com/a?pk_id=3"
+
+def test_article_id_and_dedup_by_url():
+    u1 = "https://www.theverge.com/news/1?ref=feed"
+    u2 = "https://theverge.com/news/1"
+    assert dedup.article_id(u1) == dedup.article_id(u2)
+    items = [{"id": dedup.article_id(u1), "source": "Verge"}, {"id": dedup.article_id(u2), "source": "Verge Tech"}]
+    assert [i["source"] for i in dedup.dedup_by_url(items)] == ["Verge"]
+
+# ==========================================
+# 🧬 근접 중복 그룹
+# ==========================================
+SYNDICATED = "Samsung unveils Galaxy Ring 2 with longer battery life and new health sensors"
+
+def test_near_duplicates_grouped_across_sources(make_item):
+    items = [
+        make_item("b", title_en=SYNDICATED + " - Engadget", source="Engadget", pre_score=40),
+        make_item("a", title_en=SYNDICATED, source="Reuters", is_tier1=True, pre_score=30),
+        make_item("c", title_en="Apple delays its smart home display until next year", source="Bloomberg"),
+    ]
+    groups = sorted(dedup.group_near_duplicates(items), key=len, reverse=True)
+    assert [[i["id"] for i in g] for g in groups] == [["a", "b"], ["c"]]   # Tier 1이 대표
+
+def test_unrelated_titles_stay_apart(make_item):
+    items = [make_item(str(i), title_en=t) for i, t in enumerate([
+        "OpenAI ships a new reasoning model for developers",
+        "Xiaomi launches its first electric SUV in China",
+        "Meta cuts prices of Quest headsets ahead of holidays",
+    ])]
+    assert all(len(g) == 1 for g in dedup.group_near_duplicates(items))
+
+def test_split_and_propagate_scores(make_item):
+    items = [make_item("a", title_en=SYNDICATED, is_tier1=True), make_item("b", title_en=SYNDICATED + " (update)")]
+    reps, members = dedup.split_representatives(items)
+    assert [r["id"] for r in reps] == ["a"] and [m["id"] for m in members["a"]] == ["b"]
+    reps[0].update(score=77, keywords=["GALAXY RING"], insight_title="t")
+    out = dedup.propagate_scores(reps, members)
+    assert [i["id"] for i in out] == ["a", "b"]
+    assert out[1]["score"] == 77 and out[1]["keywords"] == ["GALAXY RING"] and out[1]["dup_of"] == "a"
+
+def test_merge_near_duplicates_unifies_shards(make_item):
+    # 서로 다른 샤드에서 따로 채점된 같은 기사: 채점에 성공한 쪽으로 통일
+    a = make_item("a", title_en=SYNDICATED, is_tier1=True, score=0, score_failed=True)
+    b = make_item("b", title_en=SYNDICATED + " - The Verge", score=82, keywords=["GALAXY RING"])
+    c = make_item("c", title_en="Apple delays its smart home display until next year", score=50)
+    assert dedup.merge_near_duplicates([a, b, c]) == 1
+    assert a["score"] == 82 and "score_failed" not in a and a["dup_of"] == "b"
+    assert "dup_of" not in b and "dup_of" not in c and c["score"] == 50
+
+# ==========================================
+# 🗂️ 스토리 클러스터링
+# ==========================================
+def test_assign_clusters_groups_same_story(make_item):
+    items = [
+        make_item("c", title_en="Apple unveils iPhone 18 Pro with under-display camera"),
+        make_item("a", title_en="iPhone 18 Pro gets an under-display camera, Apple confirms"),
+        make_item("b", title_en="Under-display camera: iPhone 18 Pro hands-on"),
+        make_item("d", title_en="Xiaomi launches its first electric SUV in China"),
+        make_item("e", title_en=""),
+    ]
+    dedup.assign_clusters(items)
+    by_id = {i["id"]: i for i in items}
+    assert {by_id[k]["cluster_id"] for k in "abc"} == {"a"} and by_id["a"]["cluster_size"] == 3   # 대표 id는 가장 작은 id
+    assert (by_id["d"]["cluster_id"], by_id["d"]["cluster_size"]) == ("d", 1)
+    assert (by_id["e"]["cluster_id"], by_id["e"]["cluster_size"]) == ("e", 1)   # 빈 제목도 안전하게 단독 클러스터
+
+def test_assign_clusters_uses_overlap_of_smaller_title(make_item):
+    # 짧은 제목이 긴 제목에 거의 포함되면 (작은 쪽 기준 겹침 ≥ 0.4) 같은 스토리
+    items = [make_item("a", title_en="Nothing Phone 4 launch date leaked"),
+             make_item("b", title_en="Nothing Phone 4 launch date leaked alongside pricing, colors, camera specs and a transparent design refresh")]
+    dedup.assign_clusters(items)
+    assert items[0]["cluster_id"] == items[1]["cluster_id"] == "a"
+
+def test_partition_uses_precomputed_clusters(make_item):
+    import board
+    items = [make_item(i, score=s, category="Global Innovation", cluster_id=c)
+             for i, s, c in [("a", 90, "x"), ("b", 80, "x"), ("c", 85, "y"), ("d", 70, "z"), ("e", 60, "x")]]
+    must_know, top_picks, stream = board.partition(items, 2, 1.0)
+    assert [(i["id"], i["dup_count"]) for i in must_know] == [("a", 3), ("c", 1), ("d", 1)]
+    assert top_picks == [] and stream == []
@@ -0,0 +1,52 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import enrich
+
+LONG = "Samsung's new ring detects sleep apnea using an updated optical sensor array."
+
+def _age(path, url, **delta):
+    conn = sqlite3.connect(path)
+    with conn: conn.execute("UPDATE page_text SET fetched_at = ? WHERE url = ?", ((datetime.now() - timedelta(**delta)).isoformat(), url))
+    conn.close()
+
+def test_extract_text_prefers_article_paragraphs():
+    html = (f"<html><body><nav><p>{'Menu item ' * 10}</p></nav><p>{'Sidebar text outside article ' * 3}</p>"
+            f"<article><p>Short caption</p><p>{LONG}</p><script>var x = '{'y' * 80}';</script>"
+            f"<figure><p>{'Figure caption is long enough to pass ' * 2}</p></figure><p>Second <b>paragraph</b> that is also long enough.</p></article></body></html>")
+    assert enrich.extract_text(html) == LONG + "\nSecond paragraph that is also long enough."
+    assert enrich.extract_text(html, max_chars=20) == LONG[:20]
+    # <article>이 없으면 문서 전체에서 긴 문단을 찾음
+    assert enrich.extract_text(f"<div><p>{LONG}</p></div>") == LONG
+    assert enrich.extract_text("<p>tiny</p>") == ""
+
+def test_cache_ttl_for_hits_and_failures(tmp_path):
+    path = str(tmp_path / "content.db")
+    enrich.save_cached([("https://ex.com/ok", LONG), ("https://ex.com/fail", None)], path)
+    assert enrich.load_cached(["https://ex.com/ok", "https://ex.com/fail", "https://ex.com/new"], path) == {
+        "https://ex.com/ok": LONG, "https://ex.com/fail": None}
+    _age(path, "https://ex.com/fail", hours=enrich.FAIL_TTL_HOURS + 1)   # 실패는 하루 뒤 다시 시도
+    _age(path, "https://ex.com/ok", days=enrich.CACHE_TTL_DAYS - 1)
+    assert enrich.load_cached(["https://ex.com/ok", "https://ex.com/fail"], path) == {"https://ex.com/ok": LONG}
+    _age(path, "https://ex.com/ok", days=enrich.CACHE_TTL_DAYS + 1)
+    assert enrich.load_cached(["https://ex.com/ok"], path) == {}
+    enrich.save_cached([("https://ex.com/other", LONG)], path)   # 저장할 때 만료된 행은 지움
+    conn = sqlite3.connect(path)
+    assert [r[0] for r in conn.execute("SELECT url FROM page_text ORDER BY url")] == ["https://ex.com/fail", "https://ex.com/other"]
+    conn.close()
+
+def test_enrich_uses_cache_and_fetches_missing_once(tmp_path, monkeypatch, make_item):
+    path = str(tmp_path / "content.db")
+    enrich.save_cached([("https://ex.com/a", "cached body")], path)
+    fetched = []
+    monkeypatch.setattr(enrich, "fetch_text", lambda url: fetched.append(url) or (None if "fail" in url else f"body of {url}"))
+    items = [make_item("a", link="https://ex.com/a?utm_source=rss"), make_item("b", link="https://ex.com/b"),
+             make_item("b2", link="https://ex.com/b?utm_medium=x"), make_item("f", link="https://ex.com/fail"),
+             make_item("late", link="https://ex.com/late")]
+    stats = enrich.enrich(items, limit=4, path=path)
+    assert stats == {"cached": 1, "fetched": 1, "failed": 1}
+    assert sorted(fetched) == ["https://ex.com/b", "https://ex.com/fail"]   # 같은 정규화 URL은 한 번만, limit 밖은 안 받음
+    assert items[0]["body_en"] == "cached body" and items[1]["body_en"] == items[2]["body_en"] == "body of https://ex.com/b"
+    assert "body_en" not in items[3] and "body_en" not in items[4]
+    fetched.clear()
+    assert enrich.enrich(items, limit=4, path=path) == {"cached": 2, "fetched": 0, "failed": 0} and fetched == []
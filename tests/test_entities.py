@@ -0,0 +1,58 @@
+import json
+import os
+
+import pytest
+
+import archive
+import entities
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)   # entity_aliases.json / archive/ 를 임시 폴더에
+    return tmp_path
+
+def _kw(*keyword_lists):
+    return [{"keywords": list(kws)} for kws in keyword_lists]
+
+def test_key_and_seed_canonical():
+    assert entities.key(" google-gemini ") == "GOOGLE GEMINI"
+    assert entities.key("AT&T") == "AT AND T"
+    assert entities.canonical("Google Gemini") == entities.canonical("제미나이") == "GEMINI"
+    assert entities.canonical("unknown thing") == "UNKNOWN THING"
+
+def test_learn_from_day_promotes_specific_aliases():
+    learned = entities.learn_from_day("2026-10-19", _kw(["Orion", "Meta Orion"], ["Orion"], ["Meta AI", "AI", "AI"],
+                                                        ["Google AI"], ["Apple Pencil Pro"], ["Samsung Z"], ["Z", "Z"]))
+    # ORION: 2회 이상 + 한 기업 뒤에만 붙음 → 학습 / AI: 일반어 / Z: 3글자 미만 / PENCIL PRO: 단독 언급이 없음
+    assert learned == {"META ORION": "ORION"}
+    assert entities.canonical("meta orion") == "ORION"   # 파일이 바뀌면 역색인도 다시 컴파일
+
+def test_term_after_several_companies_is_not_an_alias():
+    assert entities.learn_from_day("2026-10-19", _kw(["Copilot", "Copilot"], ["Microsoft Copilot"])) == {"MICROSOFT COPILOT": "COPILOT"}
+    # 다음 날 다른 기업 뒤에도 붙어 나오면 고유명사가 아니므로 별칭을 거둬들임
+    assert entities.learn_from_day("2026-10-20", _kw(["Samsung Copilot"])) == {}
+    assert entities.canonical("Microsoft Copilot") == "MICROSOFT COPILOT"
+
+def test_learn_from_day_counts_each_day_once():
+    entities.learn_from_day("2026-10-19", _kw(["Orion"], ["Meta Orion"]))
+    assert entities.load_state()["counts"]["ORION"] == 1
+    assert entities.learn_from_day("2026-10-19", _kw(["Orion"], ["Meta Orion"])) == {}   # 같은 날 재실행은 무시
+    assert entities.learn_from_day("2026-10-20", _kw(["Orion"])) == {"META ORION": "ORION"}
+    state = entities.load_state()
+    assert state["days"] == ["2026-10-19", "2026-10-20"] and state["counts"]["ORION"] == 2
+
+def test_learn_from_day_backfills_from_archive_once(monkeypatch):
+    archive.write_day("2026-10-17", [{"id": "a", "keywords": ["Orion", "Meta Orion"]}])
+    archive.write_day("2026-10-18", [{"id": "b", "keywords": ["Orion"]}])
+    assert entities.learn_from_day("2026-10-19", _kw(["Pixel"])) == {"META ORION": "ORION"}
+    assert entities.load_state()["days"] == ["2026-10-17", "2026-10-18", "2026-10-19"]
+    # 카운트가 저장된 뒤에는 아카이브를 다시 읽지 않음
+    monkeypatch.setattr(archive, "read_day", lambda *a, **k: pytest.fail("archive rescanned"))
+    entities.learn_from_day("2026-10-20", _kw(["Orion"]))
+
+def test_learn_from_archive_rebuilds(workdir):
+    archive.write_day("2026-10-18", [{"id": "a", "keywords": ["Orion", "Orion", "Meta Orion"]}])
+    with open("entity_aliases.json", "w", encoding="utf-8") as f:
+        json.dump({"aliases": {"META AI": "AI"}, "counts": {"AI": 99, "META AI": 1}, "days": ["2026-01-01"]}, f)
+    assert entities.learn_from_archive() == {"META ORION": "ORION"}
+    assert entities.load_state()["days"] == ["2026-10-18"] and os.path.exists("entity_aliases.json")
@@ -0,0 +1,70 @@
+from concurrent.futures import Future
+from datetime import datetime
+
+import pytest
+
+import feeds
+
+RSS = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>
+<item><title>New ring</title><link>https://ex.com/a</link><pubDate>Mon, 19 Oct 2026 08:00:00 GMT</pubDate>
+<description>&lt;p&gt;Sleep &lt;img src="https://ex.com/a.jpg"&gt; tracking&lt;/p&gt;</description></item>
+<item><title>Old news</title><link>https://ex.com/b</link><pubDate>Mon, 01 Jan 2024 08:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+class _BrokenPool:
+    """submit 자체가 실패하거나(fail_submit) 워커가 죽은 것처럼 future가 예외를 내는 풀"""
+    def __init__(self, fail_submit=False):
+        self.fail_submit, self.submitted = fail_submit, 0
+    def submit(self, fn, job):
+        if self.fail_submit: raise RuntimeError("pool is broken")
+        self.submitted += 1
+        future = Future(); future.set_exception(RuntimeError("worker died")); return future
+    def shutdown(self, **kw): pass
+
+@pytest.fixture
+def tasks(monkeypatch):
+    monkeypatch.setattr(feeds, "fetch_payload", lambda url: (RSS, "application/rss+xml"))
+    limit = datetime(2026, 10, 1)
+    return [({"id": f"c{i}", "name": f"Chan{i}", "url": f"https://ex.com/{i}.xml", "category": "Global Innovation", "tier": 1 if i == 0 else 2},
+             limit, 10) for i in range(feeds.MIN_PROCESS_FEEDS)]
+
+def _collect(monkeypatch, tasks, pool):
+    dropped = []
+    monkeypatch.setattr(feeds, "_parse_pool", lambda workers: pool)
+    monkeypatch.setattr(feeds, "_drop_pool", lambda: dropped.append(True))
+    return feeds.collect(tasks, fetch_workers=2, parse_workers=2), dropped
+
+def test_parse_feed_filters_by_date_and_extracts_fields():
+    rows = feeds.parse_feed(("Global Innovation", "Chan", RSS, "application/rss+xml", datetime(2026, 10, 1), 10))
+    assert len(rows) == 1
+    _, title, link, _, summary, thumb = rows[0]
+    assert (title, link, thumb) == ("New ring", "https://ex.com/a", "https://ex.com/a.jpg") and "<" not in summary
+    assert feeds.parse_feed(("c", "n", b"not xml", "", datetime(2026, 10, 1), 10)) == []
+
+def test_collect_falls_back_when_submit_fails(monkeypatch, tasks):
+    articles, dropped = _collect(monkeypatch, tasks, _BrokenPool(fail_submit=True))
+    assert len(articles) == len(tasks) and dropped == [True]   # 첫 실패에서 풀을 버리고 나머지는 현재 프로세스에서 파싱
+    assert {a["source"] for a in articles} == {f"Chan{i}" for i in range(len(tasks))}
+    assert [a.is_tier1 for a in articles if a["source"] == "Chan0"] == [True]
+
+def test_collect_reparses_when_worker_dies(monkeypatch, tasks):
+    pool = _BrokenPool()
+    articles, dropped = _collect(monkeypatch, tasks, pool)
+    assert pool.submitted == len(tasks) and len(dropped) == len(tasks)
+    assert sorted(a["title_en"] for a in articles) == ["New ring"] * len(tasks)
+
+def test_collect_without_pool(monkeypatch, tasks):
+    def no_pool(workers): raise OSError("no semaphores")
+    monkeypatch.setattr(feeds, "_parse_pool", no_pool)
+    assert len(feeds.collect(tasks, fetch_workers=2, parse_workers=2)) == len(tasks)
+    assert len(feeds.collect(tasks[:1], parse_workers=8)) == 1   # 피드가 적으면 풀을 쓰지 않음
+
+def test_drop_pool_discards_broken_pool(monkeypatch):
+    calls = []
+    class _Pool:
+        def shutdown(self, **kw): calls.append(kw)
+    monkeypatch.setattr(feeds, "_pool", _Pool())
+    feeds._drop_pool()
+    assert feeds._pool is None and calls == [{"wait": False, "cancel_futures": True}]
+    feeds._drop_pool()   # 이미 비어 있으면 아무것도 안 함
+    assert len(calls) == 1
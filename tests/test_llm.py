@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+import llm
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+SLIDES = [
+    {"title": "스마트링 {시장}", "bullets": ["오우라 \"1위\"", "삼성 [갤럭시 링]"]},
+    {"title": "Back\\slash } and ]", "bullets": []},
+    {"title": "중첩", "detail": {"a": [1, {"b": 2}]}},
+]
+
+def test_objects_split_across_chunks():
+    text = json.dumps({"slides": SLIDES}, ensure_ascii=False)
+    for size in (1, 3, 7, len(text)):
+        assert list(llm.iter_array_objects(_chunks(text, size))) == SLIDES
+
+def test_yields_as_soon_as_each_object_closes():
+    text = json.dumps(SLIDES, ensure_ascii=False)
+    cut = text.index("}, {") + 1
+    seen = []
+    gen = llm.iter_array_objects(iter([text[:cut], text[cut:]]), on_text=seen.append)
+    assert next(gen) == SLIDES[0] and seen == [text[:cut]]   # 두 번째 조각을 받기 전에 첫 객체가 나옴
+    assert list(gen) == SLIDES[1:] and seen[-1] == text
+
+def test_skips_broken_objects_and_truncated_tail():
+    text = '[{"a": 1}, {"a": tru}, {"a": 3}, {"a": '
+    assert list(llm.iter_array_objects(_chunks(text, 4))) == [{"a": 1}, {"a": 3}]
+
+class _Res:
+    def __init__(self, text): self.text = text
+
+class _FlakyClient:
+    """처음 fail_times번은 429를 던지고 그다음 text를 돌려주는 가짜 genai 클라이언트."""
+    def __init__(self, fail_times, text="요약", code=429):
+        self.calls = 0
+        self.fail_times, self.text, self.code = fail_times, text, code
+        self.models = self
+
+    def generate_content(self, model, contents, config):
+        self.calls += 1
+        if self.calls <= self.fail_times:
+            e = RuntimeError("rate limited")
+            e.code = self.code
+            raise e
+        return _Res(self.text)
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(llm, "text_config", lambda system_instruction=None: {"system_instruction": system_instruction})
+    monkeypatch.setattr(llm.time, "sleep", lambda s: None)
+    monkeypatch.setattr(llm, "PARSE_FAILURES", {})
+
+def test_generate_text_retries_transport_errors(no_backoff):
+    client = _FlakyClient(fail_times=2)
+    assert llm.generate_text(client, "q", "preset_analysis", "persona") == "요약" and client.calls == 3
+    assert llm.failure_summary() == {}
+
+def test_generate_text_gives_up_and_counts(no_backoff):
+    client = _FlakyClient(fail_times=99)
+    assert llm.generate_text(client, "q", "preset_analysis") is None
+    assert client.calls == llm.TRANSPORT_RETRIES + 1
+    assert llm.generate_text(_FlakyClient(fail_times=99, code=401), "q", "preset_analysis") is None   # 키 오류는 재시도 없음
+    assert llm.generate_text(_FlakyClient(fail_times=0, text=""), "q", "preset_analysis") is None
+    assert llm.failure_summary()["preset_analysis"] == {"failed": 1, "retried": 0, "gave_up": 0, "transport": 2}
@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import pytest
+
+import records
+
+CHANNEL = {"id": "verge", "name": "The Verge", "category": "Global Innovation", "tier": 1}
+TS = datetime(2026, 10, 19, 8, 30).timestamp()
+
+def _article():
+    return records.from_row(CHANNEL, ("a1", "New ring", "https://ex.com/a", TS, "sleep tracking", "https://ex.com/a.jpg"))
+
+def test_dict_style_access():
+    a = _article()
+    assert a["title_en"] == "New ring" and a["source"] == "The Verge" and a["channel_id"] == "verge" and a.is_tier1
+    assert a["date_obj"] == "2026-10-19T08:30:00" and a["date"] == "2026.10.19"
+    assert "summary_en" in a and "date" in a and "score" not in a
+    assert a.get("score") is None and a.get("score", 0) == 0
+    with pytest.raises(KeyError): a["score"]
+
+def test_setitem_fields_and_extra():
+    a = _article()
+    a["pre_score"] = 12
+    a["community_buzz"] = True
+    assert a.pre_score == 12 and a["community_buzz"] and "community_buzz" in a
+    with pytest.raises(KeyError): a["date"] = "2026.01.01"   # ts에서 계산되는 필드
+    other = _article()
+    assert other.extra is None and "community_buzz" not in other   # extra는 필요할 때만 생김
+
+def test_to_dict_and_to_dicts():
+    a = _article()
+    d = a.to_dict()
+    assert d == {"id": "a1", "title_en": "New ring", "link": "https://ex.com/a", "source": "The Verge", "category": "Global Innovation",
+                 "channel_id": "verge", "date_obj": "2026-10-19T08:30:00", "date": "2026.10.19", "summary_en": "sleep tracking",
+                 "thumbnail": "https://ex.com/a.jpg", "is_tier1": True}
+    a["pre_score"] = 5; a["extra_field"] = 1
+    assert a.to_dict()["pre_score"] == 5 and a.to_dict()["extra_field"] == 1
+    plain = {"id": "p"}
+    assert records.to_dicts([a, plain])[1] is plain
+    low = records.from_row(dict(CHANNEL, name="Blog", tier=2), ("b", "t", "l", TS, "", ""))
+    assert "is_tier1" not in low.to_dict() and "pre_score" not in low.to_dict()
+
+def test_source_and_category_are_interned():
+    a, b = _article(), records.from_row(dict(CHANNEL, name="".join(["The ", "Verge"])), ("b", "t", "l", TS, "", ""))
+    assert a.source is b.source and a.category is b.category
@@ -0,0 +1,61 @@
+import pytest
+
+import llm
+import rerank
+
+RULE = "스마트링은 헬스케어 기사에 높은 점수"
+
+@pytest.fixture(autouse=True)
+def no_learned_aliases(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+def test_rule_terms_strip_particles_stopwords_and_add_aliases():
+    assert rerank.rule_terms(RULE) == [{"스마트링", "smart ring"}, {"헬스케어"}]   # 조사 제거 + 씨앗 별칭
+    assert {"제미나이", "gemini"} in rerank.rule_terms("제미나이 관련 기사 우선")
+    assert rerank.rule_terms("점수 90점 이상") == []
+
+def test_rule_hits_needs_share_of_terms(make_item):
+    compiled = rerank.compile_rules([RULE, "Gemini on smart glasses", "점수 90점"])
+    ring = make_item("a", title_en="Oura ring", insight_title="스마트링 시장 1위", keywords=["OURA"])
+    glasses = make_item("b", title_en="Google shows smart glasses", keywords=["GEMINI"])
+    assert rerank.rule_hits(ring, compiled) == [RULE]   # 2개 중 1개 ≥ 30%
+    assert rerank.rule_hits(glasses, compiled) == ["Gemini on smart glasses"]
+    assert rerank.rule_hits(make_item("c", title_en="Quarterly earnings"), compiled) == []   # 핵심어 없는 규칙은 매칭 안 됨
+
+def test_pre_score_counts_keywords_and_tier1(make_item):
+    item = make_item("a", title_en="Apple launches AI ring", summary_en="", is_tier1=True)
+    assert rerank.pre_score(item, []) == 2 * 4 + 10   # apple, ai, ring, launch
+    assert rerank.pre_score(item, ["ring oura"]) == 2 * 5 + 10
+
+def test_rerank_applies_delta_from_scored_baseline(make_item):
+    ring = make_item("ring", score=70, title_en="Oura ring", insight_title="스마트링 시장")
+    other = make_item("other", score=60, title_en="Chip shortage")
+    comm = make_item("comm", score=50, title_en="스마트링 후기", content_type="community")
+    items = [ring, other, comm]
+    rerank.tag_rule_hits(items, [])
+    assert rerank.rerank(items, [], [RULE]) == ["ring"]
+    assert (ring["score"], ring["rule_hits"], other["score"], comm["score"]) == (80, [RULE], 60, 50)
+    # 다시 재정렬해도 중복 가산되지 않고, 규칙을 지우면 채점 당시 점수로 돌아옴
+    assert rerank.rerank(items, [RULE], [RULE]) == [] and ring["score"] == 80
+    assert rerank.rerank(items, [RULE], []) == ["ring"] and ring["score"] == 70
+
+def test_rerank_legacy_item_without_baseline(make_item):
+    item = make_item("a", score=95, insight_title="스마트링 출시")   # 이전 규칙으로 채점된 예전 기사
+    assert rerank.rerank([item], [RULE], []) == ["a"]
+    assert (item["base_score"], item["score"], item["scored_rule_hits"]) == (95, 85, [RULE])
+
+def test_final_score_is_shared(make_item):
+    assert llm.final_score(80, make_item("a", is_tier1=True)) == 85
+    assert llm.final_score(79, make_item("a", is_tier1=True)) == 79
+    assert llm.final_score(98, make_item("a", is_tier1=True, buzz_boost=4)) == 100
+    assert llm.final_score(85, make_item("a", source="The Verge")) == 90   # is_tier1이 없는 예전 기사는 매체명으로
+    assert llm.final_score(-5, make_item("a", is_tier1=False)) == 0
+
+def test_rescore_uses_final_score_and_keeps_failures(make_item, monkeypatch):
+    a = make_item("a", score=70, is_tier1=True, buzz_boost=3, rule_hits=[RULE], score_failed=True, keywords=["OLD"])
+    b = make_item("b", score=40, is_tier1=False)
+    monkeypatch.setattr(llm, "score_with_retry_queue",
+                        lambda client, prompt, items, max_workers=5: ({"a": {"score": 84, "keywords": ["NEW"]}}, ["b"]))
+    assert rerank.rescore(None, [a, b], "prompt") == 1
+    assert (a["score"], a["base_score"], a["scored_rule_hits"], a["keywords"]) == (92, 92, [RULE], ["NEW"])
+    assert "score_failed" not in a and b["score"] == 40
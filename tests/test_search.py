@@ -0,0 +1,62 @@
+import store
+
+DOCS = [
+    {"id": "ring", "title_en": "Samsung Galaxy Ring 2 adds sleep apnea detection", "insight_title": "스마트링은 수면 헬스케어로 간다",
+     "core_summary": "삼성 스마트링이 수면 무호흡 감지를 추가", "keywords": ["GALAXY RING", "스마트링"], "score": 80},
+    {"id": "oura", "title_en": "Oura ring hits 5 million users", "insight_title": "오우라, 스마트링 시장 1위 굳히기",
+     "core_summary": "구독 모델로 성장", "keywords": ["OURA", "SMART RING"], "score": 70, "cluster_id": "oura"},
+    {"id": "glass", "title_en": "Meta tests display glasses with neural wristband", "insight_title": "메타의 디스플레이 안경",
+     "core_summary": "손목 밴드로 조작하는 스마트 글래스", "keywords": ["META", "SMART GLASSES"], "score": 60},
+]
+
+def _index(days=("2026-10-18", "2026-10-19", "2026-10-19")):
+    for doc, day in zip(DOCS, days): store.index_day(day, [doc])
+
+def test_korean_particle_search(tmp_db):
+    _index()
+    # '스마트링' 검색이 조사 붙은 '스마트링은' / '스마트링이' 기사를 찾아야 함 (unicode61만으로는 못 찾음)
+    assert {r["id"] for r in store.search("스마트링")} == {"ring", "oura"}
+    assert [r["id"] for r in store.search("스마트링은")] == ["ring"]
+    assert store.search("스마트워치") == []
+
+def test_search_english_prefix_and_filters(tmp_db):
+    _index()
+    assert [r["id"] for r in store.search("glass")] == ["glass"]   # 접두 검색
+    assert {r["id"] for r in store.search("ring", since="2026-10-19")} == {"oura"}
+    assert {r["id"] for r in store.search("ring", min_score=75)} == {"ring"}
+    hits = store.search("ring")
+    assert hits[0]["rank"] <= hits[-1]["rank"] and all("day" in h for h in hits)
+
+def test_reindex_keeps_latest_day_only(tmp_db):
+    _index()
+    store.index_day("2026-10-20", [dict(DOCS[0], insight_title="갤럭시 링 후속작")])
+    assert [r["day"] for r in store.search("galaxy")] == ["2026-10-20"]
+    assert store.search("스마트링은") == []   # 예전 색인 값은 지워짐
+    store.index_day("2026-10-01", [DOCS[0]])   # 더 오래된 날짜로는 덮어쓰지 않음
+    assert [r["day"] for r in store.search("galaxy")] == ["2026-10-20"]
+
+def test_related_bm25_excludes_self_and_cluster(tmp_db):
+    _index()
+    query = {"id": "new", "title_en": "Smart ring makers race to add health features", "keywords": ["SMART RING", "스마트링"],
+             "cluster_id": "oura"}
+    ids = [r["id"] for r in store.related(query, k=5)]
+    assert ids[0] == "ring" and "oura" not in ids   # 같은 스토리 클러스터는 제외
+    assert [r["id"] for r in store.related(DOCS[0], k=5)][:1] == ["oura"]
+    assert store.related({"id": "x", "title_en": "the a of"}) == []
+
+def test_related_query_keeps_salient_terms():
+    q = store._related_query({"title_en": "The new AI ring is 2x better", "keywords": ["SMART RING", "스마트링", "로"]})
+    terms = q.split(" OR ")
+    assert any("smart" in t for t in terms) and any("스마트링" in t for t in terms)
+    assert not any(t.strip('"*').lower() in ("the", "is", "2x", "ai", "로") for t in terms)
+
+def test_related_since_limit_and_repeated_titles(tmp_db):
+    store.index_day("2026-07-01", [{"id": "old", "title_en": "Smart ring sales double", "keywords": ["SMART RING"], "score": 50}])
+    store.index_day("2026-10-19", [dict(DOCS[0]), dict(DOCS[1]),
+                                   {"id": "ring_copy", "title_en": DOCS[0]["title_en"].upper(), "keywords": ["GALAXY RING"], "score": 40}])
+    query = {"id": "q", "title_en": "Smart ring health tracking", "keywords": ["SMART RING", "GALAXY RING"]}
+    ids = [r["id"] for r in store.related(query, k=8)]
+    assert "old" in ids and len([i for i in ids if i in ("ring", "ring_copy")]) == 1   # 같은 제목은 한 번만
+    recent = store.related(query, k=8, since="2026-10-01")
+    assert "old" not in [r["id"] for r in recent] and all(r["day"] >= "2026-10-01" for r in recent)
+    assert len(store.related(query, k=1)) == 1
@@ -0,0 +1,32 @@
+import json
+import os
+from datetime import datetime
+
+import snapshot
+
+PAYLOAD = '<img src=x onerror="alert(1)">'
+
+def test_export_escapes_feed_text(tmp_path, make_item):
+    now = datetime(2026, 10, 19, 9, 0)
+    pool = [make_item(str(i), score=90 - i, title_en=f"Story {i}", insight_title=f"{PAYLOAD} 인사이트 {i}",
+                      core_summary=f"요약 </div><script>alert({i})</script>", source=f"Evil's <b>Feed</b>",
+                      link="javascript:alert(1)" if i == 0 else f"https://ex.com/{i}?a=1&b=\"2\"",
+                      keywords=["<svg onload=alert(1)>"], date="2026-10-19", date_obj="2026-10-19T08:00:00")
+            for i in range(12)]
+    assert snapshot.export(pool, out_dir=str(tmp_path), now=now) == 12
+    page = open(os.path.join(tmp_path, "index.html"), encoding="utf-8").read()
+    assert PAYLOAD not in page and "<script>alert" not in page and "<svg" not in page and "<b>Feed</b>" not in page
+    assert "&lt;img src=x onerror=&quot;alert(1)&quot;&gt;" in page
+    assert 'href="javascript:' not in page and "href='javascript:" not in page
+    assert "https://ex.com/1?a=1&amp;b=&quot;2&quot;" in page
+    data = json.load(open(os.path.join(tmp_path, "board.json"), encoding="utf-8"))
+    assert data["top_picks"][0]["title"].startswith(PAYLOAD)   # JSON은 원문 그대로 (그리는 쪽에서 이스케이프)
+
+def test_render_page_pages_the_stream(tmp_path, make_item):
+    pool = [make_item(str(i), score=60, title_en=f"Story {i}", link=f"https://ex.com/{i}", date_obj="2026-10-19T08:00:00") for i in range(40)]
+    snapshot.export(pool, out_dir=str(tmp_path), now=datetime(2026, 10, 19, 9, 0))
+    page = open(os.path.join(tmp_path, "index.html"), encoding="utf-8").read()
+    assert f"var pageSize = {snapshot.board.STREAM_PAGE_SIZE}," in page
+    data = json.load(open(os.path.join(tmp_path, "board.json"), encoding="utf-8"))
+    assert data["stream_filters"]["전체보기"] == list(range(len(data["stream"])))
+    assert page.count('<div class="card" data-i=') == len(data["stream"])   # 카드는 모두 그리고 창은 스크립트가 조절
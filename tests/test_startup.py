@@ -0,0 +1,27 @@
+import json
+import os
+import subprocess
+import sys
+
+import startup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_finish_records_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(startup, "_done", False)
+    monkeypatch.setattr(startup, "_marks", {})
+    path = str(tmp_path / "startup_log.jsonl")
+    startup.mark("imports")
+    record = startup.finish(path)
+    assert record["pid"] == os.getpid() and record["imports"] <= record["first_run"]
+    startup.mark("late")   # 첫 실행이 끝난 뒤의 rerun은 기록하지 않음
+    assert startup.finish(path) is None and "late" not in startup._marks
+    lines = open(path, encoding="utf-8").read().splitlines()
+    assert len(lines) == 1 and json.loads(lines[0]) == record
+
+def test_board_path_skips_heavy_imports():
+    # 💡 대시보드가 맨 위에서 import하는 모듈만 올렸을 때 AI/수집 스택이 딸려 오면 안 됨
+    code = ("import sys, buzz, analysis_cache, board, channels, dedup, llm, records, rerank, stats, store, thumbs, trends, prompts\n"
+            "print(','.join(m for m in ('google.genai', 'deep_translator', 'feeds', 'feedparser', 'requests', 'bs4') if m in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
@@ -0,0 +1,58 @@
+import json
+import os
+
+import pytest
+
+import store
+
+@pytest.fixture
+def pool(make_item):
+    return [
+        make_item("a", score=90, keywords=["Gemini"]),
+        make_item("b", score=70, category="China"),
+        make_item("c", score=70),
+        make_item("d", score=40, content_type="community"),
+    ]
+
+def test_replace_pool_and_indexed_queries(tmp_db, pool):
+    store.replace_pool(pool, store.POOL_DAILY)
+    assert [i["id"] for i in store.query_articles(store.POOL_DAILY)] == ["a", "b", "c", "d"]
+    assert [i["id"] for i in store.query_articles(store.POOL_DAILY, min_score=70, categories=["Global"])] == ["a", "c"]
+    assert [i["id"] for i in store.query_articles(store.POOL_DAILY, content_type="community")] == ["d"]
+    assert [i["id"] for i in store.query_articles(store.POOL_DAILY, limit=2, offset=1)] == ["b", "c"]
+    assert store.count_articles(store.POOL_DAILY, min_score=70) == 3
+    assert store.count_articles(store.POOL_MANUAL) == 0
+    assert {i["id"] for i in store.get_articles(store.POOL_DAILY, ["d", "a", "x"])} == {"a", "d"}
+
+def test_upsert_keeps_stats_in_sync(tmp_db, pool, make_item):
+    store.replace_pool(pool, store.POOL_DAILY)
+    store.upsert_articles([make_item("b", score=95, category="China"), make_item("e", score=10)], store.POOL_DAILY)
+    s = store.load_stats(store.POOL_DAILY)
+    assert s["total"] == 5 and s["score_hist"][70] == 1 and s["score_hist"][95] == 1
+    assert s["categories"] == {"Global": 4, "China": 1}
+    assert store.query_articles(store.POOL_DAILY, limit=1)[0]["id"] == "b"
+
+def test_replace_pool_clears_rescore_queue(tmp_db, pool):
+    store.replace_pool(pool, store.POOL_DAILY)
+    store.save_rescore_queue(store.POOL_DAILY, ["b", "a", "b"])
+    assert store.load_rescore_queue(store.POOL_DAILY) == ["a", "b"]
+    store.replace_pool(pool[:1], store.POOL_DAILY)
+    assert store.load_rescore_queue(store.POOL_DAILY) == []
+
+def test_sync_from_json_only_when_newer(tmp_db, pool):
+    path = os.path.join(tmp_db, "today_news.json")
+    with open(path, "w", encoding="utf-8") as f: json.dump(pool, f)
+    assert store.sync_from_json(path, store.POOL_DAILY) is True
+    assert store.sync_from_json(path, store.POOL_DAILY) is False
+    assert store.count_articles(store.POOL_DAILY) == 4
+    assert all("cluster_id" in i for i in store.query_articles(store.POOL_DAILY))   # 예전 파일은 클러스터를 채워 저장
+
+def test_stats_follow_alias_changes(tmp_db, make_item):
+    store.replace_pool([make_item("a", keywords=["Meta Orion"]), make_item("b", keywords=["Orion"])], store.POOL_DAILY)
+    assert store.load_stats(store.POOL_DAILY)["keywords"] == {"META ORION": 1, "ORION": 1}
+    # 다음 배치가 별칭을 학습 → 같은 기사를 빼고 더할 때 이전 별칭으로 센 값이 남으면 안 됨
+    with open("entity_aliases.json", "w", encoding="utf-8") as f: json.dump({"aliases": {"META ORION": "ORION"}}, f)
+    store.upsert_articles([make_item("a", keywords=[])], store.POOL_DAILY)
+    assert store.load_stats(store.POOL_DAILY)["keywords"] == {"ORION": 1}
+    store.upsert_articles([make_item("a", keywords=["Meta Orion"])], store.POOL_DAILY)
+    assert store.load_stats(store.POOL_DAILY)["keywords"] == {"ORION": 2}
@@ -0,0 +1,57 @@
+import io
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+import thumbs
+
+def test_thumb_url_fallback_order():
+    index = {"a": {"file": "abc.jpg"}}
+    item = {"id": "a", "thumb_file": "pub.jpg", "thumbnail": "https://img/a.jpg", "link": "https://ex.com/a"}
+    assert thumbs.thumb_url(item, 800, index) == thumbs.STATIC_URL + "abc.jpg"
+    assert thumbs.thumb_url(item, 800, index, base="https://cdn/") == "https://cdn/abc.jpg"
+    item["id"] = "b"
+    assert thumbs.thumb_url(item, 800, index) == thumbs.PUBLIC_BASE_URL + "pub.jpg"
+    del item["thumb_file"]
+    assert thumbs.thumb_url(item, 800, index) == "https://img/a.jpg"
+    del item["thumbnail"]
+    assert thumbs.thumb_url(item, 600, index) == "https://s.wordpress.com/mshots/v1/https://ex.com/a?w=600"
+
+def test_prune_drops_stale_entries_and_orphan_files(tmp_path):
+    for name in ("keep.jpg", "stale.jpg", "orphan.jpg", "notes.txt"): (tmp_path / name).write_bytes(b"x")
+    now = datetime(2026, 10, 19)
+    index = {"a": {"file": "keep.jpg", "used": "2026-10-18T07:00:00"}, "b": {"file": "stale.jpg", "used": "2026-10-01T07:00:00"},
+             "c": {"file": "keep.jpg", "used": "2026-10-01T07:00:00"}}
+    assert thumbs.prune(index, str(tmp_path), now=now) == 2
+    assert index == {"a": {"file": "keep.jpg", "used": "2026-10-18T07:00:00"}}
+    assert sorted(os.listdir(tmp_path)) == ["keep.jpg", "notes.txt"]
+
+def test_prefetch_updates_index_and_items(tmp_path, monkeypatch):
+    pytest.importorskip("PIL")
+    thumb_dir, index_path = str(tmp_path / "thumbs"), str(tmp_path / "thumbs" / "index.json")
+    os.makedirs(thumb_dir)
+    (tmp_path / "thumbs" / "old.jpg").write_bytes(b"x")
+    thumbs.save_index({"have": {"file": "old.jpg", "used": "2026-10-18T07:00:00"},
+                       "gone": {"file": "missing.jpg", "used": "2026-10-18T07:00:00"}}, index_path)
+    fetched = []
+    def fake_fetch(item, thumb_dir):
+        fetched.append(item["id"])
+        if item["id"] == "bad": return None
+        (tmp_path / "thumbs" / "new.jpg").write_bytes(b"y")
+        return "new.jpg"
+    monkeypatch.setattr(thumbs, "fetch_thumb", fake_fetch)
+    items = [{"id": "have"}, {"id": "gone"}, {"id": "fresh"}, {"id": "bad", "thumb_file": "stale.jpg"}]
+    assert thumbs.prefetch(items, max_workers=2, thumb_dir=thumb_dir, index_path=index_path) == (2, 1, 1)
+    assert sorted(fetched) == ["bad", "fresh", "gone"]   # 파일이 사라진 항목은 다시 받음
+    assert [i.get("thumb_file") for i in items] == ["old.jpg", "new.jpg", "new.jpg", None]
+    index = json.load(open(index_path, encoding="utf-8"))
+    assert sorted(index) == ["fresh", "gone", "have"] and all(e["used"] > "2026-10-18T07:00:00" for e in index.values())
+
+def test_resize_fits_card_size():
+    Image = pytest.importorskip("PIL.Image")
+    buf = io.BytesIO()
+    Image.new("RGBA", (1600, 900), (255, 0, 0, 128)).save(buf, "PNG")
+    out = Image.open(io.BytesIO(thumbs.resize(buf.getvalue())))
+    assert out.format == "JPEG" and out.size == (thumbs.THUMB_WIDTH, 450)
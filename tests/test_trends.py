@@ -0,0 +1,38 @@
+import trends
+
+def _day(keywords_per_item, score=60):
+    return [{"id": str(i), "keywords": kws, "score": score, "source": f"S{i}"} for i, kws in enumerate(keywords_per_item)]
+
+def _save_history(days):
+    for i in range(days):
+        trends.save_rollup(f"2026-10-{10 + i:02d}", _day([["Gemini"], ["Vision Pro"], ["Vision Pro"]]))
+
+def test_rollup_merges_aliases(tmp_db):   # 작업 폴더의 학습 별칭 파일 영향 없이
+    stats, totals = trends.rollup_day(_day([["Google Gemini", "제미나이"], ["Gemini"]], score=50) +
+                                      [{"id": "x", "buzz_words": ["GEMINI"], "score": 80, "source": "S0"}])
+    assert stats["GEMINI"]["mentions"] == 3 and stats["GEMINI"]["buzz_mentions"] == 1
+    assert stats["GEMINI"]["sources"] == {"S0", "S1"}
+    assert totals == {"articles": 3, "avg_score": 60.0, "source_count": 2}
+
+def test_rising_keywords_zscore(tmp_db):
+    _save_history(5)
+    today = [["Orion"], ["Orion"], ["Meta Orion", "Gemini"], ["Orion", "Gemini"], ["Vision Pro"], ["Vision Pro"]]
+    trends.save_rollup("2026-10-19", _day(today))
+    rising = trends.rising_keywords()
+    # ORION: 과거 0건 → 표준편차 하한 1.0으로 z = 3 (3건, META ORION은 별칭이 없어 따로 집계)
+    # GEMINI: 평소 1건 → 2건은 z = 1, VISION PRO: 평소대로 2건 → z = 0
+    assert [r["keyword"] for r in rising] == ["ORION"]
+    assert rising[0]["z"] == 3.0 and rising[0]["baseline"] == 0 and rising[0]["source_count"] == 3
+    assert trends.rising_keywords(min_z=1.0)[1]["keyword"] == "GEMINI"
+
+def test_rising_needs_history(tmp_db):
+    _save_history(2)
+    trends.save_rollup("2026-10-19", _day([["Orion"]] * 5))
+    assert trends.rising_keywords() == []
+
+def test_rollup_is_idempotent_and_series(tmp_db):
+    _save_history(3)
+    trends.save_rollup("2026-10-12", _day([["Gemini"], ["Gemini"]]))   # 같은 날 다시 집계하면 교체
+    series = trends.keyword_series(["Google Gemini"])
+    assert [(d, m) for d, m, _ in series["GEMINI"]] == [("2026-10-10", 1), ("2026-10-11", 1), ("2026-10-12", 2)]
+    assert trends.latest_day() == "2026-10-12" and trends.top_keywords()[0] == "GEMINI"
@@ -0,0 +1,168 @@
+import hashlib
+import io
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import dedup
+
+# ==========================================
+# 🖼️ [썸네일 캐시] 게시 기사 썸네일을 미리 받아 카드 크기로 줄여 로컬에서 서빙
+# ==========================================
+# 💡 카드 하나에 1400px 원본을 핫링크하고, 썸네일이 없으면 mshots 스크린샷을 실시간으로 부르느라
+#    보드 로딩 시간 대부분이 외부 이미지 요청에 묶여 있었습니다.
+#    모닝 배치가 게시 기사 썸네일을 받아 카드 크기 JPEG로 줄이고, 내용 해시 파일명으로 static/thumbs/에 저장합니다.
+#    (같은 이미지를 쓰는 기사끼리는 파일 1개를 공유) 게시 기사에는 파일명(thumb_file)만 남깁니다.
+#    💡 이미지 파일은 main 히스토리에 넣지 않습니다 (매일 100장+ JPEG가 쌓이면 아카이브 압축으로 줄인 저장소가 다시 커짐).
+#       CI에서는 static/thumbs/를 actions/cache로 실행 간 유지하고, 현재 파일만 히스토리 없는 'thumbs' 브랜치에
+#       강제 푸시해 PUBLIC_BASE_URL로 서빙합니다. 이 머신에 캐시가 있으면(로컬 배치/개발) Streamlit 정적 서빙으로 읽고,
+#       외부 이미지(원본 → mshots/pollinations)는 둘 다 없을 때만 씁니다.
+THUMB_DIR = os.path.join("static", "thumbs")
+INDEX_FILE = os.path.join(THUMB_DIR, "index.json")
+STATIC_URL = "app/static/thumbs/"   # .streamlit/config.toml 의 enableStaticServing 경로
+PUBLIC_BASE_URL = os.environ.get("SENSING_THUMB_BASE_URL", "https://raw.githubusercontent.com/jashnet/it-sensing-board/thumbs/")
+THUMB_WIDTH = 800                   # 히어로 카드(800) 기준, 스트림 카드(600)도 같은 파일 사용
+THUMB_MAX_HEIGHT = 800
+JPEG_QUALITY = 80
+KEEP_DAYS = 7                       # 이 기간 동안 게시되지 않은 기사의 썸네일은 정리
+MAX_SOURCE_BYTES = 8_000_000
+MAX_PAGE_BYTES = 300_000            # og:image 찾을 때 읽는 페이지 앞부분
+FETCH_TIMEOUT = 10
+MAX_WORKERS = 8
+USER_AGENT = "Mozilla/5.0 (compatible; NGEPT-Sensing/1.0; +https://github.com/jashnet/it-sensing-board)"
+_OG_RE = re.compile(r'<meta[^>]+(?:property|name)=["\'](?:og:image|twitter:image)["\'][^>]*>', re.I)
+_CONTENT_RE = re.compile(r'content=["\']([^"\']+)["\']', re.I)
+
+# ==========================================
+# 📇 [색인] {기사 id: {"file": 파일명, "used": 마지막 게시 시각}}
+# ==========================================
+_INDEX = None
+_INDEX_MTIME = None
+
+def load_index(path=INDEX_FILE):
+    if not os.path.exists(path): return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f: return json.load(f)
+    except: return {}
+
+def save_index(index, path=INDEX_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f: json.dump(index, f, ensure_ascii=False, sort_keys=True)
+
+def get_index(path=INDEX_FILE):
+    """대시보드용: 색인 파일이 바뀔 때만 다시 읽습니다."""
+    global _INDEX, _INDEX_MTIME
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    if _INDEX is None or mtime != _INDEX_MTIME:
+        _INDEX, _INDEX_MTIME = load_index(path), mtime
+    return _INDEX
+
+def local_file(article_id, index=None):
+    entry = (index if index is not None else get_index()).get(article_id)
+    return entry["file"] if entry else None
+
+def thumb_url(item, width, index=None, base=None):
+    """로컬 썸네일 → 게시된 썸네일(thumbs 브랜치) → 피드 원본 썸네일 → mshots 스크린샷 순으로 카드 이미지 주소를 고릅니다.
+    base: 썸네일 파일 주소 접두어를 고정할 때 (정적 스냅샷 페이지는 PUBLIC_BASE_URL을 넘김)"""
+    name = local_file(item.get('id'), index)
+    if name: return (base or STATIC_URL) + name
+    if item.get('thumb_file'): return (base or PUBLIC_BASE_URL) + item['thumb_file']
+    if item.get('thumbnail'): return item['thumbnail']
+    return f"https://s.wordpress.com/mshots/v1/{item['link']}?w={width}"
+
+def url_for_link(link, index=None):
+    """기사 URL(슬라이드 참고 링크 등) → 로컬 썸네일 주소 또는 None."""
+    name = local_file(dedup.article_id(link), index) if link else None
+    return STATIC_URL + name if name else None
+
+# ==========================================
+# ⬇️ [프리페치] 받아서 줄이고 내용 해시로 저장
+# ==========================================
+def _get(url, limit):
+    import requests   # 배치에서만 필요 (대시보드는 색인만 읽음)
+    with requests.get(url, timeout=FETCH_TIMEOUT, headers={"User-Agent": USER_AGENT}, stream=True) as res:
+        res.raise_for_status()
+        body = b""
+        for chunk in res.iter_content(64 * 1024):
+            body += chunk
+            if len(body) >= limit: break
+        return body, res.headers.get("content-type", "")
+
+def og_image(link):
+    """피드에 썸네일이 없는 기사: 페이지 앞부분의 og:image / twitter:image 주소."""
+    try:
+        body, content_type = _get(link, MAX_PAGE_BYTES)
+        if "html" not in content_type: return None
+        for tag in _OG_RE.findall(body.decode("utf-8", errors="replace")):
+            m = _CONTENT_RE.search(tag)
+            if m and m.group(1).startswith("http"): return m.group(1).replace("&amp;", "&")
+    except: pass
+    return None
+
+def resize(data):
+    """원본 이미지 바이트 → 카드 크기 JPEG 바이트."""
+    from PIL import Image
+    img = Image.open(io.BytesIO(data))
+    img.draft("RGB", (THUMB_WIDTH, THUMB_MAX_HEIGHT))   # JPEG는 디코딩 단계에서 미리 축소
+    img = img.convert("RGB")
+    img.thumbnail((THUMB_WIDTH, THUMB_MAX_HEIGHT))
+    out = io.BytesIO()
+    img.save(out, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return out.getvalue()
+
+def fetch_thumb(item, thumb_dir=THUMB_DIR):
+    """기사 1건 → 저장된 파일명 또는 None."""
+    src = item.get('thumbnail') or og_image(item['link'])
+    if not src: return None
+    try:
+        data, content_type = _get(src, MAX_SOURCE_BYTES)
+        if content_type and not content_type.startswith("image"): return None
+        thumb = resize(data)
+    except: return None
+    name = hashlib.sha1(thumb).hexdigest()[:20] + ".jpg"
+    path = os.path.join(thumb_dir, name)
+    if not os.path.exists(path):
+        with open(path + ".tmp", "wb") as f: f.write(thumb)
+        os.replace(path + ".tmp", path)
+    return name
+
+def prune(index, thumb_dir=THUMB_DIR, keep_days=KEEP_DAYS, now=None):
+    """오래 게시되지 않은 색인 항목과, 어떤 항목도 가리키지 않는 파일을 지웁니다."""
+    cutoff = ((now or datetime.now()) - timedelta(days=keep_days)).isoformat()
+    for aid in [aid for aid, e in index.items() if e.get("used", "") < cutoff]: del index[aid]
+    used_files = {e["file"] for e in index.values()}
+    removed = 0
+    for name in os.listdir(thumb_dir):
+        if name.endswith(".jpg") and name not in used_files:
+            os.remove(os.path.join(thumb_dir, name))
+            removed += 1
+    return removed
+
+def prefetch(items, max_workers=MAX_WORKERS, thumb_dir=THUMB_DIR, index_path=INDEX_FILE):
+    """게시 기사 썸네일을 로컬 캐시에 채우고 색인을 갱신합니다. 반환: (신규, 재사용, 실패)"""
+    try: import PIL  # noqa: F401
+    except ImportError:
+        print("⚠️ Pillow가 없어 썸네일 사전 다운로드를 건너뜁니다. (pip install Pillow)")
+        return 0, 0, 0
+    os.makedirs(thumb_dir, exist_ok=True)
+    now = datetime.now()
+    index = load_index(index_path)
+    todo = [i for i in items if i['id'] not in index or not os.path.exists(os.path.join(thumb_dir, index[i['id']]["file"]))]
+    reused = len(items) - len(todo)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        names = list(executor.map(lambda i: fetch_thumb(i, thumb_dir), todo))
+    for item, name in zip(todo, names):
+        if name: index[item['id']] = {"file": name}
+        else: index.pop(item['id'], None)   # 파일이 사라졌는데 다시 받지도 못한 항목
+    for item in items:
+        if item['id'] in index:
+            index[item['id']]["used"] = now.isoformat()
+            item['thumb_file'] = index[item['id']]["file"]   # 대시보드/스냅샷은 이 파일명을 게시 주소로 읽음
+        else: item.pop('thumb_file', None)
+    removed = prune(index, thumb_dir, now=now)
+    save_index(index, index_path)
+    new, failed = sum(1 for n in names if n), sum(1 for n in names if not n)
+    print(f"🖼️ 썸네일 캐시: 신규 {new}건 / 재사용 {reused}건 / 실패 {failed}건 / 정리 {removed}개 파일")
+    return new, reused, failed
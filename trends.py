@@ -0,0 +1,164 @@
+import math
+
+import archive
+import entities
+import store
+
+# ==========================================
+# 📈 [키워드 트렌드] 일별 롤업 시계열 & 급상승 탐지
+# ==========================================
+# 💡 기사마다 뽑힌 keywords / buzz_words를 날짜별로 집계해 두고,
+#    대시보드 차트와 급상승 탐지는 기사를 다시 훑지 않고 이 롤업만 읽습니다.
+TREND_WINDOW = 14           # 급상승 판단용 과거 비교 구간(일)
+RISING_MIN_Z = 2.0
+RISING_MIN_MENTIONS = 2
+MIN_HISTORY_DAYS = 3        # 비교할 과거가 이보다 짧으면 급상승 판단을 하지 않음
+
+TRENDS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS keyword_daily (
+    day TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    mentions INTEGER NOT NULL,
+    buzz_mentions INTEGER NOT NULL,
+    avg_score REAL NOT NULL,
+    source_count INTEGER NOT NULL,
+    PRIMARY KEY (day, keyword)
+);
+CREATE INDEX IF NOT EXISTS idx_keyword_daily_keyword ON keyword_daily (keyword, day);
+CREATE TABLE IF NOT EXISTS day_totals (
+    day TEXT PRIMARY KEY,
+    articles INTEGER NOT NULL,
+    avg_score REAL NOT NULL,
+    source_count INTEGER NOT NULL
+);
+"""
+
+_initialized = False
+
+def _connect():
+    global _initialized
+    conn = store.connect()
+    if not _initialized:
+        conn.executescript(TRENDS_SCHEMA)
+        _initialized = True
+    return conn
+
+def normalize_keyword(k):
+    # 'GOOGLE GEMINI' / '제미나이' 등 별칭은 대표 엔티티로 합쳐서 집계
+    return entities.canonical(k)
+
+def rollup_day(items):
+    """하루치 기사 → ({키워드: 집계}, 일자 합계)."""
+    stats = {}
+    for item in items:
+        kws = {normalize_keyword(k) for k in item.get('keywords', []) or [] if str(k).strip()}
+        buzz = {normalize_keyword(k) for k in item.get('buzz_words', []) or [] if str(k).strip()}
+        for k in kws | buzz:
+            s = stats.setdefault(k, {"mentions": 0, "buzz_mentions": 0, "score_sum": 0, "sources": set()})
+            s["mentions"] += 1
+            if k in buzz: s["buzz_mentions"] += 1
+            s["score_sum"] += item.get('score', 0)
+            s["sources"].add(item.get('source', ''))
+    scores = [item.get('score', 0) for item in items]
+    totals = {
+        "articles": len(items),
+        "avg_score": sum(scores) / len(scores) if scores else 0.0,
+        "source_count": len({item.get('source', '') for item in items}),
+    }
+    return stats, totals
+
+def save_rollup(day, items, conn=None):
+    own = conn is None
+    conn = conn or _connect()
+    try:
+        stats, totals = rollup_day(items)
+        with conn:
+            conn.execute("DELETE FROM keyword_daily WHERE day = ?", (day,))
+            conn.executemany(
+                "INSERT INTO keyword_daily (day, keyword, mentions, buzz_mentions, avg_score, source_count) VALUES (?, ?, ?, ?, ?, ?)",
+                [(day, k, s["mentions"], s["buzz_mentions"], s["score_sum"] / s["mentions"], len(s["sources"])) for k, s in stats.items()],
+            )
+            conn.execute("INSERT OR REPLACE INTO day_totals (day, articles, avg_score, source_count) VALUES (?, ?, ?, ?)",
+                         (day, totals["articles"], totals["avg_score"], totals["source_count"]))
+    finally:
+        if own: conn.close()
+
+def sync_rollups_from_archive():
+    """롤업이 없는 아카이브 날짜만 집계합니다 (하루 1회 수준의 증분 작업)."""
+    conn = _connect()
+    try:
+        done = {r[0] for r in conn.execute("SELECT day FROM day_totals")}
+        new_days = [d for d in archive.list_days() if d not in done]
+        for day in new_days: save_rollup(day, list(archive.read_day(day)), conn)
+        return new_days
+    finally:
+        conn.close()
+
+def latest_day():
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT MAX(day) FROM day_totals").fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+def keyword_series(keywords, since=None):
+    """{키워드: [(day, mentions, avg_score), ...]} - 차트용 시계열."""
+    if not keywords: return {}
+    keywords = [normalize_keyword(k) for k in keywords]
+    sql = f"SELECT keyword, day, mentions, avg_score FROM keyword_daily WHERE keyword IN ({','.join('?' * len(keywords))})"
+    params = list(keywords)
+    if since:
+        sql += " AND day >= ?"
+        params.append(since)
+    conn = _connect()
+    try:
+        series = {k: [] for k in keywords}
+        for k, day, mentions, avg_score in conn.execute(sql + " ORDER BY day", params):
+            series[k].append((day, mentions, avg_score))
+        return series
+    finally:
+        conn.close()
+
+def rising_keywords(day=None, window=TREND_WINDOW, min_z=RISING_MIN_Z, min_mentions=RISING_MIN_MENTIONS, limit=15):
+    """당일 언급량을 과거 window일 평균/표준편차와 비교한 z-score 순 급상승 키워드.
+
+    과거에 없던 날은 0건으로 보고, 표준편차는 최소 1.0으로 둬서 신규 키워드가 과하게 튀지 않게 합니다.
+    """
+    conn = _connect()
+    try:
+        day = day or conn.execute("SELECT MAX(day) FROM day_totals").fetchone()[0]
+        if not day: return []
+        past_days = [r[0] for r in conn.execute("SELECT day FROM day_totals WHERE day < ? ORDER BY day DESC LIMIT ?", (day, window))]
+        today = conn.execute("SELECT keyword, mentions, avg_score, source_count FROM keyword_daily WHERE day = ? AND mentions >= ?", (day, min_mentions)).fetchall()
+        history = {}
+        if past_days:
+            rows = conn.execute(
+                f"SELECT keyword, mentions FROM keyword_daily WHERE day IN ({','.join('?' * len(past_days))})", past_days
+            )
+            for k, m in rows: history.setdefault(k, []).append(m)
+    finally:
+        conn.close()
+
+    n = len(past_days)
+    if n < MIN_HISTORY_DAYS: return []
+    rising = []
+    for k, mentions, avg_score, source_count in today:
+        hist = history.get(k, []) + [0] * (n - len(history.get(k, [])))
+        mean = sum(hist) / n
+        std = math.sqrt(sum((h - mean) ** 2 for h in hist) / n)
+        z = (mentions - mean) / max(std, 1.0)
+        if z >= min_z:
+            rising.append({"keyword": k, "mentions": mentions, "baseline": round(mean, 2), "z": round(z, 2),
+                           "avg_score": round(avg_score, 1), "source_count": source_count})
+    rising.sort(key=lambda r: (-r["z"], -r["mentions"], r["keyword"]))
+    return rising[:limit]
+
+def top_keywords(day=None, limit=15):
+    conn = _connect()
+    try:
+        day = day or conn.execute("SELECT MAX(day) FROM day_totals").fetchone()[0]
+        if not day: return []
+        return [r[0] for r in conn.execute("SELECT keyword FROM keyword_daily WHERE day = ? ORDER BY mentions DESC, avg_score DESC, keyword LIMIT ?", (day, limit))]
+    finally:
+        conn.close()